@@ -0,0 +1,74 @@
+"""Metin analizi LRU önbelleğinin önbelleksiz analizle eşitliği"""
+
+import pytest
+
+pytest.importorskip("speech_recognition")
+
+import voice
+
+TEXTS = [
+    "bugün çok mutluyum, harika bir gün!",
+    "  bugün çok mutluyum, harika bir gün!  ",
+    "Üzgünüm ama bu hiç iyi değil...",
+    "son derece mutlu",
+    "son  derece mutlu",
+    "hayal kırıklığı yaşadım",
+    "bugün çok mutluyum, harika bir gün!",
+    "KIZGIN mıyım? Evet değil mi",
+    "Üzgünüm ama bu hiç iyi değil...",
+    "",
+    "   ",
+]
+
+def analysis_fields(analysis):
+    return (analysis.features.text, analysis.features.words, analysis.linguistic_features,
+            analysis.semantic_scores, analysis.emotion_scores, analysis.topics)
+
+def state_fields(state):
+    return (state.primary_emotion, state.secondary_emotions, state.intensity,
+            state.confidence, state.triggers, state.context_score)
+
+def test_cached_analysis_matches_uncached():
+    cached = voice.Level5EmotionAnalyzer()
+    uncached = voice.Level5EmotionAnalyzer(analysis_cache_size=0)
+    for text in TEXTS:
+        assert analysis_fields(cached.analyze_text(text)) == analysis_fields(uncached.analyze_text(text))
+    for text in TEXTS:
+        assert state_fields(cached.analyze_with_context(text)) == \
+            state_fields(uncached.analyze_with_context(text))
+
+def test_key_collapses_only_outer_whitespace():
+    analyzer = voice.Level5EmotionAnalyzer()
+    # Çok kelimeli ipuçları iç boşluğa duyarlı: bu iki metin aynı anahtarı paylaşamaz
+    assert analyzer.analyze_text("son derece mutlu").linguistic_features["intensifiers"] == ["son derece"]
+    assert analyzer.analyze_text("son  derece mutlu").linguistic_features["intensifiers"] == []
+    analyzer.analyze_text("  son derece mutlu\n")
+    stats = analyzer.analysis_cache_stats()
+    assert (stats["hits"], stats["misses"], stats["size"]) == (1, 2, 2)
+
+def test_stats_count_hits_and_misses():
+    analyzer = voice.Level5EmotionAnalyzer()
+    for text in TEXTS:
+        analyzer.analyze_text(text)
+    unique = len({text.strip() for text in TEXTS})
+    stats = analyzer.analysis_cache_stats()
+    assert stats["misses"] == unique
+    assert stats["hits"] == len(TEXTS) - unique
+    assert stats["size"] == unique
+    assert stats["hit_ratio"] == pytest.approx((len(TEXTS) - unique) / len(TEXTS), abs=1e-4)
+
+def test_lru_eviction_counts_misses():
+    analyzer = voice.Level5EmotionAnalyzer(analysis_cache_size=2)
+    for text in ["a", "b", "a", "c", "b", "a"]:
+        analyzer.analyze_text(text)
+    # a, b kaçırılır; a isabet; sonra c b'yi, b a'yı, a da c'yi çıkarır
+    stats = analyzer.analysis_cache_stats()
+    assert (stats["hits"], stats["misses"], stats["size"]) == (1, 5, 2)
+    assert list(analyzer.analysis_cache) == ["b", "a"]
+
+def test_disabled_cache_counts_every_lookup_as_miss():
+    analyzer = voice.Level5EmotionAnalyzer(analysis_cache_size=0)
+    for text in ["a", "a", "a"]:
+        analyzer.analyze_text(text)
+    stats = analyzer.analysis_cache_stats()
+    assert (stats["hits"], stats["misses"], stats["size"]) == (0, 3, 0)
@@ -0,0 +1,83 @@
+"""WavFrameSource -> AudioCaptureStream bölütleme ve yankı süzme"""
+
+import math
+import wave
+from array import array
+from itertools import count
+
+import pytest
+
+sr = pytest.importorskip("speech_recognition")
+
+import voice
+
+RATE = 16000
+CHUNK = 1024
+CALIBRATION_FRAMES = 8  # calibration_duration=0.5 -> 7 çerçeve, bir fazlası güvenli
+
+def tone(frames, amplitude, frequency=440.0):
+    """frames çerçevelik sinüs (amplitude 0 ise sessizlik)"""
+    total = frames * CHUNK
+    return [amplitude * math.sin(2 * math.pi * frequency * i / RATE) for i in range(total)]
+
+def mix(*tracks):
+    return [sum(samples) for samples in zip(*tracks)]
+
+def write_wav(path, samples):
+    with wave.open(str(path), "wb") as wav:
+        wav.setnchannels(1)
+        wav.setsampwidth(2)
+        wav.setframerate(RATE)
+        wav.writeframes(array("h", (int(sample) for sample in samples)).tobytes())
+    return str(path)
+
+def capture(path, echo_window=None):
+    stream = voice.AudioCaptureStream(
+        sr.Recognizer(), voice.WavFrameSource(path, chunk=CHUNK), echo_window=echo_window
+    ).start()
+    utterances = []
+    try:
+        while True:
+            utterance = stream.next_utterance(timeout=5)
+            if utterance is None:
+                break
+            utterances.append(utterance)
+        assert stream.finished
+    finally:
+        stream.close()
+    return stream, utterances
+
+def test_two_bursts_make_two_utterances(tmp_path):
+    samples = tone(CALIBRATION_FRAMES + 10, 0) + tone(10, 8000) + tone(25, 0) + tone(10, 8000) + tone(25, 0)
+    stream, utterances = capture(write_wav(tmp_path / "two.wav", samples))
+    assert len(utterances) == 2
+    for utterance in utterances:
+        assert utterance.sample_rate == RATE
+        # Her ifade en az patlamanın kendisini içerir
+        assert len(utterance.frame_data) >= 10 * CHUNK * 2
+
+def playback_window(frames):
+    """Halkaya yazılan ilk frames çerçeve boyunca JARVIS konuşuyor
+
+    Kalibrasyonun son sessiz çerçeveleri de halkaya girer; pencere yankıyı
+    birkaç çerçeve aşacak kadar geniş tutulur.
+    """
+    calls = count()
+    return lambda: next(calls) < frames
+
+def test_echo_during_playback_is_dropped_but_later_speech_is_kept(tmp_path):
+    samples = (tone(CALIBRATION_FRAMES, 0) + tone(30, 3000) + tone(25, 0)
+               + tone(10, 3000, 300.0) + tone(25, 0))
+    stream, utterances = capture(write_wav(tmp_path / "echo.wav", samples),
+                                 echo_window=playback_window(35))
+    assert stream.echoes_dropped == 1
+    assert len(utterances) == 1
+
+def test_user_speaking_over_playback_is_kept(tmp_path):
+    echo = tone(30, 3000)
+    speech = tone(10, 0) + tone(10, 16000, 300.0) + tone(10, 0)
+    samples = tone(CALIBRATION_FRAMES, 0) + mix(echo, speech) + tone(25, 0)
+    stream, utterances = capture(write_wav(tmp_path / "barge.wav", samples),
+                                 echo_window=playback_window(35))
+    assert stream.echoes_dropped == 0
+    assert len(utterances) == 1
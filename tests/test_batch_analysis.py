@@ -0,0 +1,54 @@
+"""analyze_many ve akış hattının sıralı analyze_with_context döngüsüyle eşitliği"""
+
+import pytest
+
+pytest.importorskip("speech_recognition")
+
+import voice
+
+TEXTS = [
+    "bugün çok mutluyum, harika bir gün!",
+    "Üzgünüm ama bu hiç iyi değil...",
+    "çok üzgünüm, kalbim kırık",
+    "  bugün çok mutluyum, harika bir gün!  ",
+    "sinirliyim, hiçbir şey yolunda değil",
+    "teşekkür ederim, çok sağ ol",
+    "",
+    "korkuyorum, yalnızım",
+    "çok üzgünüm, kalbim kırık",
+] * 3
+
+def state_fields(state):
+    return (state.primary_emotion, list(state.secondary_emotions), round(state.intensity, 9),
+            round(state.confidence, 9), list(state.triggers), dict(state.context_score))
+
+def sequential(texts):
+    analyzer = voice.Level5EmotionAnalyzer()
+    states = [state_fields(analyzer.analyze_with_context(text)) for text in texts]
+    return analyzer, states
+
+def test_analyze_many_with_state_matches_sequential_loop():
+    expected_analyzer, expected = sequential(TEXTS)
+    analyzer = voice.Level5EmotionAnalyzer()
+    batch = analyzer.analyze_many(TEXTS, update_state=True)
+    assert [state_fields(batch.row(index)) for index in range(len(batch))] == expected
+    assert [state_fields(state) for state in analyzer.emotion_history] == \
+        [state_fields(state) for state in expected_analyzer.emotion_history]
+
+def test_analyze_many_without_state_leaves_analyzer_unchanged():
+    analyzer = voice.Level5EmotionAnalyzer()
+    batch = analyzer.analyze_many(TEXTS)
+    assert len(batch) == len(TEXTS)
+    assert len(analyzer.emotion_history) == 0
+    assert len(analyzer.conversation_memory) == 0
+
+def test_stream_analyses_matches_sequential_loop():
+    expected_analyzer, expected = sequential(TEXTS)
+    analyzer = voice.Level5EmotionAnalyzer()
+    streamed = list(analyzer.stream_analyses(iter(TEXTS)))
+    assert [text for text, _, _ in streamed] == TEXTS
+    assert [state_fields(state) for _, state, _ in streamed] == expected
+    assert [entry["topics"] for entry in analyzer.conversation_memory] == \
+        [entry["topics"] for entry in expected_analyzer.conversation_memory]
+    # Tekrarlanan ifadeler önbellekten gelir
+    assert analyzer.analysis_cache_stats()["hits"] == len(TEXTS) - len({text.strip() for text in TEXTS})
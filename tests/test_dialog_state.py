@@ -0,0 +1,117 @@
+"""DialogStateMachine: zaman aşımı, yanıt penceresi ve soru bitince kurulma"""
+
+from concurrent.futures import Future
+
+import pytest
+
+pytest.importorskip("speech_recognition")
+
+import voice
+
+DialogState = voice.DialogState
+
+class FakeClock:
+    def __init__(self):
+        self.now = 1000.0
+
+    def __call__(self):
+        return self.now
+
+@pytest.fixture
+def clock():
+    return FakeClock()
+
+@pytest.fixture
+def dialog(clock):
+    return voice.DialogStateMachine(timeout=30.0, clock=clock)
+
+@pytest.fixture
+def registry(dialog):
+    calls = []
+    registry = voice.CommandRegistry(dialog=dialog)
+    registry.add("time", ["saat kaç"], lambda command: calls.append(("time", command)))
+    registry.add("search_answer", [], lambda command: calls.append(("search", command)),
+                 dialog=DialogState.SEARCH)
+    registry.add("fallback", [], lambda command: calls.append(("fallback", command)))
+    registry.calls = calls
+    return registry
+
+def test_question_expires_after_timeout(dialog, clock):
+    dialog.expect(DialogState.SEARCH)
+    clock.now += 29.9
+    assert dialog.state is DialogState.SEARCH
+    clock.now += 0.1
+    assert dialog.state is DialogState.IDLE
+
+def test_per_question_timeout(dialog, clock):
+    dialog.expect(DialogState.SLEEP_REPLY, timeout=5.0)
+    clock.now += 5.0
+    assert not dialog.is_waiting(DialogState.SLEEP_REPLY)
+
+def test_answer_within_window_goes_to_the_question(registry, dialog, clock):
+    dialog.expect(DialogState.SEARCH)
+    clock.now += 10
+    assert registry.dispatch("python dekoratörler")
+    assert registry.calls == [("search", "python dekoratörler")]
+    # Yanıt alındı: aynı metin artık geri dönüşe gider
+    assert dialog.state is DialogState.IDLE
+    registry.dispatch("python dekoratörler")
+    assert registry.calls[-1] == ("fallback", "python dekoratörler")
+
+def test_expired_question_does_not_swallow_commands(registry, dialog, clock):
+    dialog.expect(DialogState.SEARCH)
+    clock.now += 31
+    registry.dispatch("python dekoratörler")
+    registry.dispatch("saat kaç")
+    assert registry.calls == [("fallback", "python dekoratörler"), ("time", "saat kaç")]
+
+def test_no_question_falls_back(registry):
+    registry.dispatch("rastgele bir cümle")
+    assert registry.calls == [("fallback", "rastgele bir cümle")]
+
+def test_registry_without_dialog_machine():
+    calls = []
+    registry = voice.CommandRegistry()
+    registry.add("search_answer", [], lambda command: calls.append("search"), dialog=DialogState.SEARCH)
+    registry.add("fallback", [], lambda command: calls.append("fallback"))
+    registry.dispatch("python")
+    assert calls == ["fallback"]
+
+def test_expect_after_arms_when_prompt_finishes(dialog, clock):
+    spoken = Future()
+    dialog.expect_after(spoken, DialogState.PLATFORM)
+    # Soru okunurken süre işlemez ve yanıt beklenmez
+    clock.now += 100
+    assert dialog.state is DialogState.IDLE
+
+    spoken.set_result(True)
+    assert dialog.state is DialogState.PLATFORM
+    clock.now += 29
+    assert dialog.state is DialogState.PLATFORM
+    clock.now += 1
+    assert dialog.state is DialogState.IDLE
+
+def test_expect_after_arms_when_prompt_is_interrupted(dialog):
+    spoken = Future()
+    dialog.expect_after(spoken, DialogState.VIDEO)
+    spoken.cancel()
+    assert dialog.state is DialogState.VIDEO
+
+def test_expect_after_replaces_pending_question(dialog):
+    dialog.expect(DialogState.SEARCH)
+    spoken = Future()
+    dialog.expect_after(spoken, DialogState.SONG)
+    assert dialog.state is DialogState.IDLE
+
+def test_superseded_or_cleared_prompt_never_arms(dialog):
+    first = Future()
+    dialog.expect_after(first, DialogState.PLATFORM)
+    dialog.expect(DialogState.SPELL)
+    first.set_result(True)
+    assert dialog.state is DialogState.SPELL
+
+    second = Future()
+    dialog.expect_after(second, DialogState.YOUTUBER)
+    dialog.clear()
+    second.set_result(True)
+    assert dialog.state is DialogState.IDLE
@@ -0,0 +1,37 @@
+"""EmotionHistory halka tamponunun deque(maxlen=...) ile uyumu"""
+
+import pytest
+
+pytest.importorskip("speech_recognition")
+
+import voice
+
+def test_zero_capacity_keeps_nothing():
+    analyzer = voice.Level5EmotionAnalyzer(history_limit=0)
+    for text in ["çok mutluyum", "üzgünüm", "sinirliyim"]:
+        analyzer.analyze_with_context(text)
+    assert len(analyzer.emotion_history) == 0
+    assert list(analyzer.emotion_history) == []
+    assert analyzer.emotion_history.recent_primaries(3) == []
+    with pytest.raises(IndexError):
+        analyzer.emotion_history[-1]
+
+def test_negative_capacity_is_rejected():
+    with pytest.raises(ValueError):
+        voice.EmotionHistory(-1)
+
+def test_keeps_newest_records_in_order():
+    analyzer = voice.Level5EmotionAnalyzer(history_limit=2)
+    for text in ["çok mutluyum", "üzgünüm", "sinirliyim"]:
+        analyzer.analyze_with_context(text)
+    primaries = [record.primary_emotion for record in analyzer.emotion_history]
+    assert primaries == [voice.Emotion.SADNESS, voice.Emotion.ANGER]
+    assert analyzer.emotion_history.recent_primaries(5) == primaries[::-1]
+
+def test_context_pool_shares_tuples_and_stays_bounded():
+    first = voice.intern_context({"day_time": 0.7, "problem_solving_context": 0.9})
+    again = voice.intern_context({"day_time": 0.7, "problem_solving_context": 0.9})
+    assert first is again
+    for hour in range(voice.CONTEXT_POOL_SIZE * 2):
+        voice.intern_context({"day_time": hour / 1000})
+    assert voice._pooled_context.cache_info().currsize <= voice.CONTEXT_POOL_SIZE
@@ -0,0 +1,148 @@
+"""RecognitionPool: sıralı teslim ve işçi başlangıcından sayılan süre"""
+
+import time
+
+import pytest
+
+sr = pytest.importorskip("speech_recognition")
+
+import voice
+
+def make_audio(index):
+    return sr.AudioData(bytes([index, 0]), 16000, 2)
+
+def label(audio):
+    return f"ifade{audio.frame_data[0]}"
+
+def collect(pool, count):
+    results = []
+    for _ in range(count):
+        result = pool.next_result(timeout=10)
+        assert result is not None
+        results.append(result)
+    return results
+
+def test_queued_jobs_do_not_time_out_while_waiting_for_a_worker():
+    # Tek işçi: 6 x 0.15 sn kuyrukta toplam süreyi aşar, tek istek aşmaz
+    pool = voice.RecognitionPool(voice.StubRecognizer(label, delay=0.15), max_workers=1, timeout=0.5)
+    try:
+        for index in range(6):
+            pool.submit(make_audio(index))
+        results = collect(pool, 6)
+    finally:
+        pool.close()
+    assert [result.seq for result in results] == list(range(6))
+    assert [result.error for result in results] == [None] * 6
+    assert [result.text for result in results] == [f"ifade{index}" for index in range(6)]
+
+class SlowOnce:
+    """Tek bir ifadede takılan motor (StubRecognizer kilidinin dışında bekler)"""
+
+    name = "slow"
+
+    def __init__(self, slow_index, stall):
+        self.slow_index = slow_index
+        self.stall = stall
+        self.stub = voice.StubRecognizer(label, delay=0.05)
+
+    def recognize(self, audio):
+        if audio.frame_data[0] == self.slow_index:
+            time.sleep(self.stall)
+        return self.stub.recognize(audio)
+
+def test_only_the_slow_job_times_out_and_order_is_kept():
+    slow = 2
+    pool = voice.RecognitionPool(SlowOnce(slow, 0.6), max_workers=2, timeout=0.3)
+    try:
+        for index in range(5):
+            pool.submit(make_audio(index))
+        results = collect(pool, 5)
+    finally:
+        pool.close()
+
+    assert [result.seq for result in results] == list(range(5))
+    for result in results:
+        if result.seq == slow:
+            assert isinstance(result.error, TimeoutError)
+            assert result.text == ""
+        else:
+            assert result.error is None
+            assert result.text == f"ifade{result.seq}"
+
+def test_recognizer_errors_are_delivered_in_place():
+    pool = voice.RecognitionPool(voice.StubRecognizer(["bir", "", "üç"]), max_workers=1, timeout=1.0)
+    try:
+        for index in range(3):
+            pool.submit(make_audio(index))
+        results = collect(pool, 3)
+    finally:
+        pool.close()
+    assert [result.text for result in results] == ["bir", "", "üç"]
+    assert isinstance(results[1].error, sr.UnknownValueError)
+
+class ListStream:
+    """AudioCaptureStream yerine sabit ifade listesi; error verilirse sonunda fırlatır"""
+
+    def __init__(self, utterances, error=None):
+        self.pending = list(utterances)
+        self.error = error
+        self.finished = False
+        self.is_running = True
+
+    def next_utterance(self, timeout=None):
+        if self.pending:
+            return self.pending.pop(0)
+        if self.error is not None:
+            raise self.error
+        self.finished = True
+        return None
+
+def drain(pool):
+    results = []
+    while True:
+        result = pool.next_result(timeout=5)
+        if result is None:
+            break
+        results.append(result)
+    assert pool.finished
+    return results
+
+def test_failing_gate_lets_the_utterance_through():
+    def gate(audio):
+        if audio.frame_data[0] == 1:
+            raise sr.RequestError("bulucu çöktü")
+        return audio.frame_data[0] != 2
+
+    pool = voice.RecognitionPool(voice.StubRecognizer(label), max_workers=2, timeout=1.0)
+    try:
+        pool.feed(ListStream([make_audio(index) for index in range(4)]), gate=gate)
+        results = drain(pool)
+    finally:
+        pool.close()
+    assert [result.text for result in results] == ["ifade0", "ifade1", "ifade3"]
+
+def test_failing_submit_skips_only_that_utterance(monkeypatch):
+    pool = voice.RecognitionPool(voice.StubRecognizer(label), max_workers=2, timeout=1.0)
+    submit = pool.submit
+
+    def flaky_submit(audio):
+        if audio.frame_data[0] == 1:
+            raise RuntimeError("havuz dolu")
+        return submit(audio)
+
+    monkeypatch.setattr(pool, "submit", flaky_submit)
+    try:
+        pool.feed(ListStream([make_audio(index) for index in range(3)]))
+        results = drain(pool)
+    finally:
+        pool.close()
+    assert [result.text for result in results] == ["ifade0", "ifade2"]
+
+def test_capture_error_ends_feeding_without_hanging():
+    pool = voice.RecognitionPool(voice.StubRecognizer(label), max_workers=2, timeout=1.0)
+    try:
+        pool.feed(ListStream([make_audio(0)], error=OSError("mikrofon çıkarıldı")))
+        results = drain(pool)
+    finally:
+        pool.close()
+    assert [result.text for result in results] == ["ifade0"]
@@ -0,0 +1,71 @@
+"""EmotionScoringEngine: NumPy ve saf Python yollarının bit düzeyinde eşitliği"""
+
+import random
+
+import pytest
+
+pytest.importorskip("speech_recognition")
+np = pytest.importorskip("numpy")
+
+import voice
+
+# Eşitlik ve eşik durumlarını sık üretmek için küçük bir değer kümesi
+SCORE_VALUES = [0.0, 0.0, 0.0, 0.05, 0.1, 0.1, 0.2, 0.25, 0.5, 0.9, 1.0]
+
+def random_batch(rng, size):
+    width = len(voice.EMOTION_AXIS)
+    rows = []
+    for _ in range(size):
+        if rng.random() < 0.1:
+            rows.append([0.0] * width)  # Hiç skor yok
+        else:
+            rows.append([rng.choice(SCORE_VALUES) for _ in range(width)])
+    word_counts = [rng.choice([0, 3, 10, 11, 25]) for _ in range(size)]
+    negation_counts = [rng.choice([0, 0, 1, 2]) for _ in range(size)]
+    night_flags = [rng.random() < 0.3 for _ in range(size)]
+    return rows, word_counts, negation_counts, night_flags
+
+@pytest.fixture(scope="module")
+def engines():
+    return voice.EmotionScoringEngine(use_numpy=True), voice.EmotionScoringEngine(use_numpy=False)
+
+def test_numpy_and_python_paths_agree(engines):
+    numpy_engine, python_engine = engines
+    rng = random.Random(4)
+    for _ in range(300):
+        batch = random_batch(rng, 20)
+        assert numpy_engine.score_batch(*batch) == python_engine.score_batch(*batch)
+
+@pytest.mark.parametrize("size", [
+    1,
+    voice.EmotionScoringEngine.NUMPY_MIN_BATCH - 1,
+    voice.EmotionScoringEngine.NUMPY_MIN_BATCH,
+    voice.EmotionScoringEngine.NUMPY_MIN_BATCH + 1,
+])
+def test_agree_around_numpy_min_batch(engines, size):
+    numpy_engine, python_engine = engines
+    rng = random.Random(size)
+    for _ in range(50):
+        batch = random_batch(rng, size)
+        expected = python_engine.score_batch(*batch)
+        assert numpy_engine.score_batch(*batch) == expected
+        # Küçük gruplarda da matris yolu aynı sonucu vermeli
+        assert numpy_engine._score_numpy(*batch) == expected
+
+def test_all_zero_rows(engines):
+    numpy_engine, python_engine = engines
+    size = voice.EmotionScoringEngine.NUMPY_MIN_BATCH
+    batch = ([[0.0] * len(voice.EMOTION_AXIS)] * size, [12] * size, [1] * size, [True] * size)
+    assert numpy_engine.score_batch(*batch) == [(None, [], 0.0)] * size
+    assert python_engine.score_batch(*batch) == [(None, [], 0.0)] * size
+
+def test_ties_keep_axis_order(engines):
+    numpy_engine, python_engine = engines
+    row = [0.0] * len(voice.EMOTION_AXIS)
+    for position in (2, 5, 7, 9, 11):
+        row[position] = 0.5
+    size = voice.EmotionScoringEngine.NUMPY_MIN_BATCH
+    batch = ([row] * size, [3] * size, [0] * size, [False] * size)
+    expected = (2, [5, 7, 9], 0.5)
+    assert numpy_engine.score_batch(*batch) == [expected] * size
+    assert python_engine.score_batch(*batch) == [expected] * size
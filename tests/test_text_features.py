@@ -0,0 +1,121 @@
+"""Tek geçişli TextFeatures sonuçlarının eski katman katman taramalarla eşitliği"""
+
+import pytest
+
+pytest.importorskip("speech_recognition")
+
+import voice
+
+CORPUS = [
+    "",
+    "   ",
+    "a",
+    "bugün çok mutluyum, harika bir gün!",
+    "Üzgünüm ama bu hiç iyi değil...",
+    # Çakışan ipuçları: "değil mi" / "değil", "çokça" / "çok", "çok güzel" / "çok"
+    "değil mi değil mi değildeğil",
+    "yokyokyok hayır olmamış olmamalı olmaz",
+    "çok çok çokça aşırı fazla son derece feci",
+    "çok güzel ama müthiş harika süper fakat",
+    "tabi canım elbette ne sandın tabii ki",
+    "kalbim ruhum içim derin yürek derinden",
+    "müzikal şarkıcı filmler videolar yardımcı sorunlu hatalı",
+    "bilgisayar telefon yazılım şarkı film spor okul aile yemek",
+    "keşke keşke keşke",
+    "off ne kötü bir film, netflix berbat",
+    "hayalkırıklığı hayal kırıklığı yaşadım",
+    "gülgülgül sinirlendim",
+    # Türkçe büyük/küçük harf: "İ".lower() iki karakter üretir, "I" -> "i"
+    "İÇİM KALBİM DEĞİL ÇOK MUTLUYUM",
+    "KIZGIN mıyım? Evet değil mi",
+    "Işık İstanbul'da GÜZEL bir gün. Çok güzel. Son derece feci.",
+    "Ah! Vah! Off!",
+    "  baştaki ve sondaki   boşluklar  ",
+]
+
+def old_find_emotional_words(analyzer, text):
+    emotional_words = []
+    for word in text.lower().split():
+        for emotion_word, emotions in analyzer.turkish_emotion_lexicon.items():
+            if emotion_word in word:
+                for emotion in emotions.keys():
+                    emotional_words.append((word, emotion))
+    return emotional_words
+
+def old_count_negations(analyzer, text):
+    return sum(text.lower().count(negation) for negation in analyzer.cue_phrases["negations"])
+
+def old_find_intensifiers(analyzer, text):
+    return [word for word in analyzer.cue_phrases["intensifiers"] if word in text.lower()]
+
+def old_emotion_lexicon_matching(analyzer, text):
+    text_lower = text.lower()
+    emotion_scores = {emotion.value: 0.0 for emotion in voice.Emotion}
+    for word, emotions in analyzer.turkish_emotion_lexicon.items():
+        if word in text_lower:
+            for emotion, score in emotions.items():
+                if emotion in voice.EMOTION_INDEX:
+                    emotion_scores[voice.EMOTION_INDEX[emotion].value] += score
+    total = sum(emotion_scores.values())
+    if total > 0:
+        emotion_scores = {k: v / total for k, v in emotion_scores.items()}
+    return emotion_scores
+
+def old_analyze_semantics(analyzer, text):
+    text_lower = text.lower()
+    cues = analyzer.cue_phrases
+    has_irony = any(word in text_lower for word in cues["irony_indicators"]) and \
+        any(word in text_lower for word in cues["irony_negations"])
+    has_sarcasm = any(word in text_lower for word in cues["sarcasm_patterns"])
+    metaphor_count = sum(1 for word in cues["metaphor_indicators"] if word in text_lower)
+    return {
+        "irony": 0.8 if has_irony else 0.0,
+        "sarcasm": 0.9 if has_sarcasm else 0.0,
+        "metaphor": min(metaphor_count * 0.2, 1.0),
+    }
+
+def old_static_context(analyzer, text, hour):
+    text_lower = text.lower()
+    context_scores = {"day_time": 0.7}
+    if any(word in text_lower for word in analyzer.cue_phrases["entertainment_words"]):
+        context_scores["entertainment_context"] = 0.8
+    if any(word in text_lower for word in analyzer.cue_phrases["problem_words"]):
+        context_scores["problem_solving_context"] = 0.9
+    return context_scores
+
+def old_extract_topics(analyzer, text):
+    text_lower = text.lower()
+    topics = [topic for topic, keywords in analyzer.topic_keywords.items()
+              if any(keyword in text_lower for keyword in keywords)]
+    return topics[:3]
+
+def old_analyze_word_order(text):
+    words = text.lower().split()
+    if words and words[0] in ["keşke", "keşki", "ah", "vah", "off", "eyvah", "aman", "lütfen"]:
+        return 0.8
+    return 0.3
+
+@pytest.fixture(scope="module")
+def analyzer():
+    return voice.Level5EmotionAnalyzer()
+
+@pytest.mark.parametrize("text", CORPUS)
+def test_fused_features_match_per_layer_scans(analyzer, text):
+    features = analyzer.build_text_features(text)
+
+    assert features.text_lower == text.lower()
+    assert features.words == text.split()
+    assert analyzer.find_emotional_words(text, features) == old_find_emotional_words(analyzer, text)
+    assert analyzer.count_negations(text, features) == old_count_negations(analyzer, text)
+    assert analyzer.find_intensifiers(text, features) == old_find_intensifiers(analyzer, text)
+    assert analyzer.emotion_lexicon_matching(text, features) == \
+        pytest.approx(old_emotion_lexicon_matching(analyzer, text))
+    assert analyzer.analyze_semantics(text, features) == old_analyze_semantics(analyzer, text)
+    assert analyzer.evaluate_static_context(text, features, hour=12) == old_static_context(analyzer, text, 12)
+    assert analyzer.extract_topics(text, features) == old_extract_topics(analyzer, text)
+    assert analyzer.analyze_word_order(text, features) == old_analyze_word_order(text)
+
+def test_overlapping_negations_use_str_count(analyzer):
+    # "değil mi" ayrıca "değil" sayılır; aynı kalıbın çakışan geçişleri sayılmaz
+    text = "değil mi değildeğil yokyokyok"
+    assert analyzer.count_negations(text) == 1 + 3 + 3
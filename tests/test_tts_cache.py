@@ -0,0 +1,116 @@
+"""TTSCache (LRU, atomik yazma, dizin yükleme) ve SpeechBackendRegistry geri düşüşü"""
+
+import os
+
+import pytest
+
+pytest.importorskip("speech_recognition")
+
+import voice
+
+def test_evicts_least_recently_used_by_bytes(tmp_path):
+    cache = voice.TTSCache(str(tmp_path), max_bytes=30, memory_bytes=0)
+    cache.put("a", b"x" * 10)
+    cache.put("b", b"y" * 10)
+    cache.put("c", b"z" * 10)
+    assert cache.get("a") == b"x" * 10  # "b" artık en eski
+    cache.put("d", b"w" * 10)
+
+    assert len(cache) == 3
+    assert cache.get("b") is None
+    assert not os.path.exists(cache.path_for("b"))
+    assert cache.get("a") == b"x" * 10
+    assert cache.get("d") == b"w" * 10
+
+def test_oversized_entry_is_kept_alone(tmp_path):
+    cache = voice.TTSCache(str(tmp_path), max_bytes=5)
+    cache.put("a", b"1234")
+    cache.put("b", b"123456789")
+    assert len(cache) == 1
+    assert cache.get("b") == b"123456789"
+
+def test_put_is_atomic_and_leaves_no_temp_files(tmp_path, monkeypatch):
+    cache = voice.TTSCache(str(tmp_path))
+    cache.put("a", b"old")
+    assert sorted(os.listdir(tmp_path)) == ["a" + cache.SUFFIX]
+
+    def failing_replace(src, dst):
+        raise OSError("disk dolu")
+    monkeypatch.setattr(voice.os, "replace", failing_replace)
+    with pytest.raises(OSError):
+        cache.put("a", b"new")
+
+    # Yarım dosya yok, eski içerik yerinde
+    assert sorted(os.listdir(tmp_path)) == ["a" + cache.SUFFIX]
+    with open(cache.path_for("a"), "rb") as audio_file:
+        assert audio_file.read() == b"old"
+
+def test_reload_restores_entries_in_last_use_order(tmp_path):
+    cache = voice.TTSCache(str(tmp_path))
+    for mtime, key in enumerate(["b", "a", "c"], 1):
+        cache.put(key, key.encode() * 10)
+        os.utime(cache.path_for(key), (mtime, mtime))
+    (tmp_path / "notes.txt").write_text("önbellek dışı")
+
+    reloaded = voice.TTSCache(str(tmp_path), max_bytes=20)
+    # 30 bayt > 20: en eski kullanılan "b" silinir
+    assert len(reloaded) == 2
+    assert reloaded.get("b") is None
+    assert reloaded.get("a") == b"a" * 10
+    assert reloaded.get("c") == b"c" * 10
+    assert (tmp_path / "notes.txt").exists()
+
+def test_reload_migrates_legacy_mp3_names(tmp_path):
+    (tmp_path / "abc.mp3").write_bytes(b"RIFF....WAVE")
+    cache = voice.TTSCache(str(tmp_path))
+    assert cache.get("abc") == b"RIFF....WAVE"
+    assert sorted(os.listdir(tmp_path)) == ["abc" + cache.SUFFIX]
+
+class FakeBackend:
+    transport_errors = (OSError,)
+
+    def __init__(self, name, format="wav", error=None):
+        self.name = name
+        self.format = format
+        self.error = error
+        self.calls = []
+
+    def synthesize(self, text, lang="tr", slow=False):
+        self.calls.append(text)
+        if self.error is not None:
+            raise self.error
+        return f"{self.name}:{text}".encode()
+
+def test_registry_caches_per_backend(tmp_path):
+    backend = FakeBackend("fake")
+    registry = voice.SpeechBackendRegistry([backend], voice.TTSCache(str(tmp_path)))
+    assert registry.synthesize("merhaba") == b"fake:merhaba"
+    assert registry.synthesize("merhaba") == b"fake:merhaba"
+    assert backend.calls == ["merhaba"]
+
+    # Aynı önbellek, başka arka uç: farklı anahtar
+    other = FakeBackend("other", format="mp3")
+    other_registry = voice.SpeechBackendRegistry([other], registry.cache)
+    assert other_registry.synthesize("merhaba") == b"other:merhaba"
+    assert len(registry.cache) == 2
+
+def test_registry_falls_back_and_skips_open_breaker(tmp_path):
+    broken = FakeBackend("net", format="mp3", error=OSError("ağ yok"))
+    local = FakeBackend("local")
+    registry = voice.SpeechBackendRegistry([broken, local], voice.TTSCache(str(tmp_path)))
+
+    assert registry.synthesize("bir") == b"local:bir"
+    assert registry.health() == {"net": voice.CircuitBreaker.OPEN, "local": voice.CircuitBreaker.CLOSED}
+    assert registry.synthesize("iki") == b"local:iki"
+    assert broken.calls == ["bir"]  # Bekleme süresinde denenmedi
+
+def test_registry_input_error_keeps_breaker_closed():
+    picky = FakeBackend("picky", error=ValueError("boş metin"))
+    registry = voice.SpeechBackendRegistry([picky, voice.PrintSynthesizer()])
+    assert registry.synthesize("...") is None
+    assert registry.health()["picky"] == voice.CircuitBreaker.CLOSED
+
+def test_print_backend_is_not_cached(tmp_path):
+    registry = voice.SpeechBackendRegistry([voice.PrintSynthesizer()], voice.TTSCache(str(tmp_path)))
+    assert registry.synthesize("merhaba") is None
+    assert len(registry.cache) == 0
@@ -0,0 +1,127 @@
+"""Uyandırma sözcüğü bulucuları ve kayıtlı ses üzerinde ölçüm"""
+
+import math
+import wave
+from array import array
+
+import pytest
+
+sr = pytest.importorskip("speech_recognition")
+
+import voice
+
+RATE = 16000
+# (süre sn, genlik, frekans Hz): alçak hece, kısa geçiş, tiz hece
+WAKE = [(0.15, 8000, 300), (0.1, 3000, 300), (0.2, 6000, 2500)]
+OTHER = [(0.2, 6000, 2500), (0.1, 3000, 300), (0.15, 8000, 300)]
+
+def segment(seconds, amplitude=0, frequency=1000):
+    return [amplitude * math.sin(2 * math.pi * frequency * i / RATE) for i in range(int(seconds * RATE))]
+
+def word(parts, stretch=1.0):
+    samples = []
+    for seconds, amplitude, frequency in parts:
+        samples += segment(seconds * stretch, amplitude, frequency)
+    return samples
+
+def pcm(samples):
+    return array("h", (int(sample) for sample in samples)).tobytes()
+
+def audio(samples):
+    return sr.AudioData(pcm(samples), RATE, 2)
+
+def write_wav(path, samples):
+    with wave.open(str(path), "wb") as wav:
+        wav.setnchannels(1)
+        wav.setsampwidth(2)
+        wav.setframerate(RATE)
+        wav.writeframes(pcm(samples))
+    return str(path)
+
+@pytest.fixture
+def spotter(tmp_path):
+    return voice.TemplateWakeWordSpotter.from_wav_files([write_wav(tmp_path / "wake.wav", word(WAKE))])
+
+def test_template_spotter_accepts_the_word_at_other_speeds(spotter):
+    for stretch in (0.9, 1.0, 1.1):
+        assert spotter.detect(audio(segment(0.1) + word(WAKE, stretch) + segment(0.1)))
+
+def test_template_spotter_rejects_other_sounds(spotter):
+    assert not spotter.detect(audio(word(OTHER)))
+    assert not spotter.detect(audio(segment(0.45, 6000, 1000)))
+    assert not spotter.detect(audio(word(WAKE * 4)))  # süre uyuşmuyor
+    assert not spotter.detect(audio(segment(0.5)))     # sessizlik
+
+def test_template_spotter_needs_a_non_empty_template():
+    with pytest.raises(ValueError):
+        voice.TemplateWakeWordSpotter([audio([])])
+
+def test_evaluate_reports_hits_misses_and_false_wakes(tmp_path, spotter):
+    samples = (segment(1.0) + word(WAKE) + segment(1.5) + word(OTHER)
+               + segment(1.5) + word(WAKE, 1.1) + segment(1.5))
+    first_end = 1.0 + 0.45
+    second_start = first_end + 1.5 + 0.45 + 1.5
+    wake_intervals = [(1.0, first_end), (second_start, second_start + 0.45 * 1.1)]
+
+    report = voice.evaluate_wake_word_spotter(spotter, write_wav(tmp_path / "session.wav", samples), wake_intervals)
+    assert report["utterances"] == 3
+    assert report["hits"] == 2
+    assert report["misses"] == 0
+    assert report["false_wakes"] == 0
+    # Sözcük bitişinden sonra yalnızca VAD'nin sessizlik beklemesi kadar gecikme
+    assert 0 < report["mean_latency"] < 1.5
+
+    # Aralık verilmeyen tespitler yanlış uyanma sayılır
+    report = voice.evaluate_wake_word_spotter(spotter, write_wav(tmp_path / "session.wav", samples), [])
+    assert report["false_wakes"] == 2
+    assert report["recall"] is None
+
+def write_dictionary(root, language, words):
+    directory = root / language
+    directory.mkdir()
+    (directory / "pronounciation-dictionary.dict").write_text(
+        "".join(f"{entry} X\n" for entry in words), encoding="utf-8"
+    )
+
+class FakeSphinxRecognizer:
+    def __init__(self, text):
+        self.text = text
+        self.calls = []
+
+    def recognize_sphinx(self, audio, language="en-US", keyword_entries=None):
+        self.calls.append((language, keyword_entries))
+        return self.text
+
+def test_sphinx_spotter_keeps_only_keywords_in_the_model_dictionary(tmp_path, monkeypatch):
+    monkeypatch.setattr(voice, "SPHINX_DATA_DIR", str(tmp_path))
+    write_dictionary(tmp_path, "en-US", ["hello", "jarvis", "jarvis(2)"])
+    write_dictionary(tmp_path, "tr-TR", ["uyan", "merhaba"])
+
+    english = voice.SphinxWakeWordSpotter(FakeSphinxRecognizer(""), ["uyan", "merhaba", "jarvis"])
+    assert english.keywords == ["jarvis"]
+    turkish = voice.SphinxWakeWordSpotter(FakeSphinxRecognizer(""), ["uyan", "merhaba", "jarvis"], "tr-TR")
+    assert turkish.keywords == ["uyan", "merhaba"]
+    with pytest.raises(ValueError):
+        voice.SphinxWakeWordSpotter(FakeSphinxRecognizer(""), ["uyan"])
+
+def test_sphinx_spotter_searches_its_keywords_with_its_language(tmp_path, monkeypatch):
+    monkeypatch.setattr(voice, "SPHINX_DATA_DIR", str(tmp_path))
+    write_dictionary(tmp_path, "tr-TR", ["uyan", "merhaba"])
+    recognizer = FakeSphinxRecognizer("merhaba ")
+    spotter = voice.SphinxWakeWordSpotter(recognizer, ["uyan", "merhaba"], "tr-TR", sensitivity=0.5)
+    assert spotter.detect(audio(segment(0.1)))
+    assert recognizer.calls == [("tr-TR", [("uyan", 0.5), ("merhaba", 0.5)])]
+
+def test_default_spotter_prefers_the_turkish_model(tmp_path, monkeypatch):
+    monkeypatch.setattr(voice, "WAKE_WORD_DIR", str(tmp_path / "templates"))
+    monkeypatch.setattr(voice, "SPHINX_DATA_DIR", str(tmp_path))
+    monkeypatch.setattr(voice.importlib.util, "find_spec", lambda name: object())
+    write_dictionary(tmp_path, "en-US", ["jarvis"])
+    phrases = ("uyan", "merhaba", "jarvis")
+
+    spotter = voice.default_wake_word_spotter(sr.Recognizer(), phrases)
+    assert (spotter.language, spotter.keywords) == ("en-US", ["jarvis"])
+
+    write_dictionary(tmp_path, "tr-TR", ["uyan", "merhaba"])
+    spotter = voice.default_wake_word_spotter(sr.Recognizer(), phrases)
+    assert (spotter.language, spotter.keywords) == ("tr-TR", ["uyan", "merhaba"])
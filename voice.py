@@ -1,21 +1,55 @@
 import speech_recognition as sr
 import webbrowser
 import time
-import pygame
-from gtts import gTTS
 import tempfile
-import pyautogui
 import threading
+import queue
 import os
 import random
 import datetime
-import psutil
 import sys
 import json
-from typing import Dict, List, Tuple, Any, Optional
+import re
+import hashlib
+import io
+import wave
+import math
+import importlib.util
+import glob
+import argparse
+import asyncio
+import shutil
+import functools
+import subprocess
+from array import array
+from concurrent.futures import Future, ProcessPoolExecutor, ThreadPoolExecutor, as_completed
+from bisect import bisect_right
+from collections import Counter, OrderedDict, deque
+from itertools import count, islice
+from typing import Dict, List, Tuple, Any, Optional, Iterable, Iterator
 from dataclasses import dataclass
 from enum import Enum
 
+try:
+    import numpy as np
+except ImportError:  # NumPy yoksa saf Python puanlama kullanılır
+    np = None
+
+# Arayüz ve ses kitaplıkları yalnızca asistan kipinde yüklenir; böylece
+# başsız sunucudaki 'analyze' işçileri bunlar olmadan da içe aktarabilir
+pygame = None
+gTTS = None
+pyautogui = None
+psutil = None
+
+def load_assistant_modules():
+    """Asistanın ses/arayüz kitaplıklarını yükle (ilk Jarvis oluşturulurken)"""
+    global pygame, gTTS, pyautogui, psutil
+    import pygame
+    from gtts import gTTS
+    import pyautogui
+    import psutil
+
 # ==================== DUYGU ANALİZİ SEVİYE 5 SİSTEMİ ====================
 
 class Emotion(Enum):
@@ -36,6 +70,25 @@ class Emotion(Enum):
     RELIEF = "rahatlama"
     DISAPPOINTMENT = "hayal kırıklığı"
 
+def build_emotion_index() -> Dict[str, Emotion]:
+    """Sözlük anahtarı (ör. "joy") ve enum değeri (ör. "neşe") -> Emotion dizini"""
+    index = {}
+    for emotion in Emotion:
+        index[emotion.name.lower()] = emotion
+        index[emotion.value] = emotion
+    return index
+
+EMOTION_INDEX = build_emotion_index()
+
+# Skor vektörlerinin sabit ekseni (Emotion tanım sırası)
+EMOTION_AXIS = tuple(Emotion)
+EMOTION_VALUES = tuple(emotion.value for emotion in EMOTION_AXIS)
+
+# Sıkıştırılmış kayıtlar için küçük tamsayı kodları (0 = boş)
+EMOTION_CODES = {emotion: code for code, emotion in enumerate(EMOTION_AXIS, 1)}
+SECONDARY_BITS = 4  # 15 duygu 4 bite sığar
+MAX_PACKED_SECONDARY = 3  # 3 x 4 bit = 12 bit ('H' dizisine sığar)
+
 @dataclass
 class EmotionalState:
     """Duygu durumu analizi sonucu"""
@@ -47,16 +100,526 @@ class EmotionalState:
     context_score: Dict[str, float]  # Bağlamsal puanlar
     timestamp: float
 
+def pack_secondary(emotions: List[Emotion]) -> int:
+    """İkincil duyguları sırasıyla sabit genişlikli bir maskeye paketle"""
+    packed = 0
+    for slot, emotion in enumerate(emotions[:MAX_PACKED_SECONDARY]):
+        packed |= EMOTION_CODES[emotion] << (slot * SECONDARY_BITS)
+    return packed
+
+def unpack_secondary(packed: int) -> List[Emotion]:
+    """Paketlenmiş maskeden ikincil duygu listesini çöz"""
+    emotions = []
+    while packed:
+        emotions.append(EMOTION_AXIS[(packed & 0xF) - 1])
+        packed >>= SECONDARY_BITS
+    return emotions
+
+CONTEXT_POOL_SIZE = 256  # Bağlam skorları birkaç sabit kalıptan oluşur
+
+@functools.lru_cache(maxsize=CONTEXT_POOL_SIZE)
+def _pooled_context(key: Tuple[Tuple[str, float], ...]) -> Tuple[Tuple[str, float], ...]:
+    """Eşit demetler için ilk görülen nesneyi döndür (sınırlı havuz)"""
+    return key
+
+def intern_context(context_score: Dict[str, float]) -> Tuple[Tuple[str, float], ...]:
+    """Bağlam skorlarını paylaşılan, değişmez bir demete çevir"""
+    return _pooled_context(tuple(context_score.items()))
+
+def intern_triggers(triggers: List[str]) -> Tuple[str, ...]:
+    """Tetikleyici kelimeleri interned demet olarak sakla"""
+    return tuple(sys.intern(word) for word in triggers)
+
+class CompactEmotionalState:
+    """Uzun süre saklanan analizler için sıkıştırılmış EmotionalState
+
+    Duygular küçük tamsayı kodu, ikinciller sabit genişlikli maske,
+    tetikleyiciler interned demet olarak tutulur. Alan adları
+    EmotionalState ile aynıdır; okuyan kod farkı görmez.
+    """
+    
+    __slots__ = ("primary_code", "secondary_packed", "intensity", "confidence",
+                 "trigger_words", "context_items", "timestamp")
+    
+    def __init__(self, primary_code: int, secondary_packed: int, intensity: float, confidence: float,
+                 trigger_words: Tuple[str, ...], context_items: Tuple[Tuple[str, float], ...],
+                 timestamp: float):
+        self.primary_code = primary_code
+        self.secondary_packed = secondary_packed
+        self.intensity = intensity
+        self.confidence = confidence
+        self.trigger_words = trigger_words
+        self.context_items = context_items
+        self.timestamp = timestamp
+    
+    @classmethod
+    def from_state(cls, state: EmotionalState) -> "CompactEmotionalState":
+        if isinstance(state, cls):
+            return state
+        return cls(
+            EMOTION_CODES[state.primary_emotion],
+            pack_secondary(state.secondary_emotions),
+            state.intensity,
+            state.confidence,
+            intern_triggers(state.triggers),
+            intern_context(state.context_score),
+            state.timestamp
+        )
+    
+    @property
+    def primary_emotion(self) -> Emotion:
+        return EMOTION_AXIS[self.primary_code - 1]
+    
+    @property
+    def secondary_emotions(self) -> List[Emotion]:
+        return unpack_secondary(self.secondary_packed)
+    
+    @property
+    def triggers(self) -> List[str]:
+        return list(self.trigger_words)
+    
+    @property
+    def context_score(self) -> Dict[str, float]:
+        return dict(self.context_items)
+    
+    def to_state(self) -> EmotionalState:
+        """Tam (değiştirilebilir) EmotionalState kopyası oluştur"""
+        return EmotionalState(
+            primary_emotion=self.primary_emotion,
+            secondary_emotions=self.secondary_emotions,
+            intensity=self.intensity,
+            confidence=self.confidence,
+            triggers=self.triggers,
+            context_score=self.context_score,
+            timestamp=self.timestamp
+        )
+    
+    def __repr__(self) -> str:
+        return (f"CompactEmotionalState(primary_emotion={self.primary_emotion}, "
+                f"intensity={self.intensity:.2f}, confidence={self.confidence:.2f})")
+
+class EmotionRecordColumns:
+    """Analiz kayıtlarını sütun dizilerinde (struct-of-arrays) tutan temel sınıf"""
+    
+    def __init__(self):
+        self.primary_codes = array("B")
+        self.secondary_masks = array("H")
+        self.intensities = array("d")
+        self.confidences = array("d")
+        self.timestamps = array("d")
+        self.trigger_words: List[Tuple[str, ...]] = []
+        self.context_items: List[Tuple[Tuple[str, float], ...]] = []
+    
+    def _record(self, index: int) -> CompactEmotionalState:
+        return CompactEmotionalState(
+            self.primary_codes[index],
+            self.secondary_masks[index],
+            self.intensities[index],
+            self.confidences[index],
+            self.trigger_words[index],
+            self.context_items[index],
+            self.timestamps[index]
+        )
+
+class EmotionBatch(EmotionRecordColumns):
+    """analyze_many için sütun tabanlı sonuç (her dizi bir sütun, her indeks bir ifade)"""
+    
+    def __init__(self):
+        super().__init__()
+        self.topics: List[List[str]] = []
+    
+    @classmethod
+    def empty(cls) -> "EmotionBatch":
+        return cls()
+    
+    def append(self, analysis: EmotionalState, topics: List[str]):
+        """Bir analiz sonucunu sütunlara ekle"""
+        record = CompactEmotionalState.from_state(analysis)
+        self.primary_codes.append(record.primary_code)
+        self.secondary_masks.append(record.secondary_packed)
+        self.intensities.append(record.intensity)
+        self.confidences.append(record.confidence)
+        self.timestamps.append(record.timestamp)
+        self.trigger_words.append(record.trigger_words)
+        self.context_items.append(record.context_items)
+        self.topics.append(topics)
+    
+    @property
+    def primary_emotions(self) -> List[Emotion]:
+        return [EMOTION_AXIS[code - 1] for code in self.primary_codes]
+    
+    def __len__(self) -> int:
+        return len(self.primary_codes)
+    
+    def row(self, index: int) -> CompactEmotionalState:
+        """Tek satırı EmotionalState görünümü olarak döndür"""
+        return self._record(index)
+
+class EmotionHistory(EmotionRecordColumns):
+    """Sabit kapasiteli, sütun dizili duygu geçmişi halka tamponu
+
+    Kayıtlar CompactEmotionalState görünümü olarak okunur; deque gibi
+    len, indeksleme (negatif dahil), iterasyon ve reversed destekler.
+    """
+    
+    def __init__(self, maxlen: int):
+        super().__init__()
+        if maxlen < 0:
+            raise ValueError("maxlen must be non-negative")
+        self.maxlen = maxlen
+        self._start = 0
+        self._size = 0
+        # Sütunlar kapasite kadar önceden ayrılır; yeni kayıt en eskisinin yerine yazılır
+        self.primary_codes = array("B", bytes(maxlen))
+        self.secondary_masks = array("H", [0]) * maxlen
+        self.intensities = array("d", [0.0]) * maxlen
+        self.confidences = array("d", [0.0]) * maxlen
+        self.timestamps = array("d", [0.0]) * maxlen
+        self.trigger_words = [()] * maxlen
+        self.context_items = [()] * maxlen
+    
+    def append(self, analysis: EmotionalState):
+        """Analizi ekle; doluysa en eski kaydın üzerine yaz"""
+        if self.maxlen == 0:
+            return  # deque(maxlen=0) gibi: kayıt tutulmaz
+        record = CompactEmotionalState.from_state(analysis)
+        if self._size < self.maxlen:
+            slot = (self._start + self._size) % self.maxlen
+            self._size += 1
+        else:
+            slot = self._start
+            self._start = (self._start + 1) % self.maxlen
+        self.primary_codes[slot] = record.primary_code
+        self.secondary_masks[slot] = record.secondary_packed
+        self.intensities[slot] = record.intensity
+        self.confidences[slot] = record.confidence
+        self.timestamps[slot] = record.timestamp
+        self.trigger_words[slot] = record.trigger_words
+        self.context_items[slot] = record.context_items
+    
+    def __len__(self) -> int:
+        return self._size
+    
+    def __getitem__(self, index: int) -> CompactEmotionalState:
+        if index < 0:
+            index += self._size
+        if not 0 <= index < self._size:
+            raise IndexError("emotion history index out of range")
+        return self._record((self._start + index) % self.maxlen)
+    
+    def __iter__(self) -> Iterator[CompactEmotionalState]:
+        for index in range(self._size):
+            yield self[index]
+    
+    def __reversed__(self) -> Iterator[CompactEmotionalState]:
+        for index in range(self._size - 1, -1, -1):
+            yield self[index]
+    
+    def recent_primaries(self, count: int) -> List[Emotion]:
+        """Son `count` kaydın birincil duyguları (yeniden eskiye), kayıt oluşturmadan"""
+        codes = self.primary_codes
+        return [
+            EMOTION_AXIS[codes[(self._start + index) % self.maxlen] - 1]
+            for index in range(self._size - 1, max(self._size - count, 0) - 1, -1)
+        ]
+
+@dataclass
+class TextFeatures:
+    """Tek geçişte çıkarılan ortak metin özellikleri"""
+    text: str
+    text_lower: str
+    words: List[str]  # text.split()
+    word_spans: List[Tuple[int, int]]  # Küçük harfli metindeki kelime aralıkları
+    lexicon_matches: List[Tuple[int, int]]  # (başlangıç, sözlük indeksi)
+    cue_counts: Dict[str, int]  # İpucu kalıbı -> çakışmasız geçiş sayısı
+
+@dataclass
+class TextAnalysis:
+    """Yalnızca metne bağlı analiz parçaları (saatten ve geçmişten bağımsız)
+
+    Önbellekte paylaşılır; okuyanlar değiştirmemelidir.
+    """
+    features: TextFeatures
+    linguistic_features: Dict[str, Any]
+    semantic_scores: Dict[str, float]
+    emotion_scores: Dict[str, float]
+    topics: List[str]
+
+class AhoCorasickMatcher:
+    """Çoklu kalıp eşleştirici (Aho–Corasick otomatı)
+
+    Kalıplar bir kez derlenir; metin tek geçişte taranır ve her kalıbın
+    tüm (çakışanlar dahil) geçişleri bulunur.
+    """
+    
+    def __init__(self, patterns: Iterable[str]):
+        self.patterns = list(patterns)
+        self._lengths = [len(pattern) for pattern in self.patterns]
+        self._goto: List[Dict[str, int]] = [{}]
+        self._fail: List[int] = [0]
+        self._output: List[List[int]] = [[]]
+        self._build()
+    
+    def _build(self):
+        """Geçiş, hata ve çıktı tablolarını kur"""
+        for index, pattern in enumerate(self.patterns):
+            if not pattern:
+                continue
+            state = 0
+            for char in pattern:
+                next_state = self._goto[state].get(char)
+                if next_state is None:
+                    next_state = len(self._goto)
+                    self._goto.append({})
+                    self._fail.append(0)
+                    self._output.append([])
+                    self._goto[state][char] = next_state
+                state = next_state
+            self._output[state].append(index)
+        
+        # Hata bağlantıları (genişlik öncelikli)
+        pending = deque(self._goto[0].values())
+        while pending:
+            state = pending.popleft()
+            for char, next_state in self._goto[state].items():
+                pending.append(next_state)
+                fallback = self._fail[state]
+                while fallback and char not in self._goto[fallback]:
+                    fallback = self._fail[fallback]
+                self._fail[next_state] = self._goto[fallback].get(char, 0)
+                self._output[next_state] = self._output[next_state] + self._output[self._fail[next_state]]
+    
+    def iter_matches(self, text: str) -> Iterator[Tuple[int, int]]:
+        """Metindeki eşleşmeleri (başlangıç, kalıp indeksi) olarak üret"""
+        goto, fail, output, lengths = self._goto, self._fail, self._output, self._lengths
+        state = 0
+        for position, char in enumerate(text):
+            while state and char not in goto[state]:
+                state = fail[state]
+            state = goto[state].get(char, 0)
+            for index in output[state]:
+                yield position - lengths[index] + 1, index
+    
+    def find_all(self, text: str) -> List[Tuple[int, int]]:
+        """Tüm eşleşmeleri liste olarak döndür"""
+        return list(self.iter_matches(text))
+
+class EmotionScoringEngine:
+    """Emotion ekseninde dizi tabanlı ağırlıklandırma ve seçim motoru
+
+    Her satır bir ifadenin EMOTION_AXIS sırasındaki sözlük skorlarıdır.
+    NumPy varsa toplu skorlama matris işlemiyle yapılır; yoksa (veya küçük
+    gruplarda) aynı sonucu bit düzeyinde veren saf Python yolu kullanılır.
+    """
+    
+    LENGTH_WEIGHT = 1.2  # Uzun metin (> 10 kelime)
+    NEGATION_WEIGHT = 1.3  # Olumsuzluk varsa üzüntü/öfke/korku
+    NIGHT_WEIGHT = 1.4  # Gece saatlerinde üzüntü/korku
+    SECONDARY_THRESHOLD = 0.1
+    MAX_SECONDARY = 3
+    NUMPY_MIN_BATCH = 8  # Bundan küçük gruplarda NumPy ek yükü kazançtan fazla
+    
+    def __init__(self, use_numpy: Optional[bool] = None):
+        if use_numpy is None:
+            use_numpy = np is not None
+        self.use_numpy = use_numpy and np is not None
+        
+        negation_emotions = (Emotion.SADNESS, Emotion.ANGER, Emotion.FEAR)
+        night_emotions = (Emotion.SADNESS, Emotion.FEAR)
+        self.negation_mask = [emotion in negation_emotions for emotion in EMOTION_AXIS]
+        self.night_mask = [emotion in night_emotions for emotion in EMOTION_AXIS]
+        if self.use_numpy:
+            self._negation_vector = np.array(self.negation_mask)
+            self._night_vector = np.array(self.night_mask)
+    
+    def score_batch(self, score_rows: List[List[float]], word_counts: List[int],
+                    negation_counts: List[int], night_flags: List[bool]) -> List[Tuple[Optional[int], List[int], float]]:
+        """Skor satırlarını ağırlıklandır; her satır için (birincil, ikinciller, en yüksek skor) döndür
+
+        Birincil/ikincil değerler EMOTION_AXIS konumlarıdır; hiç skor yoksa
+        birincil None olur.
+        """
+        if self.use_numpy and len(score_rows) >= self.NUMPY_MIN_BATCH:
+            return self._score_numpy(score_rows, word_counts, negation_counts, night_flags)
+        return [
+            self._score_row(row, word_count, negations, night)
+            for row, word_count, negations, night in zip(score_rows, word_counts, negation_counts, night_flags)
+        ]
+    
+    def _score_row(self, row: List[float], word_count: int, negations: int,
+                   night: bool) -> Tuple[Optional[int], List[int], float]:
+        """Tek satırı saf Python ile skorla"""
+        length_weight = self.LENGTH_WEIGHT if word_count > 10 else 1.0
+        weighted = []
+        for position, score in enumerate(row):
+            if score == 0:
+                continue
+            linguistic_weight = length_weight
+            if negations > 0 and self.negation_mask[position]:
+                linguistic_weight *= self.NEGATION_WEIGHT
+            context_weight = self.NIGHT_WEIGHT if night and self.night_mask[position] else 1.0
+            weighted.append((position, score * linguistic_weight * context_weight))
+        
+        if not weighted:
+            return None, [], 0.0
+        
+        # sorted kararlıdır: eşit skorlarda eksen sırası korunur
+        ranked = sorted(weighted, key=lambda item: item[1], reverse=True)
+        primary, top_score = ranked[0]
+        secondary = [
+            position for position, score in ranked[1:1 + self.MAX_SECONDARY]
+            if score > self.SECONDARY_THRESHOLD
+        ]
+        return primary, secondary, top_score
+    
+    def _score_numpy(self, score_rows, word_counts, negation_counts,
+                     night_flags) -> List[Tuple[Optional[int], List[int], float]]:
+        """Satırları tek matris işlemiyle skorla"""
+        scores = np.asarray(score_rows, dtype=np.float64)
+        length_weight = np.where(np.asarray(word_counts) > 10, self.LENGTH_WEIGHT, 1.0)
+        negated = (np.asarray(negation_counts) > 0)[:, None] & self._negation_vector
+        night = np.asarray(night_flags, dtype=bool)[:, None] & self._night_vector
+        
+        linguistic_weight = length_weight[:, None] * np.where(negated, self.NEGATION_WEIGHT, 1.0)
+        context_weight = np.where(night, self.NIGHT_WEIGHT, 1.0)
+        weighted = scores * linguistic_weight * context_weight
+        
+        # Kararlı sıralama, saf Python yolundaki eşitlik kuralını birebir korur
+        ranked = np.argsort(-weighted, axis=1, kind="stable")[:, :1 + self.MAX_SECONDARY]
+        top = np.take_along_axis(weighted, ranked, axis=1)
+        has_score = scores.any(axis=1)
+        
+        results = []
+        for row in range(len(scores)):
+            if not has_score[row]:
+                results.append((None, [], 0.0))
+                continue
+            secondary = [
+                int(position) for position, score in zip(ranked[row, 1:], top[row, 1:])
+                if score > self.SECONDARY_THRESHOLD
+            ]
+            results.append((int(ranked[row, 0]), secondary, float(top[row, 0])))
+        return results
+
+def iter_recent(buffer: deque, count: int) -> Iterator[Any]:
+    """Halka tamponun son `count` öğesini kopyalamadan (yeniden eskiye) gez"""
+    return islice(reversed(buffer), count)
+
+def recent_items(buffer: deque, count: int) -> List[Any]:
+    """Halka tamponun son `count` öğesini eskiden yeniye liste olarak döndür"""
+    items = list(iter_recent(buffer, count))
+    items.reverse()
+    return items
+
+class SlidingCounter:
+    """Son `window` grubun öğelerini sayan, artımlı güncellenen sayaç"""
+    
+    def __init__(self, window: int):
+        self.window = window
+        self.groups = deque()
+        self.counts = Counter()
+    
+    def push(self, items: Iterable[Any]):
+        """Yeni grubu ekle; pencere doluysa en eski grubu düşür"""
+        if len(self.groups) == self.window:
+            for item in self.groups.popleft():
+                self.counts[item] -= 1
+                if not self.counts[item]:
+                    del self.counts[item]
+        group = tuple(items)
+        self.groups.append(group)
+        self.counts.update(group)
+    
+    def most_common(self, n: int) -> List[Tuple[Any, int]]:
+        """En sık n öğe; eşitlikte pencerede önce görülen önce gelir (Counter ile aynı)"""
+        if not self.counts:
+            return []
+        first_seen = {}
+        for group in self.groups:
+            for item in group:
+                first_seen.setdefault(item, len(first_seen))
+        ranked = sorted(self.counts.items(), key=lambda item: (-item[1], first_seen[item[0]]))
+        return ranked[:n]
+
+class EmotionStatistics:
+    """Analizler geldikçe artımlı güncellenen oturum istatistikleri
+
+    Tüm sorgular oturum uzunluğundan bağımsız, sabit sürede yanıtlanır.
+    """
+    
+    def __init__(self, intensity_window: int = 10, stability_window: int = 5,
+                 reflection_window: int = 5, summary_window: int = 10):
+        self.total_analyses = 0
+        self.emotion_counts = Counter()  # Oturum boyunca birincil duygu sayıları
+        self.recent_intensities = deque(maxlen=intensity_window)
+        self.recent_primaries = deque(maxlen=stability_window)
+        self.transitions = 0  # recent_primaries içindeki duygu değişimi sayısı
+        self.reflection_topics = SlidingCounter(reflection_window)
+        self.summary_topics = SlidingCounter(summary_window)
+        self.summary_emotions = SlidingCounter(summary_window)
+    
+    def record_analysis(self, analysis: EmotionalState):
+        """Yeni analizi sayaçlara işle"""
+        emotion = analysis.primary_emotion
+        self.total_analyses += 1
+        self.emotion_counts[emotion.value] += 1
+        self.recent_intensities.append(analysis.intensity)
+        
+        primaries = self.recent_primaries
+        if len(primaries) == primaries.maxlen:
+            oldest = primaries.popleft()
+            if primaries and oldest != primaries[0]:
+                self.transitions -= 1
+        if primaries and primaries[-1] != emotion:
+            self.transitions += 1
+        primaries.append(emotion)
+    
+    def record_memory(self, memory_entry: Dict[str, Any]):
+        """Yeni konuşma belleği kaydını sayaçlara işle"""
+        topics = memory_entry.get("topics", [])
+        self.reflection_topics.push(topics)
+        self.summary_topics.push(topics)
+        self.summary_emotions.push([memory_entry.get("emotion", "nötr")])
+    
+    def average_intensity(self) -> float:
+        """Son analizlerin yoğunluk ortalaması"""
+        if not self.recent_intensities:
+            return 0
+        return sum(self.recent_intensities) / len(self.recent_intensities)
+    
+    def most_common_emotion(self) -> str:
+        """Oturumda en sık görülen duygu (eşitlikte ilk görülen)"""
+        if not self.emotion_counts:
+            return "bilinmiyor"
+        return max(self.emotion_counts, key=self.emotion_counts.get)
+    
+    def stability(self) -> float:
+        """Son analizlerdeki duygu değişimlerine göre stabilite (0-1)"""
+        if self.total_analyses < 3:
+            return 0.5
+        return 1.0 - (self.transitions / (len(self.recent_primaries) - 1))
+
 class Level5EmotionAnalyzer:
     """Seviye 5 Duygu Analizi Sistemi"""
     
-    def __init__(self):
-        self.emotion_history = []
+    def __init__(self, history_limit: int = 500, intensity_limit: int = 100, memory_limit: int = 50,
+                 analysis_cache_size: int = 256):
+        # Sabit kapasiteli halka tamponlar: uzun oturumlarda bellek sabit kalır
+        self.intensity_limit = intensity_limit
+        self.emotion_history = EmotionHistory(maxlen=history_limit)
         self.user_profile = {}
         self.emotion_patterns = {}
-        self.conversation_memory = []  # YENİ: Konuşma belleği
+        self.conversation_memory = deque(maxlen=memory_limit)  # YENİ: Konuşma belleği
+        self.statistics = EmotionStatistics()
         self.curiosity_level = 0.7  # YENİ: Merak seviyesi
         self.question_count = 0  # YENİ: Soru sayacı
+        # Geçmiş, profil ve bellek arka plan işçisi ile komut iş parçacığı arasında paylaşılır
+        self.lock = threading.RLock()
+        # Tekrarlanan ifadeler için metne bağlı analiz parçalarının LRU önbelleği
+        self.analysis_cache_size = analysis_cache_size
+        self.analysis_cache = OrderedDict()  # kırpılmış metin -> TextAnalysis
+        self.analysis_cache_hits = 0
+        self.analysis_cache_misses = 0
         self.initialize_advanced_models()
         
     def initialize_advanced_models(self):
@@ -68,10 +631,20 @@ class Level5EmotionAnalyzer:
         }
         
         self.turkish_emotion_lexicon = self.load_turkish_emotion_lexicon()
+        self.compile_lexicon()
+        self.scoring_engine = EmotionScoringEngine()
         self.self_awareness = self.define_ethical_bounds()
         
         # YENİ: Soru şablonları
         self.question_templates = self.initialize_question_templates()
+        self.response_templates = self.initialize_response_templates()
+        self.opening_questions = [
+            "Size nasıl yardımcı olabilirim?",
+            "Bugün nasılsınız?",
+            "Merak ettiğiniz bir konu var mı?",
+            "Sohbet etmek istediğiniz bir şey var mı?",
+            "Size ne hakkında soru sormamı istersiniz?"
+        ]
     
     def initialize_question_templates(self):
         """Soru şablonlarını başlat"""
@@ -188,6 +761,91 @@ class Level5EmotionAnalyzer:
         }
         return lexicon
     
+    def load_cue_phrases(self) -> Dict[str, List[str]]:
+        """Dilbilimsel ve bağlamsal ipucu kalıplarını yükle"""
+        return {
+            "negations": ["değil", "yok", "hayır", "olmaz", "olmamış", "olmamalı", "değil mi"],
+            "intensifiers": ["çok", "aşırı", "fazla", "çokça", "son derece", "feci", "müthiş", "inanılmaz", "harika"],
+            "irony_indicators": ["müthiş", "harika", "süper", "çok güzel"],
+            "irony_negations": ["değil", "yok", "ama", "fakat"],
+            "sarcasm_patterns": ["tabi canım", "elbette", "ne sandın", "tabii ki"],
+            "metaphor_indicators": ["kalbim", "ruhum", "içim", "derin", "yürek"],
+            "entertainment_words": ["video", "müzik", "şarkı", "film"],
+            "problem_words": ["yardım", "problem", "sorun", "hata"]
+        }
+    
+    def load_topic_keywords(self) -> Dict[str, List[str]]:
+        """Konu anahtar kelimelerini yükle"""
+        return {
+            "teknoloji": ["bilgisayar", "telefon", "yazılım", "internet", "wifi", "teknoloji"],
+            "müzik": ["şarkı", "müzik", "albüm", "sanatçı", "çal", "dinle"],
+            "film": ["film", "dizi", "netflix", "youtube", "izle", "video"],
+            "spor": ["spor", "futbol", "maç", "takım", "oyun"],
+            "eğitim": ["öğren", "okul", "ders", "çalış", "kitap"],
+            "kişisel": ["aile", "arkadaş", "sevgi", "duygu", "mutlu", "üzgün"],
+            "günlük": ["yemek", "uyku", "alışveriş", "plan", "program"]
+        }
+    
+    def compile_lexicon(self):
+        """Duygu sözlüğünü ve ipucu kalıplarını tek bir otomata derle"""
+        self.cue_phrases = self.load_cue_phrases()
+        self.topic_keywords = self.load_topic_keywords()
+        
+        self.lexicon_words = list(self.turkish_emotion_lexicon)
+        
+        # Sözlük skorlarını enum değerlerine bir kez çevir; bilinmeyen anahtarlar atlanır
+        self.lexicon_scores = []
+        for word in self.lexicon_words:
+            self.lexicon_scores.append([
+                (EMOTION_INDEX[emotion].value, score)
+                for emotion, score in self.turkish_emotion_lexicon[word].items()
+                if emotion in EMOTION_INDEX
+            ])
+        
+        cue_patterns = []
+        for phrases in list(self.cue_phrases.values()) + list(self.topic_keywords.values()):
+            for phrase in phrases:
+                if phrase not in cue_patterns:
+                    cue_patterns.append(phrase)
+        
+        # İlk len(lexicon_words) kalıp sözlük, kalanlar ipucu kalıplarıdır
+        self.text_matcher = AhoCorasickMatcher(self.lexicon_words + cue_patterns)
+        self._last_text_features = None
+    
+    def build_text_features(self, text: str) -> TextFeatures:
+        """Metni bir kez böl ve tara; tüm katmanların okuyacağı kaydı üret"""
+        last = self._last_text_features
+        if last is not None and last.text == text:
+            return last
+        
+        text_lower = text.lower()
+        lexicon_size = len(self.lexicon_words)
+        patterns = self.text_matcher.patterns
+        lexicon_matches = []
+        cue_counts = {}
+        cue_ends = {}
+        
+        for start, index in self.text_matcher.iter_matches(text_lower):
+            if index < lexicon_size:
+                lexicon_matches.append((start, index))
+                continue
+            # str.count ile aynı: aynı kalıbın çakışan geçişlerini sayma
+            phrase = patterns[index]
+            if start >= cue_ends.get(phrase, 0):
+                cue_counts[phrase] = cue_counts.get(phrase, 0) + 1
+                cue_ends[phrase] = start + len(phrase)
+        
+        features = TextFeatures(
+            text=text,
+            text_lower=text_lower,
+            words=text.split(),
+            word_spans=[(match.start(), match.end()) for match in re.finditer(r"\S+", text_lower)],
+            lexicon_matches=lexicon_matches,
+            cue_counts=cue_counts
+        )
+        self._last_text_features = features
+        return features
+    
     def define_ethical_bounds(self) -> Dict[str, Any]:
         """Etik sınırları tanımla"""
         return {
@@ -203,120 +861,280 @@ class Level5EmotionAnalyzer:
         if context is None:
             context = {}
         
-        # 1. Dilbilimsel Analiz
-        linguistic_features = self.extract_linguistic_features(text)
-        
-        # 2. Semantik Anlama
-        semantic_scores = self.analyze_semantics(text)
+        # 0-3. Bölme/tarama, dilbilimsel, semantik ve sözlük analizi (önbellekli)
+        analysis = self.analyze_text(text)
         
-        # 3. Duygu Sözlüğü Eşleştirme
-        emotion_scores = self.emotion_lexicon_matching(text)
-        
-        # 4. Bağlamsal Değerlendirme
-        context_scores = self.evaluate_context(text, context)
+        # 4. Bağlamsal Değerlendirme (saat her çağrıda; geçmişe bağlı kısım 6. adımda)
+        context_scores = self.evaluate_static_context(text, analysis.features)
         
         # 5. Çok Katmanlı Duygu Sınıflandırma
         final_analysis = self.multi_layer_classification(
-            linguistic_features,
-            semantic_scores,
-            emotion_scores,
+            analysis.linguistic_features,
+            analysis.semantic_scores,
+            analysis.emotion_scores,
             context_scores
         )
         
-        # 6. Tarihsel Bağlam Entegrasyonu
-        final_analysis = self.integrate_historical_context(final_analysis)
+        # 6-10. Geçmişe bağlı adımlar
+        return self.finalize_analysis(text, final_analysis, list(analysis.topics))
+    
+    def analyze_text(self, text: str) -> TextAnalysis:
+        """Metne bağlı analiz parçalarını önbellekten al ya da hesapla
+
+        Anahtar kırpılmış metindir; en son kullanılan analysis_cache_size
+        kayıt tutulur. İç boşluklar birleştirilmez: "son derece", "değil mi"
+        gibi çok kelimeli ipuçları boşluk sayısına duyarlıdır.
+        """
+        key = text.strip()
+        with self.lock:
+            cached = self.analysis_cache.get(key)
+            if cached is not None:
+                self.analysis_cache.move_to_end(key)
+                self.analysis_cache_hits += 1
+                return cached
+            self.analysis_cache_misses += 1
+        
+        features = self.build_text_features(key)
+        analysis = TextAnalysis(
+            features=features,
+            linguistic_features=self.extract_linguistic_features(key, features),
+            semantic_scores=self.analyze_semantics(key, features),
+            emotion_scores=self.emotion_lexicon_matching(key, features),
+            topics=self.extract_topics(key, features)
+        )
         
-        # 7. Kendini Düzelten Analiz
-        final_analysis = self.self_correcting_analysis(final_analysis)
+        if self.analysis_cache_size > 0:
+            with self.lock:
+                self.analysis_cache[key] = analysis
+                self.analysis_cache.move_to_end(key)
+                while len(self.analysis_cache) > self.analysis_cache_size:
+                    self.analysis_cache.popitem(last=False)
+        return analysis
+    
+    def analysis_cache_stats(self) -> Dict[str, Any]:
+        """Analiz önbelleği metrikleri (isabet oranı dahil)"""
+        with self.lock:
+            lookups = self.analysis_cache_hits + self.analysis_cache_misses
+            return {
+                "size": len(self.analysis_cache),
+                "capacity": self.analysis_cache_size,
+                "hits": self.analysis_cache_hits,
+                "misses": self.analysis_cache_misses,
+                "hit_ratio": round(self.analysis_cache_hits / lookups, 4) if lookups else 0.0
+            }
+    
+    def finalize_analysis(self, text: str, analysis: EmotionalState, topics: List[str],
+                          update_state: bool = True) -> EmotionalState:
+        """Sıraya bağlı adımları uygula: geçmiş, düzeltme ve (isteğe bağlı) kayıt"""
+        with self.lock:
+            # 6. Tarihsel Bağlam Entegrasyonu
+            self.apply_history_context(analysis.context_score)
+            analysis = self.integrate_historical_context(analysis)
+            
+            # 7. Kendini Düzelten Analiz
+            analysis = self.self_correcting_analysis(analysis)
+            
+            if update_state:
+                # 8. Duygu durumunu kaydet
+                self.emotion_history.append(analysis)
+                
+                # 9. Kullanıcı profilini güncelle
+                self.update_user_profile(analysis)
+                
+                # 10. Konuşmayı belleğe kaydet
+                self.store_conversation_memory(text, analysis, topics)
         
-        # 8. Duygu durumunu kaydet
-        self.emotion_history.append(final_analysis)
+        return analysis
+    
+    def classify_many(self, texts: List[str], hour: Optional[int] = None) -> List[Tuple[EmotionalState, List[str]]]:
+        """Durumsuz adımları (1-5) bir grup metin için çalıştır
+
+        Aynı metinler bir kez bölünüp taranır ve tüm grup tek skor
+        matrisiyle sınıflandırılır. Geçmiş ve profil okunmaz/değiştirilmez;
+        sonuçlar (analiz, konular) çiftleri olarak döner.
+        """
+        if hour is None:
+            hour = datetime.datetime.now().hour
+        
+        prepared = {}
+        rows = []
+        for text in texts:
+            entry = prepared.get(text)
+            if entry is None:
+                analysis = self.analyze_text(text)
+                entry = (
+                    analysis.linguistic_features,
+                    analysis.semantic_scores,
+                    [analysis.emotion_scores[value] for value in EMOTION_VALUES],
+                    self.evaluate_static_context(text, analysis.features, hour),
+                    analysis.topics
+                )
+                prepared[text] = entry
+            rows.append(entry)
+        
+        scored = self.scoring_engine.score_batch(
+            [entry[2] for entry in rows],
+            [entry[0]["word_count"] for entry in rows],
+            [entry[0]["negations"] for entry in rows],
+            [entry[3].get("night_time", 0) > 0.5 for entry in rows]
+        )
         
-        # 9. Kullanıcı profilini güncelle
-        self.update_user_profile(final_analysis)
+        results = []
+        for (linguistic_features, semantic_scores, _, context_scores, topics), row_scored in zip(rows, scored):
+            analysis = self.build_emotional_state(
+                row_scored, linguistic_features, semantic_scores, dict(context_scores)
+            )
+            results.append((analysis, list(topics)))
+        return results
+    
+    def analyze_many(self, texts: Iterable[str], update_state: bool = False) -> EmotionBatch:
+        """Birden çok metni toplu analiz et ve sütun tabanlı sonuç döndür
+
+        update_state=True ise geçmiş, profil ve bellek güncellemeleri grup
+        sonunda sırayla uygulanır (analyze_with_context döngüsüyle aynı
+        sonuç). False ise her ifade mevcut geçmişe göre değerlendirilir ve
+        analizör durumu değişmez. İfade başına bağlam alınmaz:
+        analyze_with_context'in context sözlüğü hiçbir aşamada okunmaz.
+        """
+        texts = list(texts)
+        batch = EmotionBatch.empty()
         
-        # 10. Konuşmayı belleğe kaydet
-        self.store_conversation_memory(text, final_analysis)
+        for text, (analysis, topics) in zip(texts, self.classify_many(texts)):
+            analysis = self.finalize_analysis(text, analysis, topics, update_state)
+            batch.append(analysis, topics)
         
-        return final_analysis
+        return batch
     
-    def store_conversation_memory(self, text: str, analysis: EmotionalState):
+    # Akış hattı: her aşama bir üreteç; tüketici çektikçe ilerler (geri basınç)
+    
+    def iter_text_analyses(self, texts: Iterable[str]) -> Iterator[Tuple[str, TextAnalysis]]:
+        """Akış aşaması 1: bölme/tarama ve metne bağlı katmanlar (önbellekli)
+
+        Uzun transkriptlerde tekrarlanan ifadeler analyze_text önbelleğinden gelir.
+        """
+        for text in texts:
+            yield text, self.analyze_text(text)
+    
+    def iter_context_scores(self, items: Iterable[Tuple[str, TextAnalysis]]
+                            ) -> Iterator[Tuple[str, TextAnalysis, Dict[str, float]]]:
+        """Akış aşaması 2: saat ve sosyal bağlam skorları"""
+        for text, analysis in items:
+            yield text, analysis, self.evaluate_static_context(text, analysis.features)
+    
+    def iter_classifications(self, items: Iterable[Tuple[str, TextAnalysis, Dict[str, float]]]
+                             ) -> Iterator[Tuple[str, EmotionalState, List[str]]]:
+        """Akış aşaması 3: sınıflandırma ve sıraya bağlı adımlar
+
+        Geçmiş halka tamponlarda tutulduğundan girdi ne kadar uzun olursa
+        olsun tutulan durum sabit kalır.
+        """
+        for text, analysis, context_scores in items:
+            classified = self.multi_layer_classification(
+                analysis.linguistic_features,
+                analysis.semantic_scores,
+                analysis.emotion_scores,
+                context_scores
+            )
+            topics = list(analysis.topics)
+            yield text, self.finalize_analysis(text, classified, topics), topics
+    
+    def stream_analyses(self, texts: Iterable[str]) -> Iterator[Tuple[str, EmotionalState, List[str]]]:
+        """Metin akışını sınırlı bellekle analiz et (aşamaları zincirle)"""
+        return self.iter_classifications(
+            self.iter_context_scores(self.iter_text_analyses(texts))
+        )
+    
+    def store_conversation_memory(self, text: str, analysis: EmotionalState,
+                                  topics: Optional[List[str]] = None):
         """Konuşmayı belleğe kaydet"""
+        if topics is None:
+            topics = self.extract_topics(text)
         memory_entry = {
             "text": text[:200],  # İlk 200 karakter
             "emotion": analysis.primary_emotion.value,
             "intensity": analysis.intensity,
             "timestamp": time.time(),
-            "topics": self.extract_topics(text)
+            "topics": topics
         }
+        # Bellek sınırı: halka tampon en eski kaydı kendiliğinden düşürür
         self.conversation_memory.append(memory_entry)
-        
-        # Bellek sınırı
-        if len(self.conversation_memory) > 50:
-            self.conversation_memory = self.conversation_memory[-50:]
+        self.statistics.record_memory(memory_entry)
     
-    def extract_topics(self, text: str) -> List[str]:
+    def extract_topics(self, text: str, features: Optional[TextFeatures] = None) -> List[str]:
         """Metinden konuları çıkar"""
-        topics = []
-        text_lower = text.lower()
-        
-        topic_keywords = {
-            "teknoloji": ["bilgisayar", "telefon", "yazılım", "internet", "wifi", "teknoloji"],
-            "müzik": ["şarkı", "müzik", "albüm", "sanatçı", "çal", "dinle"],
-            "film": ["film", "dizi", "netflix", "youtube", "izle", "video"],
-            "spor": ["spor", "futbol", "maç", "takım", "oyun"],
-            "eğitim": ["öğren", "okul", "ders", "çalış", "kitap"],
-            "kişisel": ["aile", "arkadaş", "sevgi", "duygu", "mutlu", "üzgün"],
-            "günlük": ["yemek", "uyku", "alışveriş", "plan", "program"]
-        }
+        if features is None:
+            features = self.build_text_features(text)
+        cue_counts = features.cue_counts
         
-        for topic, keywords in topic_keywords.items():
-            if any(keyword in text_lower for keyword in keywords):
+        topics = []
+        for topic, keywords in self.topic_keywords.items():
+            if any(keyword in cue_counts for keyword in keywords):
                 topics.append(topic)
         
         return topics[:3]
     
-    def extract_linguistic_features(self, text: str) -> Dict[str, Any]:
+    def extract_linguistic_features(self, text: str,
+                                    features: Optional[TextFeatures] = None) -> Dict[str, Any]:
         """Dilbilimsel özellikleri çıkar"""
-        features = {
-            "word_count": len(text.split()),
+        if features is None:
+            features = self.build_text_features(text)
+        
+        linguistic_features = {
+            "word_count": len(features.words),
             "sentence_complexity": self.calculate_sentence_complexity(text),
-            "emotional_words": self.find_emotional_words(text),
-            "negations": self.count_negations(text),
-            "intensifiers": self.find_intensifiers(text),
+            "emotional_words": self.find_emotional_words(text, features),
+            "negations": self.count_negations(text, features),
+            "intensifiers": self.find_intensifiers(text, features),
             "punctuation_pattern": self.analyze_punctuation(text),
-            "capitalization_pattern": self.analyze_capitalization(text),
-            "word_order_emotionality": self.analyze_word_order(text)
+            "capitalization_pattern": self.analyze_capitalization(text, features),
+            "word_order_emotionality": self.analyze_word_order(text, features)
         }
-        return features
+        return linguistic_features
     
-    def find_emotional_words(self, text: str) -> List[Tuple[str, str]]:
+    def find_emotional_words(self, text: str,
+                             features: Optional[TextFeatures] = None) -> List[Tuple[str, str]]:
         """Metindeki duygusal kelimeleri bul"""
-        words = text.lower().split()
-        emotional_words = []
+        if features is None:
+            features = self.build_text_features(text)
+        text_lower = features.text_lower
+        spans = features.word_spans
+        if not spans:
+            return []
+        
+        # Eşleşmeleri içinde tamamen kaldıkları kelimeye ata
+        starts = [start for start, _ in spans]
+        word_matches = {}
+        for start, index in features.lexicon_matches:
+            position = bisect_right(starts, start) - 1
+            if position >= 0 and start + len(self.lexicon_words[index]) <= spans[position][1]:
+                word_matches.setdefault(position, set()).add(index)
         
-        for word in words:
-            for emotion_word, emotions in self.turkish_emotion_lexicon.items():
-                if emotion_word in word:
-                    for emotion in emotions.keys():
-                        emotional_words.append((word, emotion))
+        emotional_words = []
+        for position in sorted(word_matches):
+            start, end = spans[position]
+            word = text_lower[start:end]
+            for index in sorted(word_matches[position]):
+                for emotion in self.turkish_emotion_lexicon[self.lexicon_words[index]].keys():
+                    emotional_words.append((word, emotion))
         
         return emotional_words
     
-    def count_negations(self, text: str) -> int:
+    def count_negations(self, text: str, features: Optional[TextFeatures] = None) -> int:
         """Olumsuzluk ifadelerini say"""
-        negations = ["değil", "yok", "hayır", "olmaz", "olmamış", "olmamalı", "değil mi"]
+        if features is None:
+            features = self.build_text_features(text)
         count = 0
-        for negation in negations:
-            count += text.lower().count(negation)
+        for negation in self.cue_phrases["negations"]:
+            count += features.cue_counts.get(negation, 0)
         return count
     
-    def find_intensifiers(self, text: str) -> List[str]:
+    def find_intensifiers(self, text: str, features: Optional[TextFeatures] = None) -> List[str]:
         """Yoğunlaştırıcı kelimeleri bul"""
-        intensifiers = ["çok", "aşırı", "fazla", "çokça", "son derece", "feci", "müthiş", "inanılmaz", "harika"]
+        if features is None:
+            features = self.build_text_features(text)
         found = []
-        for intensifier in intensifiers:
-            if intensifier in text.lower():
+        for intensifier in self.cue_phrases["intensifiers"]:
+            if intensifier in features.cue_counts:
                 found.append(intensifier)
         return found
     
@@ -329,12 +1147,13 @@ class Level5EmotionAnalyzer:
             "period": text.count(".")
         }
     
-    def analyze_capitalization(self, text: str) -> Dict[str, Any]:
+    def analyze_capitalization(self, text: str,
+                               features: Optional[TextFeatures] = None) -> Dict[str, Any]:
         """Büyük harf kullanımını analiz et"""
         if not text.strip():
             return {"capital_ratio": 0, "has_all_caps": False}
         
-        words = text.split()
+        words = features.words if features is not None else text.split()
         if not words:
             return {"capital_ratio": 0, "has_all_caps": False}
         
@@ -344,11 +1163,18 @@ class Level5EmotionAnalyzer:
             "has_all_caps": any(word.isupper() for word in words)
         }
     
-    def analyze_word_order(self, text: str) -> float:
+    def analyze_word_order(self, text: str, features: Optional[TextFeatures] = None) -> float:
         """Kelime sırasının duygusal etkisini analiz et"""
         emotional_first_words = ["keşke", "keşki", "ah", "vah", "off", "eyvah", "aman", "lütfen"]
-        words = text.lower().split()
-        if words and words[0] in emotional_first_words:
+        if features is not None:
+            if not features.word_spans:
+                return 0.3
+            start, end = features.word_spans[0]
+            first_word = features.text_lower[start:end]
+        else:
+            words = text.lower().split()
+            first_word = words[0] if words else None
+        if first_word in emotional_first_words:
             return 0.8
         return 0.3
     
@@ -361,21 +1187,17 @@ class Level5EmotionAnalyzer:
         avg_words = sum(len(s.split()) for s in sentences) / len(sentences)
         return min(avg_words / 20, 1.0)  # 0-1 arası normalize
     
-    def emotion_lexicon_matching(self, text: str) -> Dict[str, float]:
+    def emotion_lexicon_matching(self, text: str,
+                                 features: Optional[TextFeatures] = None) -> Dict[str, float]:
         """Duygu sözlüğü eşleştirmesi"""
-        text_lower = text.lower()
-        emotion_scores = {emotion.value: 0.0 for emotion in Emotion}
-        
-        for word, emotions in self.turkish_emotion_lexicon.items():
-            if word in text_lower:
-                for emotion, score in emotions.items():
-                    try:
-                        # Emotion enum değerine çevir
-                        emotion_enum = next(e for e in Emotion if e.value == emotion)
-                        emotion_scores[emotion_enum.value] += score
-                    except (ValueError, StopIteration):
-                        # Eğer eşleşme yoksa devam et
-                        pass
+        if features is None:
+            features = self.build_text_features(text)
+        emotion_scores = dict.fromkeys(EMOTION_VALUES, 0.0)
+        
+        matched = sorted({index for _, index in features.lexicon_matches})
+        for index in matched:
+            for emotion_value, score in self.lexicon_scores[index]:
+                emotion_scores[emotion_value] += score
         
         # Normalize scores
         total = sum(emotion_scores.values())
@@ -384,35 +1206,47 @@ class Level5EmotionAnalyzer:
         
         return emotion_scores
     
-    def analyze_semantics(self, text: str) -> Dict[str, float]:
+    def analyze_semantics(self, text: str, features: Optional[TextFeatures] = None) -> Dict[str, float]:
         """Semantik analiz yap"""
+        if features is None:
+            features = self.build_text_features(text)
+        cue_counts = features.cue_counts
         semantic_scores = {}
         
         # İroni tespiti
-        irony_indicators = ["müthiş", "harika", "süper", "çok güzel"]
-        has_irony = any(indicator in text.lower() for indicator in irony_indicators) and \
-                   any(neg in text.lower() for neg in ["değil", "yok", "ama", "fakat"])
+        has_irony = any(indicator in cue_counts for indicator in self.cue_phrases["irony_indicators"]) and \
+                   any(neg in cue_counts for neg in self.cue_phrases["irony_negations"])
         
         semantic_scores["irony"] = 0.8 if has_irony else 0.0
         
         # Sarcasm detection
-        sarcasm_patterns = ["tabi canım", "elbette", "ne sandın", "tabii ki"]
-        has_sarcasm = any(pattern in text.lower() for pattern in sarcasm_patterns)
+        has_sarcasm = any(pattern in cue_counts for pattern in self.cue_phrases["sarcasm_patterns"])
         semantic_scores["sarcasm"] = 0.9 if has_sarcasm else 0.0
         
         # Metaphor detection
-        metaphor_indicators = ["kalbim", "ruhum", "içim", "derin", "yürek"]
-        metaphor_count = sum(1 for indicator in metaphor_indicators if indicator in text.lower())
+        metaphor_count = sum(1 for indicator in self.cue_phrases["metaphor_indicators"] if indicator in cue_counts)
         semantic_scores["metaphor"] = min(metaphor_count * 0.2, 1.0)
         
         return semantic_scores
     
-    def evaluate_context(self, text: str, context: Dict) -> Dict[str, float]:
+    def evaluate_context(self, text: str, context: Dict,
+                         features: Optional[TextFeatures] = None) -> Dict[str, float]:
         """Bağlamsal değerlendirme yap"""
+        context_scores = self.evaluate_static_context(text, features)
+        self.apply_history_context(context_scores)
+        return context_scores
+    
+    def evaluate_static_context(self, text: str, features: Optional[TextFeatures] = None,
+                                hour: Optional[int] = None) -> Dict[str, float]:
+        """Geçmişe bağlı olmayan bağlam skorları (zaman ve sosyal bağlam)"""
+        if features is None:
+            features = self.build_text_features(text)
+        cue_counts = features.cue_counts
         context_scores = {}
         
         # Zaman bağlamı
-        hour = datetime.datetime.now().hour
+        if hour is None:
+            hour = datetime.datetime.now().hour
         if 22 <= hour <= 6:  # Gece saatleri
             context_scores["night_time"] = 0.7
             context_scores["emotional_vulnerability"] = 0.6
@@ -420,13 +1254,16 @@ class Level5EmotionAnalyzer:
             context_scores["day_time"] = 0.7
         
         # Sosyal bağlam
-        if any(word in text.lower() for word in ["video", "müzik", "şarkı", "film"]):
+        if any(word in cue_counts for word in self.cue_phrases["entertainment_words"]):
             context_scores["entertainment_context"] = 0.8
         
-        if any(word in text.lower() for word in ["yardım", "problem", "sorun", "hata"]):
+        if any(word in cue_counts for word in self.cue_phrases["problem_words"]):
             context_scores["problem_solving_context"] = 0.9
         
-        # Geçmiş etkileşimler
+        return context_scores
+    
+    def apply_history_context(self, context_scores: Dict[str, float]) -> Dict[str, float]:
+        """Geçmiş etkileşimlere bağlı bağlam skorlarını ekle"""
         if self.emotion_history:
             last_emotion = self.emotion_history[-1].primary_emotion
             if last_emotion == Emotion.SADNESS:
@@ -438,32 +1275,25 @@ class Level5EmotionAnalyzer:
                                   emotion_scores, context_scores) -> EmotionalState:
         """Çok katmanlı duygu sınıflandırma"""
         
-        # 1. Temel duygu skorlarını hesapla
-        weighted_scores = {}
-        
-        for emotion_value, score in emotion_scores.items():
-            if score == 0:
-                continue
-                
-            # Dilbilimsel özelliklerle ağırlıklandır
-            linguistic_weight = 1.0
-            if linguistic_features["word_count"] > 10:
-                linguistic_weight *= 1.2
-            if linguistic_features["negations"] > 0:
-                # Olumsuzluk varsa üzüntü/öfke ağırlığını artır
-                if emotion_value in [Emotion.SADNESS.value, Emotion.ANGER.value, Emotion.FEAR.value]:
-                    linguistic_weight *= 1.3
-            
-            # Bağlamsal ağırlıklandırma
-            context_weight = 1.0
-            if "night_time" in context_scores and context_scores["night_time"] > 0.5:
-                if emotion_value in [Emotion.SADNESS.value, Emotion.FEAR.value]:
-                    context_weight *= 1.4
-            
-            weighted_scores[emotion_value] = score * linguistic_weight * context_weight
+        # 1. Temel duygu skorlarını Emotion ekseninde ağırlıklandır
+        score_row = [emotion_scores.get(value, 0.0) for value in EMOTION_VALUES]
+        night = "night_time" in context_scores and context_scores["night_time"] > 0.5
+        scored = self.scoring_engine.score_batch(
+            [score_row],
+            [linguistic_features["word_count"]],
+            [linguistic_features["negations"]],
+            [night]
+        )[0]
+        
+        return self.build_emotional_state(scored, linguistic_features, semantic_scores, context_scores)
+    
+    def build_emotional_state(self, scored: Tuple[Optional[int], List[int], float],
+                              linguistic_features, semantic_scores, context_scores) -> EmotionalState:
+        """Skor motoru sonucundan EmotionalState oluştur"""
+        primary_position, secondary_positions, top_score = scored
         
         # Eğer hiç skor yoksa, nötr döndür
-        if not weighted_scores:
+        if primary_position is None:
             return EmotionalState(
                 primary_emotion=Emotion.NEUTRAL,
                 secondary_emotions=[],
@@ -475,33 +1305,19 @@ class Level5EmotionAnalyzer:
             )
         
         # 2. Birincil duyguyu belirle
-        primary_emotion_value = max(weighted_scores, key=weighted_scores.get)
-        try:
-            primary_emotion = Emotion(primary_emotion_value)
-        except ValueError:
-            primary_emotion = Emotion.NEUTRAL
+        primary_emotion = EMOTION_AXIS[primary_position]
         
-        # 3. İkincil duyguları belirle
-        sorted_emotions = sorted(weighted_scores.items(), key=lambda x: x[1], reverse=True)
-        secondary_emotions = []
-        
-        for emotion_value, score in sorted_emotions[1:4]:  # İlk 3 ikincil duygu
-            if score > 0.1:  # Eşik değeri
-                try:
-                    emotion = Emotion(emotion_value)
-                    if emotion != primary_emotion:
-                        secondary_emotions.append(emotion)
-                except ValueError:
-                    continue
+        # 3. İkincil duyguları belirle (en fazla 3, eşik üstü)
+        secondary_emotions = [EMOTION_AXIS[position] for position in secondary_positions]
         
         # 4. Yoğunluk hesapla
-        intensity = min(weighted_scores[primary_emotion_value] * 1.5, 1.0)
+        intensity = min(top_score * 1.5, 1.0)
         
         # 5. Güven skoru hesapla
         confidence = self.calculate_confidence(
             linguistic_features, 
             semantic_scores, 
-            max(weighted_scores.values())
+            top_score
         )
         
         # 6. Tetikleyicileri belirle
@@ -540,18 +1356,17 @@ class Level5EmotionAnalyzer:
             return current_analysis
         
         # Son 5 analizi al
-        recent_history = self.emotion_history[-5:]
+        recent_count = min(len(self.emotion_history), 5)
         
         # Duygu trendini analiz et
         emotion_counts = {}
-        for analysis in recent_history:
-            emotion = analysis.primary_emotion
+        for emotion in self.emotion_history.recent_primaries(5):
             emotion_counts[emotion] = emotion_counts.get(emotion, 0) + 1
         
         # Eğer belirgin bir trend varsa, bunu dikkate al
-        if len(recent_history) >= 3:
+        if recent_count >= 3:
             most_common_emotion = max(emotion_counts, key=emotion_counts.get)
-            if emotion_counts[most_common_emotion] >= len(recent_history) * 0.6:
+            if emotion_counts[most_common_emotion] >= recent_count * 0.6:
                 # Trendi güçlendir
                 if current_analysis.primary_emotion == most_common_emotion:
                     current_analysis.intensity = min(current_analysis.intensity * 1.2, 1.0)
@@ -589,21 +1404,17 @@ class Level5EmotionAnalyzer:
         
         # Duygu yoğunluk ortalamasını güncelle
         if "intensity_history" not in self.user_profile:
-            self.user_profile["intensity_history"] = []
+            self.user_profile["intensity_history"] = deque(maxlen=self.intensity_limit)
         
         self.user_profile["intensity_history"].append(analysis.intensity)
         
-        # Son 10 ortalamayı hesapla
-        recent_intensities = self.user_profile["intensity_history"][-10:]
-        if recent_intensities:
-            self.user_profile["avg_intensity"] = sum(recent_intensities) / len(recent_intensities)
-        else:
-            self.user_profile["avg_intensity"] = 0
+        # Son 10 ortalamayı artımlı istatistiklerden al
+        self.statistics.record_analysis(analysis)
+        self.user_profile["avg_intensity"] = self.statistics.average_intensity()
     
-    def generate_emotional_response(self, analysis: EmotionalState, original_command: str) -> str:
-        """Duygu analizine göre akıllı yanıt oluştur"""
-        
-        response_templates = {
+    def initialize_response_templates(self) -> Dict[Emotion, List[str]]:
+        """Duygu yanıt şablonlarını başlat"""
+        return {
             Emotion.JOY: [
                 "Neşeni hissediyorum, bu çok güzel!",
                 "Mutluluğun bulaşıcı, seninle aynı enerjiyi paylaşmak harika!",
@@ -640,6 +1451,18 @@ class Level5EmotionAnalyzer:
                 "Peki."
             ]
         }
+    
+    def canned_phrases(self) -> List[str]:
+        """Seslendirilebilecek tüm sabit soru ve yanıt metinleri"""
+        phrases = list(self.opening_questions)
+        for templates in self.question_templates.values():
+            phrases.extend(templates)
+        for templates in self.response_templates.values():
+            phrases.extend(templates)
+        return phrases
+    
+    def generate_emotional_response(self, analysis: EmotionalState, original_command: str) -> str:
+        """Duygu analizine göre akıllı yanıt oluştur"""
         
         # Yoğunluğa göre tepkiyi ayarla
         intensity_modifier = ""
@@ -649,8 +1472,8 @@ class Level5EmotionAnalyzer:
             intensity_modifier = " Bu duygu hafif görünüyor."
         
         # Birincil duygu için şablon seç
-        if analysis.primary_emotion in response_templates:
-            templates = response_templates[analysis.primary_emotion]
+        if analysis.primary_emotion in self.response_templates:
+            templates = self.response_templates[analysis.primary_emotion]
             response = random.choice(templates)
         else:
             response = "Anlıyorum."
@@ -673,38 +1496,32 @@ class Level5EmotionAnalyzer:
         # Duygu analizi yap
         emotion_analysis = self.analyze_with_context(user_input)
         
-        # Konu analizi
-        topics = self.extract_topics(user_input)
+        with self.lock:
+            # Konu analizi
+            topics = self.analyze_text(user_input).topics
         
-        # Eğer konuşma belleği boşsa veya ilk konuşmalardaysa
-        if len(self.conversation_memory) < 3:
-            return self.generate_opening_question()
+            # Eğer konuşma belleği boşsa veya ilk konuşmalardaysa
+            if len(self.conversation_memory) < 3:
+                return self.generate_opening_question()
         
-        # Merak seviyesine göre soru sorma kararı
-        if random.random() > self.curiosity_level:
-            return None
+            # Merak seviyesine göre soru sorma kararı
+            if random.random() > self.curiosity_level:
+                return None
         
-        # Duyguya göre soru tipi seç
-        question_type = self.select_question_type(emotion_analysis, topics)
+            # Duyguya göre soru tipi seç
+            question_type = self.select_question_type(emotion_analysis, topics)
         
-        # Soru oluştur
-        question = self.create_question(user_input, question_type, topics)
+            # Soru oluştur
+            question = self.create_question(user_input, question_type, topics)
         
-        if question:
-            self.question_count += 1
+            if question:
+                self.question_count += 1
         
-        return question
+            return question
     
     def generate_opening_question(self) -> str:
         """Açılış sorusu üret"""
-        opening_questions = [
-            "Size nasıl yardımcı olabilirim?",
-            "Bugün nasılsınız?",
-            "Merak ettiğiniz bir konu var mı?",
-            "Sohbet etmek istediğiniz bir şey var mı?",
-            "Size ne hakkında soru sormamı istersiniz?"
-        ]
-        return random.choice(opening_questions)
+        return random.choice(self.opening_questions)
     
     def select_question_type(self, analysis: EmotionalState, topics: List[str]) -> str:
         """Soru tipi seç"""
@@ -733,7 +1550,7 @@ class Level5EmotionAnalyzer:
         
         # Önceki konuşmalardan referans
         if self.conversation_memory and random.random() < 0.3:
-            prev_memory = random.choice(self.conversation_memory[-3:])
+            prev_memory = random.choice(recent_items(self.conversation_memory, 3))
             if "konu" in prev_memory["topics"]:
                 template += f" Daha önce {prev_memory['topics'][0]} hakkında konuşmuştuk."
         
@@ -742,138 +1559,1621 @@ class Level5EmotionAnalyzer:
     def generate_reflective_response(self, user_input: str) -> str:
         """Yansıtıcı yanıt oluştur"""
         
-        # Önceki konuşmaları analiz et
-        if len(self.conversation_memory) > 5:
-            # Ortak konuları bul
-            all_topics = []
-            for memory in self.conversation_memory[-5:]:
-                all_topics.extend(memory.get("topics", []))
-            
-            if all_topics:
-                from collections import Counter
-                topic_counts = Counter(all_topics)
-                common_topic = topic_counts.most_common(1)[0][0] if topic_counts else None
+        with self.lock:
+            # Önceki konuşmaları analiz et
+            if len(self.conversation_memory) > 5:
+                # Ortak konuları bul (son 5 kayıt, artımlı sayaç)
+                topic_counts = self.statistics.reflection_topics.most_common(1)
+                if topic_counts:
+                    common_topic = topic_counts[0][0]
                 
-                if common_topic:
-                    reflections = [
-                        f"Son zamanlarda {common_topic} hakkında çok konuşuyoruz.",
-                        f"{common_topic} konusu size önemli görünüyor.",
-                        f"{common_topic} hakkında konuşmak bana ilginç geliyor."
-                    ]
-                    return random.choice(reflections)
+                    if common_topic:
+                        reflections = [
+                            f"Son zamanlarda {common_topic} hakkında çok konuşuyoruz.",
+                            f"{common_topic} konusu size önemli görünüyor.",
+                            f"{common_topic} hakkında konuşmak bana ilginç geliyor."
+                        ]
+                        return random.choice(reflections)
         
-        return ""
+            return ""
     
     def get_conversation_summary(self) -> Dict[str, Any]:
         """Konuşma özetini al"""
-        if not self.conversation_memory:
-            return {"status": "no_data"}
-        
-        # Son 10 konuşmayı analiz et
-        recent_memories = self.conversation_memory[-10:] if len(self.conversation_memory) > 10 else self.conversation_memory
-        
-        # Konu analizi
-        all_topics = []
-        for memory in recent_memories:
-            all_topics.extend(memory.get("topics", []))
-        
-        # Duygu analizi
-        emotions = [memory.get("emotion", "nötr") for memory in recent_memories]
-        
-        from collections import Counter
-        topic_counts = Counter(all_topics)
-        emotion_counts = Counter(emotions)
-        
-        return {
-            "total_conversations": len(self.conversation_memory),
-            "recent_topics": topic_counts.most_common(3),
-            "recent_emotions": emotion_counts.most_common(3),
-            "questions_asked": self.question_count,
-            "conversation_depth": len(self.conversation_memory) // 10  # Her 10 konuşmada 1 derinlik
-        }
+        with self.lock:
+            if not self.conversation_memory:
+                return {"status": "no_data"}
+        
+            # Son 10 konuşmanın konu ve duygu sayıları artımlı tutulur
+            return {
+                "total_conversations": len(self.conversation_memory),
+                "recent_topics": self.statistics.summary_topics.most_common(3),
+                "recent_emotions": self.statistics.summary_emotions.most_common(3),
+                "questions_asked": self.question_count,
+                "conversation_depth": len(self.conversation_memory) // 10  # Her 10 konuşmada 1 derinlik
+            }
     
     def get_emotion_summary(self) -> Dict[str, Any]:
         """Duygu analizi özetini döndür"""
-        if not self.emotion_history:
-            return {"status": "no_data", "message": "Henüz analiz yapılmadı."}
-        
-        recent_analyses = self.emotion_history[-10:]  # Son 10 analiz
-        
-        summary = {
-            "total_analyses": len(self.emotion_history),
-            "recent_emotions": [
-                {
-                    "emotion": analysis.primary_emotion.value,
-                    "intensity": analysis.intensity,
-                    "time": datetime.datetime.fromtimestamp(analysis.timestamp).strftime('%H:%M:%S')
-                }
-                for analysis in recent_analyses
-            ],
-            "most_common_emotion": self._get_most_common_emotion(),
-            "emotional_patterns": self.user_profile.get("emotion_patterns", {}),
-            "avg_emotional_intensity": self.user_profile.get("avg_intensity", 0),
-            "emotional_stability_score": self._calculate_emotional_stability()
-        }
+        with self.lock:
+            if not self.emotion_history:
+                return {"status": "no_data", "message": "Henüz analiz yapılmadı."}
+        
+            recent_analyses = recent_items(self.emotion_history, 10)  # Son 10 analiz
+        
+            summary = {
+                "total_analyses": self.statistics.total_analyses,
+                "recent_emotions": [
+                    {
+                        "emotion": analysis.primary_emotion.value,
+                        "intensity": analysis.intensity,
+                        "time": datetime.datetime.fromtimestamp(analysis.timestamp).strftime('%H:%M:%S')
+                    }
+                    for analysis in recent_analyses
+                ],
+                "most_common_emotion": self._get_most_common_emotion(),
+                "emotional_patterns": self.user_profile.get("emotion_patterns", {}),
+                "avg_emotional_intensity": self.user_profile.get("avg_intensity", 0),
+                "emotional_stability_score": self._calculate_emotional_stability()
+            }
         
-        return summary
+            return summary
     
     def _get_most_common_emotion(self) -> str:
         """En sık görülen duyguyu bul"""
-        if not self.emotion_history:
-            return "bilinmiyor"
-        
-        emotion_counts = {}
-        for analysis in self.emotion_history:
-            emotion = analysis.primary_emotion.value
-            emotion_counts[emotion] = emotion_counts.get(emotion, 0) + 1
-        
-        if emotion_counts:
-            return max(emotion_counts, key=emotion_counts.get)
-        return "bilinmiyor"
+        return self.statistics.most_common_emotion()
     
     def _calculate_emotional_stability(self) -> float:
         """Duygusal stabilite skorunu hesapla"""
-        if len(self.emotion_history) < 3:
-            return 0.5
-        
-        recent_emotions = [analysis.primary_emotion for analysis in self.emotion_history[-5:]]
-        
-        # Aynı duygu ne kadar süre devam etti?
-        changes = 0
-        for i in range(1, len(recent_emotions)):
-            if recent_emotions[i] != recent_emotions[i-1]:
-                changes += 1
-        
-        stability = 1.0 - (changes / (len(recent_emotions) - 1))
-        return stability
+        # Aynı duygu ne kadar süre devam etti? (son 5 analizdeki geçişler)
+        return self.statistics.stability()
 
-# ==================== GÜNCELLENMİŞ JARVIS SINIFI ====================
+# ==================== SES SENTEZİ VE ÖNBELLEK ====================
 
-class Jarvis:
-    def __init__(self):
-        self.recognizer = sr.Recognizer()
-        self.is_listening = False
-        self.waiting_for_spell = False
-        self.waiting_for_platform = False
-        self.waiting_for_song = False
-        self.waiting_for_video = False
-        self.waiting_for_youtuber = False
-        self.waiting_for_search = False
-        self.current_platform = ""
-        self.sleep_mode = False
-        self.security_mode = False
-        self.last_motivation_time = 0
-        self.daily_questions_asked = False
-        self.music_playing = False
-        self.sleep_conversation_active = False
-        
-        # YENİ: Akıllı özellikler
-        self.keyboard_mode = False
-        self.deep_think_mode = True  # YENİ: Derin düşünme modu
-        self.auto_question_mode = True  # YENİ: Otomatik soru sorma modu
-        self.conversation_depth = 0  # YENİ: Konuşma derinliği
-        self.last_question_time = 0  # YENİ: Son soru zamanı
-        
+SENTENCE_BOUNDARY = re.compile(r'(?<=[.!?…])\s+')
+CLAUSE_BOUNDARY = re.compile(r'(?<=[,;:])\s+')
+
+def split_speech_chunks(text: str, max_chars: int = 120) -> List[str]:
+    """Metni cümle sınırlarından, uzun cümleleri de yan cümle sınırlarından böl"""
+    chunks = []
+    for sentence in SENTENCE_BOUNDARY.split(text.strip()):
+        if len(sentence) <= max_chars:
+            chunks.append(sentence)
+            continue
+        
+        current = ""
+        for clause in CLAUSE_BOUNDARY.split(sentence):
+            if current and len(current) + 1 + len(clause) > max_chars:
+                chunks.append(current)
+                current = clause
+            else:
+                current = f"{current} {clause}" if current else clause
+        chunks.append(current)
+    return [chunk for chunk in chunks if chunk]
+
+class GTTSSynthesizer:
+    """gTTS ile metni MP3 baytlarına çeviren sentezleyici (ağ gerektirir)"""
+    
+    name = "gtts"
+    format = "mp3"
+    
+    def __init__(self, timeout: float = 3.0):
+        self.timeout = timeout
+    
+    @property
+    def transport_errors(self) -> Tuple[type, ...]:
+        """Servise erişilemediğini gösteren hatalar (boş metin gibi girdi hataları hariç)"""
+        from gtts.tts import gTTSError
+        from requests import RequestException
+        return (gTTSError, RequestException, OSError)
+    
+    def synthesize(self, text: str, lang: str = "tr", slow: bool = False) -> bytes:
+        """Metni ses baytlarına çevir"""
+        buffer = io.BytesIO()
+        gTTS(text=text, lang=lang, slow=slow, timeout=self.timeout).write_to_fp(buffer)
+        return buffer.getvalue()
+
+class EspeakSynthesizer:
+    """espeak-ng ile yerel, çevrimdışı WAV sentezleyici"""
+    
+    name = "espeak"
+    format = "wav"
+    # Program yok, çöktü ya da zaman aşımı: arka uç kullanılamaz
+    transport_errors = (OSError, subprocess.SubprocessError)
+    
+    def __init__(self, executable: Optional[str] = None, timeout: float = 5.0):
+        self.executable = executable or shutil.which("espeak-ng") or shutil.which("espeak")
+        self.timeout = timeout
+    
+    @property
+    def available(self) -> bool:
+        return self.executable is not None
+    
+    def synthesize(self, text: str, lang: str = "tr", slow: bool = False) -> bytes:
+        """Metni ses baytlarına çevir"""
+        if not self.available:
+            raise FileNotFoundError("espeak bulunamadı")
+        command = [self.executable, "-v", lang, "--stdout", "--stdin"]
+        if slow:
+            command += ["-s", "120"]
+        # Metin stdin'den verilir: "-5 derece" gibi parçalar seçenek sanılmaz
+        result = subprocess.run(command, input=text.encode("utf-8"), capture_output=True,
+                                timeout=self.timeout, check=True)
+        return result.stdout
+
+class PrintSynthesizer:
+    """Son çare: ses üretmez, metin ekrana yazdırılır"""
+    
+    name = "print"
+    format = "text"
+    
+    def synthesize(self, text: str, lang: str = "tr", slow: bool = False) -> None:
+        return None
+
+class CircuitBreaker:
+    """Arka uç sağlık takibi
+
+    Art arda failure_threshold hatadan sonra devre açılır ve arka uç
+    cooldown saniye boyunca hiç denenmez. Süre dolunca tek bir deneme
+    çağrısına izin verilir (yarı açık); başarılıysa devre kapanır.
+    """
+    
+    CLOSED = "closed"
+    OPEN = "open"
+    HALF_OPEN = "half_open"
+    
+    def __init__(self, failure_threshold: int = 1, cooldown: float = 30.0, clock=time.monotonic):
+        self.failure_threshold = failure_threshold
+        self.cooldown = cooldown
+        self.clock = clock
+        self.state = self.CLOSED
+        self.failures = 0
+        self.opened_at = 0.0
+        self._lock = threading.Lock()
+    
+    def allow(self) -> bool:
+        """Arka uç şimdi denenebilir mi?"""
+        with self._lock:
+            if self.state == self.CLOSED:
+                return True
+            if self.state == self.OPEN and self.clock() - self.opened_at >= self.cooldown:
+                self.state = self.HALF_OPEN
+                return True
+            return False
+    
+    def record_success(self):
+        with self._lock:
+            self.failures = 0
+            self.state = self.CLOSED
+    
+    def record_failure(self):
+        with self._lock:
+            self.failures += 1
+            if self.state == self.HALF_OPEN or self.failures >= self.failure_threshold:
+                self.state = self.OPEN
+                self.opened_at = self.clock()
+    
+    def record_inconclusive(self):
+        """Girdi kaynaklı hata: sağlık bilgisi yok, yarı açık deneme hakkı geri verilir"""
+        with self._lock:
+            if self.state == self.HALF_OPEN:
+                self.state = self.OPEN
+
+class TTSCache:
+    """İçerik adresli, boyut sınırlı (LRU) kalıcı ses önbelleği
+
+    Anahtar (metin, dil, ses ayarları) üçlüsünün SHA-256 özetidir. Yazmalar
+    aynı dizinde geçici dosya + os.replace ile atomiktir; toplam boyut
+    sınırı aşılınca en uzun süre kullanılmayan kayıtlar silinir. Sık
+    kullanılan kayıtlar ayrıca bellekte tutulur, tekrar eden ifadeler diske
+    hiç dokunmadan çalınır.
+    """
+    
+    # Biçim (mp3/wav) anahtarın parçasıdır; dosya adı biçimden bağımsız kalır
+    SUFFIX = ".audio"
+    LEGACY_SUFFIXES = (".mp3",)
+    
+    def __init__(self, directory: Optional[str] = None, max_bytes: int = 200 * 1024 * 1024,
+                 memory_bytes: int = 16 * 1024 * 1024):
+        if directory is None:
+            directory = os.path.join(os.path.expanduser("~"), ".cache", "jarvis", "tts")
+        self.directory = directory
+        self.max_bytes = max_bytes
+        self._entries = OrderedDict()  # anahtar -> boyut, en eski kullanım başta
+        self._total_bytes = 0
+        self.memory_bytes = memory_bytes
+        self._memory = OrderedDict()   # anahtar -> ses baytları
+        self._memory_total = 0
+        self._lock = threading.Lock()
+        os.makedirs(self.directory, exist_ok=True)
+        self._load_index()
+    
+    def _load_index(self):
+        """Diskteki kayıtları son kullanım sırasına göre dizine al"""
+        entries = []
+        for name in os.listdir(self.directory):
+            name = self._migrate_legacy(name)
+            if not name.endswith(self.SUFFIX):
+                continue
+            try:
+                stat = os.stat(os.path.join(self.directory, name))
+            except OSError:
+                continue
+            entries.append((stat.st_mtime, name[:-len(self.SUFFIX)], stat.st_size))
+        
+        for _, key, size in sorted(entries):
+            self._entries[key] = size
+            self._total_bytes += size
+        self._evict()
+    
+    def _migrate_legacy(self, name: str) -> str:
+        """Eski uzantılı kaydı yeni adına taşı (önbellek ısınıklığı korunur)"""
+        for suffix in self.LEGACY_SUFFIXES:
+            if name.endswith(suffix):
+                renamed = name[:-len(suffix)] + self.SUFFIX
+                try:
+                    os.replace(os.path.join(self.directory, name), os.path.join(self.directory, renamed))
+                except OSError:
+                    return name
+                return renamed
+        return name
+    
+    @staticmethod
+    def make_key(text: str, lang: str, voice: Dict[str, Any]) -> str:
+        """(metin, dil, ses ayarları) için içerik adresi üret"""
+        payload = json.dumps([text, lang, voice], ensure_ascii=False, sort_keys=True)
+        return hashlib.sha256(payload.encode("utf-8")).hexdigest()
+    
+    def path_for(self, key: str) -> str:
+        return os.path.join(self.directory, key + self.SUFFIX)
+    
+    def get(self, key: str) -> Optional[bytes]:
+        """Kayıt varsa ses baytlarını döndür ve son kullanımı güncelle"""
+        with self._lock:
+            if key not in self._entries:
+                return None
+            self._entries.move_to_end(key)
+            data = self._memory.get(key)
+            if data is not None:
+                self._memory.move_to_end(key)
+                return data
+        
+        path = self.path_for(key)
+        try:
+            with open(path, "rb") as audio_file:
+                data = audio_file.read()
+            os.utime(path)
+        except OSError:
+            # Dosya dışarıdan silinmiş
+            with self._lock:
+                if key in self._entries:
+                    self._total_bytes -= self._entries.pop(key)
+            return None
+        
+        with self._lock:
+            self._remember(key, data)
+        return data
+    
+    def _remember(self, key: str, data: bytes):
+        """Kaydı bellek katmanına ekle (kilit altında çağrılır)"""
+        if len(data) > self.memory_bytes:
+            return
+        if key in self._memory:
+            self._memory_total -= len(self._memory.pop(key))
+        self._memory[key] = data
+        self._memory_total += len(data)
+        while self._memory_total > self.memory_bytes:
+            _, evicted = self._memory.popitem(last=False)
+            self._memory_total -= len(evicted)
+    
+    def _forget(self, key: str):
+        """Kaydı bellek katmanından çıkar (kilit altında çağrılır)"""
+        data = self._memory.pop(key, None)
+        if data is not None:
+            self._memory_total -= len(data)
+    
+    def put(self, key: str, data: bytes) -> str:
+        """Ses verisini atomik olarak yaz ve dosya yolunu döndür"""
+        path = self.path_for(key)
+        with tempfile.NamedTemporaryFile(dir=self.directory, suffix=".tmp", delete=False) as tmpfile:
+            tmpfile.write(data)
+            temp_filename = tmpfile.name
+        try:
+            os.replace(temp_filename, path)
+        except OSError:
+            os.unlink(temp_filename)
+            raise
+        
+        with self._lock:
+            if key in self._entries:
+                self._total_bytes -= self._entries.pop(key)
+            self._entries[key] = len(data)
+            self._total_bytes += len(data)
+            self._remember(key, data)
+            self._evict()
+        return path
+    
+    def _evict(self):
+        """Boyut sınırı aşıldıysa en eski kayıtları sil (kilit altında çağrılır)"""
+        while self._total_bytes > self.max_bytes and len(self._entries) > 1:
+            key, size = self._entries.popitem(last=False)
+            self._total_bytes -= size
+            self._forget(key)
+            try:
+                os.unlink(self.path_for(key))
+            except OSError:
+                pass
+    
+    def __len__(self) -> int:
+        return len(self._entries)
+
+class SpeechBackendRegistry:
+    """Öncelik sıralı TTS arka uçları: önbellek, sağlık takibi ve otomatik geri düşüş
+
+    Her arka uç için önce önbelleğe bakılır; yoksa devre kesicisi izin
+    veriyorsa sentezlenir. Erişim hatası veren arka uç bekleme süresi boyunca atlanır,
+    böylece ağ kesintisinde sonraki çağrılar zaman aşımı beklemeden yerel
+    motora gider. None sonucu metnin ekrana yazdırılması gerektiği anlamına gelir.
+    """
+    
+    def __init__(self, backends: List[Any], cache: Optional[TTSCache] = None, cooldown: float = 30.0):
+        self.backends = list(backends)
+        self.cache = cache
+        self.breakers = {backend.name: CircuitBreaker(cooldown=cooldown) for backend in self.backends}
+    
+    @classmethod
+    def default(cls, cache: Optional[TTSCache] = None, primary=None) -> "SpeechBackendRegistry":
+        """gTTS (veya verilen arka uç) -> espeak (kuruluysa) -> ekrana yazdırma"""
+        backends = [primary or GTTSSynthesizer()]
+        espeak = EspeakSynthesizer()
+        if espeak.available:
+            backends.append(espeak)
+        backends.append(PrintSynthesizer())
+        return cls(backends, cache)
+    
+    def cache_key(self, backend, text: str, lang: str, slow: bool) -> str:
+        voice = {"backend": backend.name, "format": backend.format, "slow": slow}
+        return TTSCache.make_key(text, lang, voice)
+    
+    def synthesize(self, text: str, lang: str = "tr", slow: bool = False) -> Optional[bytes]:
+        """İlk sağlıklı arka uçtan ses baytlarını al"""
+        for backend in self.backends:
+            key = None
+            if self.cache is not None and backend.format != PrintSynthesizer.format:
+                key = self.cache_key(backend, text, lang, slow)
+                data = self.cache.get(key)
+                if data is not None:
+                    return data
+            
+            breaker = self.breakers[backend.name]
+            if not breaker.allow():
+                continue
+            try:
+                data = backend.synthesize(text, lang, slow)
+            except Exception as e:
+                # Yalnızca erişim hataları devreyi açar; metnin kendisinden kaynaklanan
+                # hatalar (ör. gTTS'in noktalama parçasını reddetmesi) sayılmaz
+                if isinstance(e, getattr(backend, "transport_errors", (OSError,))):
+                    breaker.record_failure()
+                else:
+                    breaker.record_inconclusive()
+                print(f"⚠️  {backend.name} ses sentezi başarısız, sonraki arka uca geçiliyor: {e}")
+                continue
+            breaker.record_success()
+            
+            if data is not None and key is not None:
+                self.cache.put(key, data)
+            return data
+        return None
+    
+    def health(self) -> Dict[str, str]:
+        """Arka uç adı -> devre durumu"""
+        return {name: breaker.state for name, breaker in self.breakers.items()}
+
+class SpeechOutputQueue:
+    """Öncelikli, engellemeyen konuşma çıkış kuyruğu
+
+    Sentez ve çalma ayrı iş parçacıklarında yürür; N. ifade çalarken N+1.
+    ifade sentezlenir. say() hemen bir Future döndürür: ifade sonuna kadar
+    çalınırsa True, kesilirse False ile tamamlanır. interrupt() bekleyen
+    ifadeleri iptal eder ve çalan sesi durdurur.
+    """
+    
+    HIGH = 0
+    NORMAL = 1
+    LOW = 2
+    _CLOSE = float("inf")
+    
+    def __init__(self, synthesize, play, stop=None, max_ready: int = 1):
+        self._synthesize = synthesize  # metin -> ses
+        self._play = play              # (metin, ses, durmalı_mı) -> çalma bitene kadar bekler
+        self._stop = stop              # çalan sesi hemen kes
+        self._pending = queue.PriorityQueue()
+        self._ready = queue.Queue(maxsize=max_ready)
+        self._sequence = count()
+        self._generation = 0
+        self._outstanding = 0
+        self._closed = False
+        self._lock = threading.Lock()
+        self._changed = threading.Condition(self._lock)
+        
+        self._threads = [
+            threading.Thread(target=self._synthesis_loop, daemon=True),
+            threading.Thread(target=self._playback_loop, daemon=True)
+        ]
+        for thread in self._threads:
+            thread.start()
+    
+    def say(self, text: str, priority: int = NORMAL, pause: float = 0.0) -> Future:
+        """İfadeyi kuyruğa ekle; pause saniye bekledikten sonra çalınır"""
+        future = Future()
+        with self._lock:
+            if self._closed:
+                raise RuntimeError("Konuşma kuyruğu kapatıldı")
+            self._outstanding += 1
+            item = (text, pause, self._generation, future)
+            self._pending.put((priority, next(self._sequence), item))
+        future.add_done_callback(self._on_done)
+        return future
+    
+    def _on_done(self, future: Future):
+        with self._lock:
+            self._outstanding -= 1
+            if self._outstanding == 0:
+                self._changed.notify_all()
+    
+    def _is_stale(self, generation: int) -> bool:
+        return generation != self._generation
+    
+    def _synthesis_loop(self):
+        while True:
+            _, _, item = self._pending.get()
+            if item is None:
+                self._ready.put(None)
+                return
+            
+            text, _, generation, future = item
+            if self._is_stale(generation) or future.cancelled():
+                future.cancel()
+                continue
+            
+            try:
+                audio = self._synthesize(text)
+            except Exception as e:
+                if future.set_running_or_notify_cancel():
+                    future.set_exception(e)
+                continue
+            self._ready.put((item, audio))
+    
+    def _playback_loop(self):
+        while True:
+            entry = self._ready.get()
+            if entry is None:
+                return
+            
+            (text, pause, generation, future), audio = entry
+            if self._is_stale(generation):
+                future.cancel()
+                continue
+            if not future.set_running_or_notify_cancel():
+                continue
+            
+            if pause > 0:
+                with self._lock:
+                    self._changed.wait_for(lambda: self._is_stale(generation), timeout=pause)
+            
+            try:
+                if not self._is_stale(generation):
+                    self._play(text, audio, lambda: self._is_stale(generation))
+                future.set_result(not self._is_stale(generation))
+            except Exception as e:
+                future.set_exception(e)
+    
+    def interrupt(self):
+        """Çalan ve bekleyen tüm ifadeleri kes (barge-in)"""
+        with self._lock:
+            self._generation += 1
+            self._changed.notify_all()
+        
+        while True:
+            try:
+                entry = self._pending.get_nowait()
+            except queue.Empty:
+                break
+            if entry[2] is None:
+                # Kapatma işaretini koru
+                self._pending.put(entry)
+                break
+            entry[2][3].cancel()
+        
+        if self._stop is not None:
+            self._stop()
+    
+    @property
+    def is_speaking(self) -> bool:
+        return self._outstanding > 0
+    
+    def wait_idle(self, timeout: Optional[float] = None) -> bool:
+        """Kuyruk boşalıp son ifade bitene kadar bekle"""
+        with self._lock:
+            return self._changed.wait_for(lambda: self._outstanding == 0, timeout=timeout)
+    
+    def close(self, timeout: Optional[float] = None):
+        """Kalan ifadeleri çaldıktan sonra iş parçacıklarını durdur"""
+        with self._lock:
+            if self._closed:
+                return
+            self._closed = True
+            self._pending.put((self._CLOSE, next(self._sequence), None))
+        for thread in self._threads:
+            thread.join(timeout)
+
+# ==================== SES GİRİŞİ ====================
+
+def frame_energy(data: bytes) -> float:
+    """16 bit PCM çerçevesinin RMS enerjisi"""
+    samples = array('h', data[:len(data) - len(data) % 2])
+    if not samples:
+        return 0.0
+    return (sum(sample * sample for sample in samples) / len(samples)) ** 0.5
+
+class MicrophoneFrameSource:
+    """Mikrofonu bir kez açıp ham PCM çerçeveleri okuyan kaynak"""
+    
+    def __init__(self, device_index: Optional[int] = None):
+        self.device_index = device_index
+        self.microphone = None
+        self._source = None
+    
+    def open(self):
+        self.microphone = sr.Microphone(device_index=self.device_index)
+        self._source = self.microphone.__enter__()
+        self.sample_rate = self._source.SAMPLE_RATE
+        self.sample_width = self._source.SAMPLE_WIDTH
+        self.chunk = self._source.CHUNK
+    
+    def read(self) -> bytes:
+        return self._source.stream.read(self.chunk)
+    
+    def close(self):
+        if self.microphone is not None:
+            self.microphone.__exit__(None, None, None)
+            self.microphone = None
+
+class WavFrameSource:
+    """Mikrofon yerine 16 bit WAV dosyasından çerçeve okuyan kaynak (testler için)
+
+    Çok kanallı dosyalarda ilk kanal kullanılır; realtime=True ise okuma
+    hızı gerçek zamana sabitlenir. Dosya bitince boş bayt döner.
+    """
+    
+    def __init__(self, path: str, chunk: int = 1024, realtime: bool = False):
+        self.path = path
+        self.chunk = chunk
+        self.realtime = realtime
+        self._wav = None
+    
+    def open(self):
+        self._wav = wave.open(self.path, "rb")
+        if self._wav.getsampwidth() != 2:
+            self._wav.close()
+            raise ValueError(f"Yalnızca 16 bit WAV destekleniyor: {self.path}")
+        self.sample_rate = self._wav.getframerate()
+        self.sample_width = 2
+        self.channels = self._wav.getnchannels()
+    
+    def read(self) -> bytes:
+        data = self._wav.readframes(self.chunk)
+        if self.channels > 1:
+            data = array('h', data)[::self.channels].tobytes()
+        if self.realtime and data:
+            time.sleep(len(data) / 2 / self.sample_rate)
+        return data
+    
+    def close(self):
+        if self._wav is not None:
+            self._wav.close()
+            self._wav = None
+
+class AudioRingBuffer:
+    """Sabit boyutlu, önceden ayrılmış PCM çerçeve halkası
+
+    Her çerçeve artan bir sıra numarası alır ve enerjisiyle birlikte
+    saklanır. Kapasite dolunca en eski çerçevelerin üzerine yazılır; üretici
+    hiçbir zaman okuyucuyu beklemez, geride kalan okuyucu kayıp çerçeveleri
+    atlar.
+    """
+    
+    def __init__(self, capacity: int, frame_bytes: int):
+        self.capacity = capacity
+        self.frame_bytes = frame_bytes
+        self._data = bytearray(capacity * frame_bytes)
+        self._lengths = array('i', [0]) * capacity
+        self._energies = array('d', [0.0]) * capacity
+        self._next_seq = 0
+        self._closed = False
+        self._changed = threading.Condition()
+    
+    def write(self, frame: bytes, energy: float) -> int:
+        """Çerçeveyi yaz ve sıra numarasını döndür"""
+        frame = frame[:self.frame_bytes]
+        with self._changed:
+            seq = self._next_seq
+            slot = seq % self.capacity
+            start = slot * self.frame_bytes
+            self._data[start:start + len(frame)] = frame
+            self._lengths[slot] = len(frame)
+            self._energies[slot] = energy
+            self._next_seq += 1
+            self._changed.notify_all()
+        return seq
+    
+    @property
+    def oldest(self) -> int:
+        """Halkada hâlâ duran en eski çerçevenin sıra numarası"""
+        return max(0, self._next_seq - self.capacity)
+    
+    def read(self, seq: int, timeout: Optional[float] = None) -> Optional[Tuple[int, bytes, float]]:
+        """seq (veya üzerine yazıldıysa sonraki ilk) çerçeveyi bekleyip döndür
+
+        (gerçek sıra, çerçeve, enerji) döndürür; zaman aşımında ya da halka
+        kapanıp tükendiyse None.
+        """
+        with self._changed:
+            self._changed.wait_for(lambda: seq < self._next_seq or self._closed, timeout=timeout)
+            if seq >= self._next_seq:
+                return None
+            seq = max(seq, self.oldest)
+            slot = seq % self.capacity
+            start = slot * self.frame_bytes
+            return seq, bytes(self._data[start:start + self._lengths[slot]]), self._energies[slot]
+    
+    @property
+    def closed(self) -> bool:
+        return self._closed
+    
+    def close(self):
+        with self._changed:
+            self._closed = True
+            self._changed.notify_all()
+
+class VoiceActivityDetector:
+    """Enerji tabanlı konuşma bölütleyici
+
+    Eşiği aşan ilk çerçeveyle konuşma başlar; başlangıçtan önceki pre_roll
+    saniyelik ses de ifadeye eklenir. hangover saniye sessizlik gelince ya da
+    ifade max_utterance saniyeye ulaşınca kesilir; min_speech saniyeden az
+    sesli çerçeve içeren bölütler gürültü sayılıp atılır. Son teslim edilen
+    bölütün ortalama sesli enerjisi (last_energy) ve son sesli çerçevesinin
+    yankı penceresinde olup olmadığı (last_in_echo) saklanır.
+    """
+    
+    def __init__(self, seconds_per_frame: float, pre_roll: float = 0.5, hangover: float = 0.8,
+                 min_speech: float = 0.3, max_utterance: float = 7.0):
+        def frames(seconds):
+            return max(1, int(round(seconds / seconds_per_frame)))
+        
+        self.hangover_frames = frames(hangover)
+        self.min_speech_frames = frames(min_speech)
+        self.max_frames = frames(max_utterance)
+        self._pre_roll = deque(maxlen=frames(pre_roll))
+        self._frames = []
+        self._voiced = 0
+        self._voiced_energy = 0.0
+        self._echo_tail = False
+        self._silent = 0
+        self.active = False
+        self.last_energy = 0.0
+        self.last_in_echo = False
+    
+    def process(self, frame: bytes, energy: float, threshold: float, echo: bool = False) -> Optional[bytes]:
+        """Çerçeveyi işle; bir ifade tamamlandıysa PCM verisini döndür"""
+        if not self.active:
+            if energy <= threshold:
+                self._pre_roll.append(frame)
+                return None
+            self.active = True
+            self._frames = list(self._pre_roll)
+            self._pre_roll.clear()
+        
+        self._frames.append(frame)
+        if energy > threshold:
+            self._voiced += 1
+            self._voiced_energy += energy
+            self._echo_tail = echo
+            self._silent = 0
+        else:
+            self._silent += 1
+        
+        if self._silent >= self.hangover_frames or len(self._frames) >= self.max_frames:
+            return self._finish()
+        return None
+    
+    def _finish(self) -> Optional[bytes]:
+        frames, voiced = self._frames, self._voiced
+        energy, echo = self._voiced_energy, self._echo_tail
+        self.reset()
+        if voiced < self.min_speech_frames:
+            return None
+        self.last_energy = energy / voiced
+        self.last_in_echo = echo
+        return b"".join(frames)
+    
+    def flush(self) -> Optional[bytes]:
+        """Akış bitince yarım kalan ifadeyi teslim et"""
+        return self._finish() if self.active else None
+    
+    def reset(self):
+        self.active = False
+        self._frames = []
+        self._voiced = 0
+        self._voiced_energy = 0.0
+        self._echo_tail = False
+        self._silent = 0
+        self._pre_roll.clear()
+
+class AudioCaptureStream:
+    """Sürekli ses yakalama: çerçeve kaynağı -> halka tampon -> VAD -> ifade kuyruğu
+
+    Üretici iş parçacığı kaynaktan (mikrofon ya da WAV) okuduğu çerçeveleri
+    halka tampona yazar ve son ~10 saniyenin alt yüzdelik enerjisinden
+    ortam gürültüsünü tahmin ederek recognizer.energy_threshold değerini
+    sürekli günceller. Bölütleyici iş parçacığı tampondan okuyup VAD ile
+    ifadeleri keser ve sr.AudioData olarak kuyruğa koyar. Böylece komut
+    çalışırken ya da JARVIS konuşurken söylenenler de kaybolmaz.
+
+    Yankı bölütlemeden sonra süzülür: echo_window() doğru döndüğü (JARVIS
+    konuştuğu) sırada duyulan çerçevelerin ortanca enerjisi çalma seviyesi
+    sayılır. Son sesli çerçevesi bu pencerede kalan ve ortalama enerjisi
+    çalma seviyesinin ECHO_MARGIN katını aşmayan ifadeler yankıdır; üstüne
+    konuşan kullanıcının sesi daha yüksek olduğu için teslim edilir.
+    """
+    
+    MIN_ENERGY_THRESHOLD = 50
+    AMBIENT_PERCENTILE = 0.1
+    ECHO_MARGIN = 2.0
+    
+    def __init__(self, recognizer: sr.Recognizer, frame_source=None,
+                 calibration_duration: float = 0.5, buffer_seconds: float = 10.0,
+                 ambient_window: float = 10.0, update_interval: float = 1.0,
+                 max_utterance: float = 7.0, echo_window=None):
+        self.recognizer = recognizer
+        self.frame_source = frame_source or MicrophoneFrameSource()
+        self.calibration_duration = calibration_duration
+        self.buffer_seconds = buffer_seconds
+        self.ambient_window = ambient_window
+        self.update_interval = update_interval
+        self.max_utterance = max_utterance
+        self.echo_window = echo_window
+        self.echoes_dropped = 0
+        self.ring = None
+        self.utterances = queue.Queue()
+        self.exhausted = False  # kaynak sona erdi (WAV dosyası bitti)
+        self.finished = False   # son ifade de teslim edildi
+        self._running = False
+        self._threads = []
+    
+    def start(self) -> "AudioCaptureStream":
+        """Kaynağı aç, ilk çerçevelerden kalibre et ve iş parçacıklarını başlat"""
+        source = self.frame_source
+        source.open()
+        seconds_per_frame = source.chunk / source.sample_rate
+        self.ring = AudioRingBuffer(
+            max(1, int(self.buffer_seconds / seconds_per_frame)),
+            source.chunk * source.sample_width
+        )
+        self._ambient = deque(maxlen=max(1, int(self.ambient_window / seconds_per_frame)))
+        self._playback_energies = deque(maxlen=self._ambient.maxlen)
+        self._frames_per_update = max(1, int(self.update_interval / seconds_per_frame))
+        self._calibration_frames = max(1, int(self.calibration_duration / seconds_per_frame))
+        self.vad = VoiceActivityDetector(
+            seconds_per_frame,
+            pre_roll=self.recognizer.non_speaking_duration,
+            hangover=self.recognizer.pause_threshold,
+            min_speech=self.recognizer.phrase_threshold,
+            max_utterance=self.max_utterance
+        )
+        # Eşik artık yalnızca üretici tarafından güncellenir
+        self.recognizer.dynamic_energy_threshold = False
+        
+        self._running = True
+        self._threads = [
+            threading.Thread(target=self._capture_loop, daemon=True),
+            threading.Thread(target=self._segment_loop, daemon=True)
+        ]
+        for thread in self._threads:
+            thread.start()
+        return self
+    
+    def _capture_loop(self):
+        frames = 0
+        try:
+            while self._running:
+                data = self.frame_source.read()
+                if not data:
+                    self.exhausted = True
+                    break
+                
+                energy = frame_energy(data)
+                self._ambient.append(energy)
+                frames += 1
+                if frames == self._calibration_frames:
+                    # İlk kalibrasyon: ortalama ortam enerjisi
+                    ambient = sum(self._ambient) / len(self._ambient)
+                    self.recognizer.energy_threshold = max(
+                        self.MIN_ENERGY_THRESHOLD, ambient * self.recognizer.dynamic_energy_ratio
+                    )
+                elif frames > self._calibration_frames and frames % self._frames_per_update == 0:
+                    self._recalibrate()
+                
+                if frames >= self._calibration_frames:
+                    # Kalibrasyon çerçeveleri dışında hiçbir ses atılmaz
+                    self.ring.write(data, energy)
+        except Exception as e:
+            print(f"🎤 Mikrofon okunamadı: {e}")
+        finally:
+            self._running = False
+            self.ring.close()
+    
+    def _recalibrate(self):
+        """Ortam gürültüsü tahmininden enerji eşiğini yumuşakça güncelle"""
+        energies = sorted(self._ambient)
+        ambient = energies[int(len(energies) * self.AMBIENT_PERCENTILE)]
+        target = ambient * self.recognizer.dynamic_energy_ratio
+        damping = self.recognizer.dynamic_energy_adjustment_damping ** self.update_interval
+        threshold = self.recognizer.energy_threshold * damping + target * (1 - damping)
+        self.recognizer.energy_threshold = max(self.MIN_ENERGY_THRESHOLD, threshold)
+    
+    def _segment_loop(self):
+        seq = 0
+        while True:
+            entry = self.ring.read(seq, timeout=0.5)
+            if entry is None:
+                if self.ring.closed:
+                    break
+                continue
+            
+            actual, frame, energy = entry
+            if actual > seq:
+                print(f"⚠️  Ses tamponu taştı, {actual - seq} çerçeve atlandı")
+            seq = actual + 1
+            
+            echo = self.echo_window is not None and self.echo_window()
+            if echo:
+                self._playback_energies.append(energy)
+            
+            utterance = self.vad.process(frame, energy, self.recognizer.energy_threshold, echo)
+            if utterance is not None:
+                self._deliver(utterance)
+        
+        utterance = self.vad.flush()
+        if utterance is not None:
+            self._deliver(utterance)
+        self.utterances.put(None)
+    
+    def playback_level(self) -> float:
+        """JARVIS konuşurken duyulan çerçevelerin ortanca enerjisi"""
+        energies = sorted(self._playback_energies)
+        return energies[len(energies) // 2] if energies else 0.0
+    
+    def is_echo(self) -> bool:
+        """VAD'nin son bölütü JARVIS'in kendi sesinin yankısı mı?"""
+        return self.vad.last_in_echo and self.vad.last_energy <= self.playback_level() * self.ECHO_MARGIN
+    
+    def _deliver(self, utterance: bytes):
+        if self.is_echo():
+            self.echoes_dropped += 1
+            return
+        source = self.frame_source
+        self.utterances.put(sr.AudioData(utterance, source.sample_rate, source.sample_width))
+    
+    def next_utterance(self, timeout: Optional[float] = None) -> Optional[sr.AudioData]:
+        """Sıradaki ifadeyi döndür; zaman aşımında ya da akış bittiyse None"""
+        try:
+            utterance = self.utterances.get(timeout=timeout)
+        except queue.Empty:
+            return None
+        if utterance is None:
+            # Bitiş işaretini sonraki çağrılar için geri koy
+            self.finished = True
+            self.utterances.put(None)
+        return utterance
+    
+    @property
+    def is_running(self) -> bool:
+        return self._running
+    
+    def close(self):
+        """Yakalamayı durdur ve kaynağı kapat"""
+        self._running = False
+        for thread in self._threads:
+            thread.join(timeout=2)
+        self._threads = []
+        self.frame_source.close()
+
+# ==================== KONUŞMA TANIMA ====================
+
+class GoogleRecognizer:
+    """Google Web Speech API ile çevrimiçi tanıma"""
+    
+    name = "google"
+    
+    def __init__(self, recognizer: sr.Recognizer, language: str = "tr-TR"):
+        self.recognizer = recognizer
+        self.language = language
+    
+    def recognize(self, audio: sr.AudioData) -> str:
+        return self.recognizer.recognize_google(audio, language=self.language)
+
+class SphinxRecognizer:
+    """PocketSphinx ile çevrimdışı tanıma (dil modeli ayrıca kurulmalıdır)"""
+    
+    name = "sphinx"
+    
+    def __init__(self, recognizer: sr.Recognizer, language: str = "tr-TR"):
+        self.recognizer = recognizer
+        self.language = language
+    
+    def recognize(self, audio: sr.AudioData) -> str:
+        return self.recognizer.recognize_sphinx(audio, language=self.language)
+
+class StubRecognizer:
+    """Yerel test tanıyıcısı: sabit yanıt listesi ya da ses -> metin fonksiyonu"""
+    
+    name = "stub"
+    
+    def __init__(self, responses=None, delay: float = 0.0):
+        self.delay = delay
+        if callable(responses):
+            self._respond = responses
+        else:
+            remaining = deque(responses or [])
+            self._respond = lambda audio: remaining.popleft() if remaining else ""
+        self._lock = threading.Lock()
+    
+    def recognize(self, audio: sr.AudioData) -> str:
+        if self.delay:
+            time.sleep(self.delay)
+        with self._lock:
+            text = self._respond(audio)
+        if not text:
+            raise sr.UnknownValueError()
+        return text
+
+@dataclass
+class RecognitionResult:
+    """Sıra numaralı tanıma sonucu (error: UnknownValueError, RequestError, TimeoutError...)"""
+    seq: int
+    text: str
+    error: Optional[Exception] = None
+
+class RecognitionPool:
+    """Yakalamadan bağımsız, sıralı teslim eden tanıma işçi havuzu
+
+    İfadeler gelir gelmez havuza verilir ve eşzamanlı tanınır; tamamlanan
+    sonuçlar sıra numarasına göre yeniden sıralanıp teslim edilir. Süre
+    (timeout) bir işçi isteği aldığında başlar; dolan istek TimeoutError ile
+    teslim edilir, geç gelen sonucu atılır; böylece tek bir yavaş istek
+    arkasındaki ifadeleri bekletmez.
+    """
+    
+    def __init__(self, engine, max_workers: int = 4, timeout: float = 8.0):
+        self.engine = engine
+        self.timeout = timeout
+        # Süresi dolan istek işçiyi de bırakmalı: ağ çağrısı aynı sürede kesilir
+        recognizer = getattr(engine, "recognizer", None)
+        if recognizer is not None and (recognizer.operation_timeout is None
+                                       or recognizer.operation_timeout > timeout):
+            recognizer.operation_timeout = timeout
+        self._executor = ThreadPoolExecutor(max_workers=max_workers)
+        self._next_seq = 0
+        self._deliver_seq = 0
+        self._deadlines = {}
+        self._completed = {}  # yeniden sıralama tamponu: sıra -> (metin, hata)
+        self._input_closed = False
+        self._closed = False
+        self._changed = threading.Condition()
+        self._feeder = None
+    
+    def submit(self, audio: sr.AudioData) -> int:
+        """İfadeyi tanımaya gönder ve sıra numarasını döndür"""
+        with self._changed:
+            seq = self._next_seq
+            self._next_seq += 1
+        future = self._executor.submit(self._recognize, seq, audio)
+        future.add_done_callback(lambda done, seq=seq: self._complete(seq, done))
+        return seq
+    
+    def _recognize(self, seq: int, audio: sr.AudioData) -> Tuple[str, Optional[Exception]]:
+        # Kuyrukta beklenen süre sayılmaz: süre işçi isteği aldığında başlar
+        with self._changed:
+            self._deadlines[seq] = time.monotonic() + self.timeout
+            self._changed.notify_all()
+        try:
+            return self.engine.recognize(audio), None
+        except Exception as e:
+            return "", e
+    
+    def _complete(self, seq: int, future: Future):
+        if future.cancelled():
+            return
+        with self._changed:
+            # Zaman aşımıyla teslim edilmiş isteğin geç sonucu atılır
+            if seq >= self._deliver_seq:
+                self._completed[seq] = future.result()
+                self._changed.notify_all()
+    
+    def feed(self, stream: AudioCaptureStream, gate=None) -> "RecognitionPool":
+        """Yakalama akışındaki ifadeleri arka planda havuza aktar
+
+        gate(audio) False döndürürse ifade tanımaya hiç gönderilmez; gate hata
+        verirse ifade yine de tanınır.
+        """
+        def feed_loop():
+            try:
+                while not self._closed:
+                    audio = stream.next_utterance(timeout=0.5)
+                    if audio is not None:
+                        self._feed_utterance(audio, gate)
+                    elif stream.finished or not stream.is_running:
+                        break
+            except Exception as e:
+                print(f"⚠️  Ses yakalama durdu: {e}")
+            finally:
+                # Besleyici ne sebeple biterse bitsin next_result beklemede kalmasın
+                with self._changed:
+                    self._input_closed = True
+                    self._changed.notify_all()
+        
+        self._feeder = threading.Thread(target=feed_loop, daemon=True)
+        self._feeder.start()
+        return self
+    
+    def _feed_utterance(self, audio: sr.AudioData, gate=None):
+        """Tek ifadeyi kapıdan geçirip gönder; hatalar yalnızca bu ifadeyi etkiler"""
+        try:
+            allowed = gate is None or gate(audio)
+        except Exception as e:
+            print(f"⚠️  Uyandırma sözcüğü denetimi başarısız, ifade yine de tanınacak: {e}")
+            allowed = True
+        if not allowed:
+            return
+        try:
+            self.submit(audio)
+        except Exception as e:
+            print(f"⚠️  İfade tanımaya gönderilemedi: {e}")
+    
+    @property
+    def finished(self) -> bool:
+        """Girdi bitti ve tüm sonuçlar teslim edildi mi?"""
+        return self._input_closed and self._deliver_seq == self._next_seq
+    
+    def next_result(self, timeout: Optional[float] = None) -> Optional[RecognitionResult]:
+        """Sıradaki sonucu teslim et; timeout içinde yoksa ya da girdi bittiyse None"""
+        give_up = None if timeout is None else time.monotonic() + timeout
+        with self._changed:
+            while True:
+                seq = self._deliver_seq
+                now = time.monotonic()
+                if seq in self._completed:
+                    text, error = self._completed.pop(seq)
+                    return self._deliver(seq, text, error)
+                deadline = self._deadlines.get(seq)
+                if deadline is not None and now >= deadline:
+                    return self._deliver(seq, "", TimeoutError(f"tanıma {self.timeout:g} sn içinde bitmedi"))
+                if self.finished or self._closed or (give_up is not None and now >= give_up):
+                    return None
+                
+                wake_times = [t for t in (deadline, give_up) if t is not None]
+                self._changed.wait(min(wake_times) - now if wake_times else None)
+    
+    def _deliver(self, seq: int, text: str, error: Optional[Exception]) -> RecognitionResult:
+        """Sonucu teslim edilmiş say (kilit altında çağrılır)"""
+        self._deliver_seq = seq + 1
+        self._deadlines.pop(seq, None)
+        return RecognitionResult(seq, text, error)
+    
+    def close(self):
+        with self._changed:
+            self._closed = True
+            self._changed.notify_all()
+        self._executor.shutdown(wait=False, cancel_futures=True)
+
+# ==================== UYANDIRMA SÖZCÜĞÜ ====================
+
+WAKE_WORD_DIR = os.path.join(os.path.expanduser("~"), ".config", "jarvis", "wake_words")
+
+def wake_word_features(pcm: bytes, sample_rate: int, frame_ms: int = 20) -> List[Tuple[float, float]]:
+    """20 ms'lik çerçeveler için normalize (log enerji, sıfır geçiş oranı) dizisi
+
+    Tepe enerjinin 25 dB altındaki baş/son sessizlik kırpılır; her boyut
+    ifade içinde sıfır ortalama, birim varyansa getirilir.
+    """
+    samples = array('h', pcm[:len(pcm) - len(pcm) % 2])
+    size = max(1, sample_rate * frame_ms // 1000)
+    raw = []
+    for start in range(0, len(samples) - size + 1, size):
+        window = samples[start:start + size]
+        energy = sum(sample * sample for sample in window) / size
+        crossings = sum(1 for a, b in zip(window, window[1:]) if (a < 0) != (b < 0))
+        raw.append((math.log10(energy + 1.0), crossings / size))
+    if not raw:
+        return []
+    
+    peak = max(energy for energy, _ in raw)
+    voiced = [i for i, (energy, _) in enumerate(raw) if energy >= peak - 2.5]
+    raw = raw[voiced[0]:voiced[-1] + 1]
+    
+    normalized = []
+    for dim in range(2):
+        values = [frame[dim] for frame in raw]
+        mean = sum(values) / len(values)
+        std = (sum((v - mean) ** 2 for v in values) / len(values)) ** 0.5 or 1.0
+        normalized.append([(v - mean) / std for v in values])
+    return list(zip(*normalized))
+
+def dtw_distance(a: List[Tuple[float, float]], b: List[Tuple[float, float]]) -> float:
+    """İki öznitelik dizisi arasında yol uzunluğuna göre normalize DTW uzaklığı"""
+    if not a or not b:
+        return float("inf")
+    infinity = float("inf")
+    previous = [0.0] + [infinity] * len(b)
+    for a_energy, a_zcr in a:
+        current = [infinity] * (len(b) + 1)
+        for j, (b_energy, b_zcr) in enumerate(b, 1):
+            cost = ((a_energy - b_energy) ** 2 + (a_zcr - b_zcr) ** 2) ** 0.5
+            current[j] = cost + min(previous[j], current[j - 1], previous[j - 1])
+        previous = current
+    return previous[-1] / (len(a) + len(b))
+
+class TemplateWakeWordSpotter:
+    """Kayıtlı örneklerle DTW şablon eşleştirmesi yapan yerel anahtar sözcük bulucu
+
+    Ağ ve ağır model gerektirmez: ifade, süresi şablonlara yakınsa enerji/ZCR
+    dizisiyle her şablona DTW ile karşılaştırılır; en iyi uzaklık eşiğin
+    altındaysa uyandırma sözcüğü sayılır.
+    """
+    
+    name = "template"
+    
+    def __init__(self, templates: List[sr.AudioData], threshold: float = 0.6, max_length_ratio: float = 2.0):
+        self.templates = [
+            wake_word_features(template.frame_data, template.sample_rate) for template in templates
+        ]
+        self.templates = [features for features in self.templates if features]
+        if not self.templates:
+            raise ValueError("En az bir boş olmayan uyandırma sözcüğü örneği gerekli")
+        self.threshold = threshold
+        self.max_length_ratio = max_length_ratio
+    
+    @classmethod
+    def from_wav_files(cls, paths: List[str], **kwargs) -> "TemplateWakeWordSpotter":
+        templates = []
+        for path in paths:
+            source = WavFrameSource(path)
+            source.open()
+            try:
+                pcm = b"".join(iter(source.read, b""))
+            finally:
+                source.close()
+            templates.append(sr.AudioData(pcm, source.sample_rate, source.sample_width))
+        return cls(templates, **kwargs)
+    
+    def score(self, audio: sr.AudioData) -> float:
+        """Şablonlara en küçük DTW uzaklığı (süre uyuşmuyorsa sonsuz)"""
+        features = wake_word_features(audio.frame_data, audio.sample_rate)
+        best = float("inf")
+        for template in self.templates:
+            ratio = len(features) / len(template)
+            if not 1 / self.max_length_ratio <= ratio <= self.max_length_ratio:
+                continue
+            best = min(best, dtw_distance(features, template))
+        return best
+    
+    def detect(self, audio: sr.AudioData) -> bool:
+        return self.score(audio) <= self.threshold
+
+SPHINX_DATA_DIR = os.path.join(os.path.dirname(os.path.realpath(sr.__file__)), "pocketsphinx-data")
+
+def sphinx_vocabulary(language: str, words: Iterable[str]) -> Optional[set]:
+    """words içinden PocketSphinx sözlüğünde bulunanlar (sözlük yoksa None)"""
+    path = os.path.join(SPHINX_DATA_DIR, language, "pronounciation-dictionary.dict")
+    wanted = set(words)
+    found = set()
+    try:
+        with open(path, encoding="utf-8", errors="replace") as dictionary:
+            for line in dictionary:
+                # "kelime(2) F O N" biçimindeki alternatif telaffuzlar da sayılır
+                word = line.split(" ", 1)[0].split("(", 1)[0]
+                if word in wanted:
+                    found.add(word)
+    except OSError:
+        return None
+    return found
+
+class SphinxWakeWordSpotter:
+    """PocketSphinx anahtar sözcük modu ile yerel uyandırma sözcüğü bulucu
+
+    Anahtar sözcük modu yalnızca modelin sözlüğündeki kelimeleri arar;
+    sözlükte olmayan ifadeler (ör. İngilizce modelde "uyan") elenir.
+    """
+    
+    name = "sphinx"
+    
+    def __init__(self, recognizer: sr.Recognizer, keywords: Iterable[str] = ("jarvis",),
+                 language: str = "en-US", sensitivity: float = 1e-20):
+        self.recognizer = recognizer
+        self.language = language
+        self.sensitivity = sensitivity
+        keywords = [keyword.lower() for keyword in keywords]
+        vocabulary = sphinx_vocabulary(language, (word for keyword in keywords for word in keyword.split()))
+        if vocabulary is not None:
+            keywords = [keyword for keyword in keywords if set(keyword.split()) <= vocabulary]
+        if not keywords:
+            raise ValueError(f"PocketSphinx {language} sözlüğünde uyandırma sözcüğü yok")
+        self.keywords = keywords
+    
+    def detect(self, audio: sr.AudioData) -> bool:
+        entries = [(keyword, self.sensitivity) for keyword in self.keywords]
+        try:
+            text = self.recognizer.recognize_sphinx(audio, language=self.language, keyword_entries=entries)
+        except sr.UnknownValueError:
+            return False
+        return any(keyword in text for keyword in self.keywords)
+
+def default_wake_word_spotter(recognizer: sr.Recognizer, keywords: Iterable[str] = ("jarvis",)):
+    """Kayıtlı örnek varsa şablon, yoksa PocketSphinx; ikisi de yoksa None
+
+    PocketSphinx Türkçe modeli kuruluysa onu, değilse İngilizce modeli
+    kullanır; modelin sözlüğünde hiçbir sözcük yoksa bulucu kurulmaz ve
+    her ifade tam tanımaya gider.
+    """
+    paths = sorted(glob.glob(os.path.join(WAKE_WORD_DIR, "*.wav")))
+    if paths:
+        try:
+            return TemplateWakeWordSpotter.from_wav_files(paths)
+        except (OSError, ValueError, wave.Error) as e:
+            print(f"⚠️  Uyandırma sözcüğü örnekleri okunamadı: {e}")
+    if importlib.util.find_spec("pocketsphinx") is not None:
+        language = "tr-TR" if os.path.isdir(os.path.join(SPHINX_DATA_DIR, "tr-TR")) else "en-US"
+        try:
+            return SphinxWakeWordSpotter(recognizer, keywords, language)
+        except ValueError as e:
+            print(f"⚠️  {e}")
+    return None
+
+def evaluate_wake_word_spotter(spotter, audio_path: str, wake_intervals: List[Tuple[float, float]],
+                               tolerance: float = 0.5) -> Dict[str, Any]:
+    """Kayıtlı ses üzerinde gecikme ve yanlış uyanma oranını ölç
+
+    Ses, canlı akıştaki gibi VAD ile ifadelere bölünür ve her ifade
+    bulucuya verilir. wake_intervals, uyandırma sözcüğünün söylendiği
+    (başlangıç, bitiş) saniyeleridir. Gecikme = ifadenin bittiği an +
+    bulucunun işlem süresi - sözcüğün bitişi.
+    """
+    recognizer = sr.Recognizer()
+    source = WavFrameSource(audio_path)
+    source.open()
+    seconds_per_frame = source.chunk / source.sample_rate
+    calibration_frames = max(1, int(0.5 / seconds_per_frame))
+    vad = VoiceActivityDetector(
+        seconds_per_frame,
+        pre_roll=recognizer.non_speaking_duration,
+        hangover=recognizer.pause_threshold,
+        min_speech=recognizer.phrase_threshold
+    )
+    
+    pending = sorted(wake_intervals)
+    matched = set()
+    latencies = []
+    detect_times = []
+    false_wakes = 0
+    utterances = 0
+    calibration = []
+    threshold = None
+    frames = 0
+    try:
+        while True:
+            data = source.read()
+            frames += 1
+            energy = frame_energy(data) if data else 0.0
+            if threshold is None:
+                calibration.append(energy)
+                if len(calibration) >= calibration_frames or not data:
+                    threshold = max(AudioCaptureStream.MIN_ENERGY_THRESHOLD,
+                                    sum(calibration) / len(calibration) * recognizer.dynamic_energy_ratio)
+                if data:
+                    continue
+            
+            utterance = vad.process(data, energy, threshold) if data else vad.flush()
+            if utterance is not None:
+                utterances += 1
+                end = frames * seconds_per_frame
+                start = end - len(utterance) / source.sample_width / source.sample_rate
+                
+                started = time.perf_counter()
+                detected = spotter.detect(sr.AudioData(utterance, source.sample_rate, source.sample_width))
+                elapsed = time.perf_counter() - started
+                detect_times.append(elapsed)
+                
+                if detected:
+                    hit = next((i for i, (wake_start, wake_end) in enumerate(pending)
+                                if i not in matched
+                                and start - tolerance <= wake_end and wake_start <= end + tolerance), None)
+                    if hit is None:
+                        false_wakes += 1
+                    else:
+                        matched.add(hit)
+                        latencies.append(end + elapsed - pending[hit][1])
+            if not data:
+                break
+    finally:
+        source.close()
+    
+    audio_seconds = frames * seconds_per_frame
+    return {
+        "audio_seconds": round(audio_seconds, 2),
+        "utterances": utterances,
+        "wake_words": len(pending),
+        "hits": len(matched),
+        "misses": len(pending) - len(matched),
+        "recall": round(len(matched) / len(pending), 3) if pending else None,
+        "false_wakes": false_wakes,
+        "false_wakes_per_hour": round(false_wakes / audio_seconds * 3600, 2) if audio_seconds else 0.0,
+        "mean_latency": round(sum(latencies) / len(latencies), 3) if latencies else None,
+        "max_latency": round(max(latencies), 3) if latencies else None,
+        "mean_detect_ms": round(sum(detect_times) / len(detect_times) * 1000, 2) if detect_times else None
+    }
+
+# ==================== KOMUT YÖNLENDİRİCİ ====================
+
+class DialogState(Enum):
+    """Bekleyen çok adımlı soru"""
+    IDLE = "idle"
+    SEARCH = "search"
+    YOUTUBER = "youtuber"
+    VIDEO = "video"
+    YOUTUBE_SONG = "youtube_song"
+    SPELL = "spell"
+    PLATFORM = "platform"
+    SONG = "song"
+    SLEEP_REPLY = "sleep_reply"
+
+class DialogStateMachine:
+    """Tek bir bekleyen soruyu zaman aşımıyla tutan durum makinesi
+
+    Aynı anda yalnızca bir soru bekleyebilir; yeni soru eskisinin yerine
+    geçer. Süresi dolan soru okunduğunda IDLE'a düşer, böylece yanıtsız
+    kalan bir soru sonraki ilgisiz komutları yutmaz.
+    """
+    
+    def __init__(self, timeout: float = 30.0, clock=time.monotonic):
+        self.timeout = timeout
+        self.clock = clock
+        self._state = DialogState.IDLE
+        self._expires_at = 0.0
+        self._generation = 0  # Her yeni soru/temizleme bekleyen kurulumları geçersiz kılar
+        self._lock = threading.Lock()
+    
+    @property
+    def state(self) -> DialogState:
+        with self._lock:
+            if self._state is not DialogState.IDLE and self.clock() >= self._expires_at:
+                self._state = DialogState.IDLE
+            return self._state
+    
+    def expect(self, state: DialogState, timeout: Optional[float] = None):
+        """Bir sonraki komutu bu sorunun yanıtı olarak bekle"""
+        with self._lock:
+            self._generation += 1
+            self._arm(state, timeout)
+    
+    def expect_after(self, future: Future, state: DialogState, timeout: Optional[float] = None):
+        """Soru söylenip bitince (ya da kesilince) beklemeye başla
+
+        Süre soru okunurken işlemez. Bu arada yeni soru sorulur ya da durum
+        temizlenirse bu soru hiç kurulmaz.
+        """
+        with self._lock:
+            self._generation += 1
+            generation = self._generation
+            self._state = DialogState.IDLE  # Önceki soru yerini yenisine bırakır
+        
+        def arm(done):
+            with self._lock:
+                if self._generation == generation:
+                    self._arm(state, timeout)
+        
+        future.add_done_callback(arm)
+    
+    def _arm(self, state: DialogState, timeout: Optional[float]):
+        """Durumu kur (kilit altında çağrılır)"""
+        self._state = state
+        self._expires_at = self.clock() + (self.timeout if timeout is None else timeout)
+    
+    def clear(self):
+        with self._lock:
+            self._generation += 1
+            self._state = DialogState.IDLE
+    
+    def is_waiting(self, state: DialogState) -> bool:
+        return self.state is state
+
+@dataclass
+class Command:
+    """Bildirimsel komut kaydı
+
+    handler(command) False döndürürse JARVIS kapanır. requires içindeki durum
+    bayraklarının hepsi doğru olmalıdır; phrases boşsa kayıt, durum etkin
+    olduğu sürece her komutta adaydır. dialog verilen kayıt yalnızca o soru
+    beklenirken adaydır. passthrough kayıtlar çalıştıktan sonra yönlendirme
+    devam eder.
+    """
+    name: str
+    phrases: Tuple[str, ...]
+    handler: Any
+    priority: int
+    requires: Tuple[str, ...] = ()
+    condition: Any = None
+    passthrough: bool = False
+    dialog: Optional[DialogState] = None
+
+class CommandRegistry:
+    """İfadeleri tek bir Aho–Corasick otomatına derlenmiş komut tablosu
+
+    Gönderim, komut metni üzerinde tek geçiştir: eşleşen ifadelerin
+    kayıtları ile ifadesiz (durum) kayıtlar adaydır ve en küçük öncelikli
+    aday kazanır. Maliyet kayıt sayısından değil metin uzunluğundan ve
+    gerçek eşleşme sayısından etkilenir. Soru yanıtları bekleyen duruma
+    göre sözlükten tek adımda bulunur.
+    """
+    
+    def __init__(self, state: Any = None, dialog: Optional[DialogStateMachine] = None):
+        self.state = state
+        self.dialog = dialog
+        self.commands: List[Command] = []
+        self._matcher = None
+        self._targets: List[List[int]] = []  # kalıp indeksi -> komut indeksleri
+        self._unconditional: List[int] = []
+        self._by_dialog: Dict[DialogState, List[int]] = {}
+    
+    def add(self, name: str, phrases: Iterable[str], handler, priority: Optional[int] = None,
+            requires: Tuple[str, ...] = (), condition=None, passthrough: bool = False,
+            dialog: Optional[DialogState] = None) -> Command:
+        """Kayıt ekle; öncelik verilmezse kayıt sırası kullanılır"""
+        command = Command(
+            name, tuple(phrases), handler,
+            len(self.commands) if priority is None else priority,
+            tuple(requires), condition, passthrough, dialog
+        )
+        self.commands.append(command)
+        self._matcher = None
+        return command
+    
+    def get(self, name: str) -> Optional[Command]:
+        """Adı verilen kaydı döndür"""
+        return next((command for command in self.commands if command.name == name), None)
+    
+    def compile(self) -> "CommandRegistry":
+        """Tüm ifadeleri tek otomatta derle"""
+        pattern_index = {}
+        self._targets = []
+        self._unconditional = []
+        self._by_dialog = {}
+        for index, command in enumerate(self.commands):
+            if command.dialog is not None:
+                self._by_dialog.setdefault(command.dialog, []).append(index)
+            elif not command.phrases:
+                self._unconditional.append(index)
+            for phrase in command.phrases:
+                if phrase not in pattern_index:
+                    pattern_index[phrase] = len(self._targets)
+                    self._targets.append([])
+                targets = self._targets[pattern_index[phrase]]
+                if index not in targets:
+                    targets.append(index)
+        self._matcher = AhoCorasickMatcher(pattern_index)
+        return self
+    
+    def _is_active(self, command: Command, text: str) -> bool:
+        if any(not getattr(self.state, flag) for flag in command.requires):
+            return False
+        return command.condition is None or command.condition(text)
+    
+    def match(self, text: str) -> List[Command]:
+        """Metin için etkin adayları öncelik sırasıyla döndür"""
+        if self._matcher is None:
+            self.compile()
+        
+        found = set(self._unconditional)
+        if self.dialog is not None:
+            found.update(self._by_dialog.get(self.dialog.state, ()))
+        for _, pattern in self._matcher.iter_matches(text):
+            found.update(self._targets[pattern])
+        
+        commands = self.commands
+        return [
+            commands[index] for index in sorted(found, key=lambda i: (commands[i].priority, i))
+            if self._is_active(commands[index], text)
+        ]
+    
+    def dispatch(self, text: str) -> bool:
+        """Komutu işle; JARVIS kapanacaksa False döndür"""
+        for command in self.match(text):
+            if command.dialog is not None and not command.passthrough:
+                self.dialog.clear()  # Yanıt alındı; işleyici yeni soru sorabilir
+            result = command.handler(text)
+            if command.passthrough:
+                continue
+            return result is not False
+        return True
+
+def benchmark_command_dispatch(sizes: Iterable[int] = (10, 100, 1000, 10000),
+                               repeat: int = 2000) -> List[Dict[str, Any]]:
+    """Eşleştirme maliyetini kayıt sayısına göre ölç
+
+    Her boyut için sentetik ifadelerle bir tablo kurulur; aynı gerçekçi
+    komutlar hem derlenmiş tabloda hem de eski tarzda ifade ifade
+    substring taramasıyla eşleştirilir. Komut başına mikrosaniye döner.
+    """
+    samples = [
+        "jarvis saat kaç",
+        "bugün kendimi biraz yorgun hissediyorum ama iyiyim",
+        "google'da ara python dekoratörler",
+        "bu komut hiçbir şeye uymuyor galiba",
+    ]
+    results = []
+    for size in sizes:
+        registry = CommandRegistry()
+        for index in range(size):
+            registry.add(f"synthetic_{index}", [f"komut {index} çalıştır"], lambda command: True)
+        registry.add("time", ["saat kaç"], lambda command: True)
+        registry.add("search", ["google'da ara"], lambda command: True)
+        registry.compile()
+        
+        start = time.perf_counter()
+        for _ in range(repeat):
+            for sample in samples:
+                registry.match(sample)
+        indexed = (time.perf_counter() - start) / (repeat * len(samples))
+        
+        linear_repeat = max(1, repeat // max(1, size // 10))
+        start = time.perf_counter()
+        for _ in range(linear_repeat):
+            for sample in samples:
+                [command for command in registry.commands
+                 if any(phrase in sample for phrase in command.phrases)]
+        linear = (time.perf_counter() - start) / (linear_repeat * len(samples))
+        
+        results.append({"commands": len(registry.commands),
+                        "indexed_us": round(indexed * 1e6, 2),
+                        "linear_us": round(linear * 1e6, 2)})
+    return results
+
+# ==================== GÜNCELLENMİŞ JARVIS SINIFI ====================
+
+class Jarvis:
+    def __init__(self, synthesizer=None, tts_cache: Optional[TTSCache] = None, audio_source=None,
+                 speech_recognizer=None, wake_word_spotter=None):
+        load_assistant_modules()
+        self.recognizer = sr.Recognizer()
+        self.is_listening = False
+        # Çok adımlı sorular: aynı anda tek bekleyen soru, süresi dolunca düşer
+        self.dialog = DialogStateMachine(timeout=30.0)
+        self.current_platform = ""
+        self.sleep_mode = False
+        self.security_mode = False
+        self.last_motivation_time = 0
+        self.daily_questions_asked = False
+        self.music_playing = False
+        self.sleep_conversation_active = False
+        
+        # YENİ: Akıllı özellikler
+        self.keyboard_mode = False
+        self.deep_think_mode = True  # YENİ: Derin düşünme modu
+        self.auto_question_mode = True  # YENİ: Otomatik soru sorma modu
+        self.conversation_depth = 0  # YENİ: Konuşma derinliği
+        self.last_question_time = 0  # YENİ: Son soru zamanı
+        
         # SEVİYE 5 DUYGU ANALİZİ SİSTEMİ EKLENDİ (GÜNCELLENMİŞ)
         self.emotion_analyzer = Level5EmotionAnalyzer()
         self.last_emotion_response_time = 0
@@ -940,8 +3240,77 @@ class Jarvis:
             "Size bunun hakkında ne ilginç geliyor?"
         ]
         
+        self.welcome_messages = {
+            "morning": "Günaydın efendim! Yeni bir güne başlamak için harika bir zaman!",
+            "afternoon": "Tünaydın efendim! Gününüz nasıl geçiyor?",
+            "evening": "İyi akşamlar efendim! Günün yorgunluğunu atmaya hazır mısınız?",
+            "night": "İyi geceler efendim! Hala burada olmanız harika!"
+        }
+        
+        self.startup_messages = [
+            "Seviye 5 duygu analizi sistemi aktif.",
+            "Spotify ve YouTube direkt açma özelliği aktif.",
+            "Akıllı soru sorma modu aktif."
+        ]
+        
+        self.first_questions = [
+            "Size nasıl yardımcı olabilirim?",
+            "Bugün nasılsınız?",
+            "Merak ettiğiniz bir konu var mı?",
+            "Sohbet etmek istediğiniz bir şey var mı?"
+        ]
+        
+        # Ses sentezi: değiştirilebilir arka uç + kalıcı önbellek
+        self.tts_lang = "tr"
+        self.tts_slow = False
+        if tts_cache is None:
+            try:
+                tts_cache = TTSCache()
+            except OSError as e:
+                print(f"⚠️  Ses önbelleği kullanılamıyor: {e}")
+        self.tts_cache = tts_cache
+        self.tts_backends = SpeechBackendRegistry.default(tts_cache, primary=synthesizer)
+        
         pygame.mixer.init()
-    
+        
+        # Konuşma çıkışı: speak() beklemeden döner, çalma ayrı iş parçacığında
+        # barge_in açıkken yeni komut JARVIS'in konuşmasını keser
+        self.barge_in = False
+        self._playback_clock = None
+        # Parçalar eşzamanlı sentezlenir, ayrılmış kanalda boşluksuz çalınır
+        self.synthesis_pool = ThreadPoolExecutor(max_workers=4)
+        pygame.mixer.set_reserved(1)
+        self.speech_channel = pygame.mixer.Channel(0)
+        self.speech = SpeechOutputQueue(self._synthesize_speech, self._play_speech, self._stop_speech)
+        
+        # Ses girişi: mikrofon ilk dinlemede bir kez açılır ve sürekli kaydeder
+        # audio_source verilirse (ör. WavFrameSource) mikrofon yerine o okunur
+        self.audio_source = audio_source
+        self.microphone_stream = None
+        # Tanıma ayrı işçi havuzunda; motor değiştirilebilir (Google, Sphinx, Stub)
+        self.speech_recognizer = speech_recognizer or GoogleRecognizer(self.recognizer)
+        self.recognition_pool = None
+        self.recognition_workers = 4
+        self.recognition_timeout = 8.0
+        # Komutlar tek geçişte eşleşen bildirimsel tablodan yönlendirilir
+        self.command_registry = self.build_command_registry()
+        
+        # Uyku modunda yalnızca uyandırma sözcüğü tam tanımaya gider; bulucu
+        # "wake_up" kaydının ifadelerini arar
+        self.wake_word_spotter = wake_word_spotter or default_wake_word_spotter(
+            self.recognizer, self.command_registry.get("wake_up").phrases
+        )
+        
+        # Duygu analizi komut yolunun dışında: komutlar arka plan işçisine de bırakılır
+        self.emotion_queue = queue.Queue(maxsize=32)
+        self.emotion_replies: List[Future] = []  # Henüz çalınmamış duygu yanıtları
+        self.shutting_down = False  # Veda başladı: duygu yanıtı verilmez
+        self.emotion_thread = threading.Thread(target=self._emotion_worker, daemon=True)
+        self.emotion_thread.start()
+        
+        # Çalışırken bağlı asyncio çalışma zamanı (zamanlayıcılar ve uyku sohbeti onun görevleri)
+        self.runtime = None
+
     # YENİ METOT: Akıllı soru sorma
     def ask_intelligent_question(self, user_input: str = "") -> Optional[str]:
         """Akıllı soru sor"""
@@ -1049,54 +3418,229 @@ class Jarvis:
             print(f"Klavye giriş hatası: {e}")
             return ""
     
-    def speak(self, text):
-        """Metni sesli söyle"""
+    def synthesize_audio(self, text: str) -> Optional[bytes]:
+        """Metni bellekte ses baytlarına çevir (None: ses yok, metni yazdır)"""
+        return self.tts_backends.synthesize(text, self.tts_lang, self.tts_slow)
+    
+    def speak(self, text, priority: int = SpeechOutputQueue.NORMAL, pause: float = 0.0) -> Future:
+        """Metni sesli söyle (beklemeden döner; çalma bitince Future tamamlanır)"""
+        return self.speech.say(text, priority, pause)
+    
+    def ask(self, prompt: str, state: DialogState):
+        """Soruyu sor; yanıt süresi soru söylenip bitince başlar"""
+        self.dialog.expect_after(self.speak(prompt), state)
+    
+    def _synthesize_speech(self, text: str) -> List[Tuple[str, Future]]:
+        """Konuşma kuyruğu için metni parçalara bölüp eşzamanlı sentezlemeye başla"""
+        return [
+            (chunk, self.synthesis_pool.submit(self.synthesize_audio, chunk))
+            for chunk in split_speech_chunks(text)
+        ]
+    
+    def _load_speech_chunk(self, chunk: str, future: Future):
+        """Sentezlenen parçayı doğrudan bellekten çözümle; başarısızsa metni yazdır"""
         try:
-            tts = gTTS(text=text, lang='tr', slow=False)
-            with tempfile.NamedTemporaryFile(delete=False, suffix='.mp3') as tmpfile:
-                temp_filename = tmpfile.name
-            
-            tts.save(temp_filename)
-            pygame.mixer.music.load(temp_filename)
-            pygame.mixer.music.play()
-            
-            while pygame.mixer.music.get_busy():
-                pygame.time.Clock().tick(10)
+            data = future.result()
+            if data is None:
+                print(f"🤖 JARVIS: {chunk}")
+                return None
+            return pygame.mixer.Sound(file=io.BytesIO(data))
+        except Exception:
+            print(f"🤖 JARVIS: {chunk}")
+            return None
+    
+    def _play_speech(self, text: str, chunks: List[Tuple[str, Future]], should_stop):
+        """Parçaları sırayla, boşluksuz çal (yalnızca çalma iş parçacığından çağrılır)
+
+        İlk parça hazır olur olmaz çalmaya başlar; sonraki parça, kanalın
+        bekleme yuvası boşalınca kuyruğa eklenir.
+        """
+        if self._playback_clock is None:
+            self._playback_clock = pygame.time.Clock()
+        channel = self.speech_channel
+        
+        for index, (chunk, future) in enumerate(chunks):
+            if should_stop():
+                for _, pending in chunks[index:]:
+                    pending.cancel()
+                break
             
-            pygame.mixer.music.stop()
-            os.unlink(temp_filename)
+            sound = self._load_speech_chunk(chunk, future)
+            if sound is None:
+                continue
             
-        except Exception as e:
-            print(f"🤖 JARVIS: {text}")
-
-    def listen(self):
-        """Mikrofonla ses dinle"""
+            if channel.get_busy():
+                while channel.get_queue() is not None and not should_stop():
+                    self._playback_clock.tick(50)
+                channel.queue(sound)
+            else:
+                channel.play(sound)
+        
+        while channel.get_busy() and not should_stop():
+            self._playback_clock.tick(20)
+        if should_stop():
+            channel.stop()
+    
+    def _stop_speech(self):
+        """Çalan sesi hemen kes"""
         try:
-            with sr.Microphone() as source:
-                self.recognizer.adjust_for_ambient_noise(source, duration=0.5)
-                
+            self.speech_channel.stop()
+        except Exception:
+            pass
+    
+    def shutdown(self, timeout: float = 15.0):
+        """Kalan konuşmaları bitir ve çıkış kuyruğunu kapat"""
+        self.is_listening = False
+        self.shutting_down = True
+        self.close_microphone_stream()
+        self.defer_emotion_analysis(None)
+        self.emotion_thread.join(timeout)
+        self.speech.wait_idle(timeout)
+        self.speech.close(timeout)
+        self.synthesis_pool.shutdown(wait=False)
+    
+    def canned_phrases(self) -> List[str]:
+        """Önceden seslendirilebilecek tüm sabit ifadeler (tekrarsız, sıralı)
+
+        speak() metni parçalara bölerek sentezlediği için önbellek de parça
+        bazında doldurulur.
+        """
+        phrases = []
+        phrases.extend(self.welcome_messages.values())
+        phrases.extend(self.startup_messages)
+        phrases.extend(self.first_questions)
+        phrases.extend(self.smart_responses.values())
+        phrases.extend(self.motivational_quotes)
+        phrases.extend(self.daily_questions)
+        phrases.extend(self.sleep_conversation_questions)
+        phrases.extend(self.intelligent_questions)
+        phrases.extend(self.emotion_analyzer.canned_phrases())
+        
+        chunks = []
+        for phrase in phrases:
+            chunks.extend(split_speech_chunks(phrase))
+        return list(dict.fromkeys(chunks))
+    
+    def warm_tts_cache(self, max_workers: int = 4, progress=None) -> Tuple[int, int]:
+        """Sabit ifadeleri paralel sentezleyip önbelleğe yaz; (başarılı, toplam) döndür"""
+        if self.tts_cache is None:
+            return 0, 0
+        
+        phrases = self.canned_phrases()
+        total = len(phrases)
+        done = 0
+        failed = 0
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            futures = [executor.submit(self.synthesize_audio, phrase) for phrase in phrases]
+            for future in as_completed(futures):
                 try:
-                    print("🎤 Dinliyorum... (konuşun)")
-                    audio = self.recognizer.listen(
-                        source, 
-                        timeout=5,
-                        phrase_time_limit=7
-                    )
-                    command = self.recognizer.recognize_google(audio, language='tr-TR')
-                    print(f"👤 Siz: {command}")
-                    return command.lower()
-                except sr.WaitTimeoutError:
-                    return ""
-                except sr.UnknownValueError:
-                    print("❌ Sesi anlayamadım")
-                    return ""
-                except sr.RequestError as e:
-                    print(f"🌐 İnternet bağlantı hatası: {e}")
-                    return ""
+                    if future.result() is None:
+                        failed += 1
+                except Exception:
+                    failed += 1
+                done += 1
+                if progress is not None:
+                    progress(done, total, failed)
+        return total - failed, total
+    
+    def prewarm_tts_cache(self, max_workers: int = 4, progress=None) -> threading.Thread:
+        """Önbelleği etkileşimli döngüyü bekletmeden arka planda ısıt"""
+        def report(done, total, failed):
+            if done == total:
+                print(f"🔊 Ses önbelleği hazır: {total - failed}/{total} ifade")
+        
+        thread = threading.Thread(
+            target=self.warm_tts_cache,
+            args=(max_workers, progress or report),
+            daemon=True
+        )
+        thread.start()
+        return thread
+
+    def listen(self, timeout: float = 5.0) -> Optional[str]:
+        """Tanıma havuzundan sıradaki sonucu al (kayıt ve tanıma arka planda sürer)
+
+        Süre içinde sonuç yoksa boş metin, ses kaynağı (ör. WAV dosyası)
+        bittiyse None döner.
+        """
+        try:
+            stream = self.open_microphone_stream()
+            pool = self.recognition_pool
+            if pool is None:
+                return ""  # Kayıt bu arada kapatıldı
+            
+            result = pool.next_result(timeout=timeout)
+            if result is None:
+                if pool.finished and stream.exhausted:
+                    print("🎤 Ses kaynağı sona erdi")
+                    self.is_listening = False
+                    return None
+                # Mikrofon düştüyse sonraki çağrı kaydı yeniden açar
+                return ""
+            
+            if result.error is not None:
+                self.report_recognition_error(result.error)
+                return ""
+            
+            print(f"👤 Siz: {result.text}")
+            return result.text.lower()
         except Exception as e:
             print(f"🎤 Mikrofon hatası: {e}")
+            self.close_microphone_stream()
             self.keyboard_mode = True
             return ""
+    
+    def report_recognition_error(self, error: BaseException):
+        """Tanıma hatasını kullanıcıya türüne göre bildir"""
+        if isinstance(error, sr.UnknownValueError):
+            print("❌ Sesi anlayamadım")
+        elif isinstance(error, sr.RequestError):
+            print(f"🌐 İnternet bağlantı hatası: {error}")
+        elif isinstance(error, TimeoutError):
+            print(f"⏱️  Tanıma zaman aşımı: {error}")
+        else:
+            print(f"❌ Tanıma hatası: {error}")
+    
+    def open_microphone_stream(self) -> AudioCaptureStream:
+        """Sürekli kayıt oturumunu gerekirse aç (kalibrasyon yalnızca burada)"""
+        stream = self.microphone_stream
+        if stream is None or not (stream.is_running or stream.exhausted):
+            self.close_microphone_stream()
+            self.microphone_stream = AudioCaptureStream(
+                self.recognizer,
+                self.audio_source,
+                echo_window=self.is_echo_window
+            ).start()
+            self.recognition_pool = RecognitionPool(
+                self.speech_recognizer,
+                max_workers=self.recognition_workers,
+                timeout=self.recognition_timeout
+            ).feed(self.microphone_stream, gate=self.should_recognize)
+            print("🎤 Dinliyorum... (konuşun)")
+        return self.microphone_stream
+    
+    def should_recognize(self, audio: sr.AudioData) -> bool:
+        """Uyku modunda (sohbet kapalıyken) yalnızca uyandırma sözcüğü tanınır"""
+        if not self.sleep_mode or self.sleep_conversation_active or self.wake_word_spotter is None:
+            return True
+        try:
+            return self.wake_word_spotter.detect(audio)
+        except Exception as e:
+            # Bulucu hatası ifadeyi yutmasın: tam tanımaya gönder
+            self.report_recognition_error(e)
+            return True
+    
+    def is_echo_window(self) -> bool:
+        """JARVIS konuşurken duyulan sesin bir kısmı kendi sesimizin yankısıdır"""
+        return self.speech.is_speaking
+    
+    def close_microphone_stream(self):
+        if self.recognition_pool is not None:
+            self.recognition_pool.close()
+            self.recognition_pool = None
+        if self.microphone_stream is not None:
+            self.microphone_stream.close()
+            self.microphone_stream = None
 
     # ==================== MEVCUT METOTLAR ====================
     
@@ -1144,8 +3688,7 @@ class Jarvis:
 
     def ask_search(self):
         """Google arama için ne aramak istediğini sor"""
-        self.speak("Google'da ne aramamı istersiniz?")
-        self.waiting_for_search = True
+        self.ask("Google'da ne aramamı istersiniz?", DialogState.SEARCH)
 
     def close_and_switch_tab(self):
         """Sekmeyi kapat ve diğerine geç"""
@@ -1160,8 +3703,8 @@ class Jarvis:
     def ask_youtuber(self):
         """Hangi youtuber istediğini sor"""
         youtuber_list = ", ".join(self.favorite_youtubers[:3])
-        self.speak(f"Hangi youtuber'ın videosunu izlemek istersiniz? Örneğin: {youtuber_list}")
-        self.waiting_for_youtuber = True
+        self.ask(f"Hangi youtuber'ın videosunu izlemek istersiniz? Örneğin: {youtuber_list}",
+                 DialogState.YOUTUBER)
 
     def play_youtuber_video(self, youtuber_name):
         """Youtuber videosu aç"""
@@ -1273,8 +3816,7 @@ class Jarvis:
 
     def ask_video(self):
         """Video sorma"""
-        self.speak("Hangi videoyu açmamı istersiniz?")
-        self.waiting_for_video = True
+        self.ask("Hangi videoyu açmamı istersiniz?", DialogState.VIDEO)
 
     def play_video(self, video_name):
         """Video aç"""
@@ -1292,37 +3834,34 @@ class Jarvis:
         return False
 
     def start_sleep_conversation(self):
-        """Uyku modu sohbetini başlat"""
+        """Uyku modu sohbetini başlat
+
+        Sorular çalışma zamanının zamanlayıcı görevinden sorulur; yanıtlar
+        ayrıca dinlenmez, normal komut akışıyla SLEEP_REPLY sorusuna gelir.
+        """
         self.sleep_conversation_active = True
-        self.speak("Uyku moduna geçtim. Beni çağırmak için uyan demeniz yeterli.")
-        
-        def conversation_loop():
-            time.sleep(2)
-            while self.sleep_mode and self.sleep_conversation_active:
-                question = random.choice(self.sleep_conversation_questions)
-                self.speak(question)
-                
-                time.sleep(2)
-                response = self.listen() if not self.keyboard_mode else self.get_keyboard_input()
-                if response:
-                    if any(word in response for word in ["hayır", "yeter", "dur", "sus", "kapat"]):
-                        self.speak("Tamam, sessizce dinliyorum. Beni istediğin zaman çağırabilirsin.")
-                        self.sleep_conversation_active = False
-                    else:
-                        if not self.smart_response(response):
-                            friendly_responses = [
-                                "Bu çok ilginç, devam edebilir misin?",
-                                "Seni dinlemek gerçekten güzel",
-                                "Bunu duyduğuma sevindim"
-                            ]
-                            response_text = random.choice(friendly_responses)
-                            self.speak(response_text)
-                
-                time.sleep(random.randint(15, 30))
+        self.speak(f"Uyku moduna geçtim. Beni çağırmak için {self.wake_word_hint()} demeniz yeterli.")
         
-        conversation_thread = threading.Thread(target=conversation_loop)
-        conversation_thread.daemon = True
-        conversation_thread.start()
+        if self.runtime is not None:
+            self.runtime.schedule_sleep_conversation()
+    
+    def wake_word_hint(self) -> str:
+        """Uyku modunda gerçekten uyandıran ilk sözcük"""
+        keywords = getattr(self.wake_word_spotter, "keywords", None)
+        return (keywords or self.command_registry.get("wake_up").phrases)[0]
+    
+    def answer_sleep_reply(self, command):
+        """Uyku sohbeti sorusuna gelen yanıt"""
+        if any(word in command for word in ["hayır", "yeter", "dur", "sus", "kapat"]):
+            self.speak("Tamam, sessizce dinliyorum. Beni istediğin zaman çağırabilirsin.")
+            self.sleep_conversation_active = False
+        elif not self.smart_response(command):
+            friendly_responses = [
+                "Bu çok ilginç, devam edebilir misin?",
+                "Seni dinlemek gerçekten güzel",
+                "Bunu duyduğuma sevindim"
+            ]
+            self.speak(random.choice(friendly_responses))
 
     def motivate_user(self):
         """Kullanıcıyı motive et"""
@@ -1346,23 +3885,19 @@ class Jarvis:
 
     def ask_platform(self):
         """Platform sorma"""
-        self.speak("Hangi platformda açayım? YouTube veya Spotify?")
-        self.waiting_for_platform = True
+        self.ask("Hangi platformda açayım? YouTube veya Spotify?", DialogState.PLATFORM)
 
     def ask_song(self):
         """Şarkı sorma"""
-        self.speak("Hangi şarkıyı çalmamı istersiniz?")
-        self.waiting_for_song = True
+        self.ask("Hangi şarkıyı çalmamı istersiniz?", DialogState.SONG)
 
     def ask_youtube_song(self):
         """YouTube için şarkı sorma"""
-        self.speak("YouTube'da hangi şarkıyı açmamı istersiniz?")
-        self.waiting_for_song = True
+        self.ask("YouTube'da hangi şarkıyı açmamı istersiniz?", DialogState.YOUTUBE_SONG)
 
     def ask_spell(self):
         """Heceleme için metin sor"""
-        self.speak("Hangi metni hecelememi istersiniz?")
-        self.waiting_for_spell = True
+        self.ask("Hangi metni hecelememi istersiniz?", DialogState.SPELL)
 
     def play_music(self, platform, song_name=""):
         """Müzik çal"""
@@ -1395,13 +3930,13 @@ class Jarvis:
         hour = datetime.datetime.now().hour
         
         if 5 <= hour < 12:
-            return "Günaydın efendim! Yeni bir güne başlamak için harika bir zaman!"
+            return self.welcome_messages["morning"]
         elif 12 <= hour < 17:
-            return "Tünaydın efendim! Gününüz nasıl geçiyor?"
+            return self.welcome_messages["afternoon"]
         elif 17 <= hour < 22:
-            return "İyi akşamlar efendim! Günün yorgunluğunu atmaya hazır mısınız?"
+            return self.welcome_messages["evening"]
         else:
-            return "İyi geceler efendim! Hala burada olmanız harika!"
+            return self.welcome_messages["night"]
     
     # YENİ METOT: Spotify direkt açma
     def open_spotify_direct(self):
@@ -1418,428 +3953,439 @@ class Jarvis:
     # ==================== GÜNCELLENMİŞ EXECUTE_COMMAND ====================
     
     def execute_command(self, command):
-        """Komutu çalıştır - AKILLI SORU SORMA ENTEGRE EDİLDİ"""
-        
-        # Boş komut kontrolü
-        if not command or len(command.strip()) < 2:
-            return True
-        
-        # YENİ: Spotify aç komutu - EN BAŞTA
-        if any(word in command for word in ["spotify aç", "spotify'ı aç", "spotify'ı başlat"]):
-            self.open_spotify_direct()
-            return True
-            
-        # YENİ: YouTube aç komutu - EN BAŞTA
-        if any(word in command for word in ["youtube aç", "youtube'u aç", "youtube'u başlat"]):
-            self.open_youtube_direct()
-            return True
-        
-        # YENİ: Haberler aç komutu - EN BAŞTA
-        if any(word in command for word in ["haberleri aç", "haber oku", "haberler"]):
-            self.open_news()
-            return True
-        
-        # DUYGU ANALİZİ ENTEGRASYONU (SEVİYE 5)
-        if self.emotion_aware_mode:
-            emotional_response, emotion_analysis = self.analyze_emotion_in_text(command)
-            
-            # Eğer güçlü bir duygu tespit edildiyse ve son 2 dakikada yanıt vermediysek
-            current_time = time.time()
-            if (emotion_analysis and 
-                emotion_analysis.intensity > 0.5 and 
-                emotion_analysis.confidence > 0.6 and
-                (current_time - self.last_emotion_response_time) > 120):
-                
-                # Duyguya özel yanıt ver
-                if emotional_response:
-                    self.speak(emotional_response)
-                    self.last_emotion_response_time = current_time
-                    
-                    # Özellikle olumsuz duygular için ek destek
-                    if emotion_analysis.primary_emotion in [Emotion.SADNESS, Emotion.ANGER, Emotion.FEAR]:
-                        support_responses = [
-                            "Bu duyguyu hissetmek normal, yanındayım.",
-                            "Duyguların değerli, onları dinlemek önemli.",
-                            "Her duygu geçici, bu da geçecek."
-                        ]
-                        self.speak(random.choice(support_responses))
-        
-        # Güvenlik modu kontrolü
-        if self.security_mode:
-            if any(word in command for word in ["güvenlik kapat", "güvenlik modu kapat"]):
-                self.security_mode_off()
-                return True
-            else:
-                self.speak("Güvenlik modu aktif. Sadece güvenlik komutları çalışıyor.")
-                return True
-        
-        # Akıllı cevap kontrolü
-        if self.smart_response(command):
-            # YENİ: Akıllı soru sor
-            question = self.ask_intelligent_question(command)
-            if question:
-                time.sleep(1)
-                self.speak(question)
-            return True
-        
-        # Uyku modu kontrolü
-        if self.sleep_mode:
-            if any(word in command for word in ["uyan", "merhaba", "jarvis"]):
-                self.sleep_mode = False
-                self.sleep_conversation_active = False
-                self.speak("Uyandım! Seni özlemiştim. Nasılsın?")
-                return True
-            else:
-                return True
-        
-        # Google arama bekleniyorsa
-        if self.waiting_for_search:
-            self.waiting_for_search = False
-            self.google_search(command)
-            
-            # YENİ: Arama sonrası soru
-            if self.auto_question_mode and random.random() < 0.3:
-                time.sleep(2)
-                follow_up_questions = [
-                    "Bu konu hakkında başka ne öğrenmek istersiniz?",
-                    "Aradığınızı bulabildiniz mi?",
-                    "Bu konuda size başka nasıl yardımcı olabilirim?"
-                ]
-                self.speak(random.choice(follow_up_questions))
-                
-            return True
-            
-        # YENİ KOMUT: Derin düşünme modu
-        if any(word in command for word in ["derin düşünme", "akıllı mod", "düşünme modu"]):
-            if "aç" in command:
-                self.deep_think_mode = True
-                self.speak("Derin düşünme modu açık. Size daha akıllı sorular soracağım.")
-            elif "kapat" in command:
-                self.deep_think_mode = False
-                self.speak("Derin düşünme modu kapalı.")
-            else:
-                self.deep_think_mode = not self.deep_think_mode
-                status = "açık" if self.deep_think_mode else "kapalı"
-                self.speak(f"Derin düşünme modu {status}.")
-            return True
-        
-        # YENİ KOMUT: Soru modu
-        if any(word in command for word in ["soru modu", "soru sorma"]):
-            if "aç" in command:
-                self.auto_question_mode = True
-                self.speak("Otomatik soru sorma modu açık. Size daha çok soru soracağım.")
-            elif "kapat" in command:
-                self.auto_question_mode = False
-                self.speak("Otomatik soru sorma modu kapalı.")
-            else:
-                self.auto_question_mode = not self.auto_question_mode
-                status = "açık" if self.auto_question_mode else "kapalı"
-                self.speak(f"Otomatik soru sorma modu {status}.")
-            return True
-        
-        # YENİ KOMUT: Bana soru sor
-        if any(word in command for word in ["bana soru sor", "soru sor", "merak ettiğin"]):
-            question = self.ask_intelligent_question(command)
-            if question:
-                self.speak(question)
-            else:
-                self.speak(random.choice(self.intelligent_questions))
-            return True
+        """Komutu çalıştır - komut tablosu üzerinden tek geçişte yönlendirilir"""
         
-        # YENİ KOMUT: Konuşma analizi
-        if any(word in command for word in ["konuşma analizi", "ne konuştuk", "sohbet analizi"]):
-            analysis = self.analyze_conversation()
-            self.speak(analysis)
-            
-            # YENİ: Analiz sonrası soru
-            if self.auto_question_mode:
-                time.sleep(1)
-                follow_up = random.choice([
-                    "Bu analiz hakkında ne düşünüyorsunuz?",
-                    "Size hangi konularda daha fazla yardımcı olabilirim?",
-                    "Hangi konular hakkında daha çok konuşmak istersiniz?"
-                ])
-                self.speak(follow_up)
-                
+        # Boş komut kontrolü
+        if not command or len(command.strip()) < 2:
             return True
         
-        # YENİ: Derin yanıt
-        if self.deep_think_mode and len(command) > 10:
-            deep_response = self.generate_deep_response(command)
-            if deep_response and random.random() < 0.3:  # %30 şans
-                self.speak(deep_response)
+        # Duygu analizi beklenmez; yanıtı varsa çıkış kuyruğuna düşük öncelikle girer
+        if self.emotion_aware_mode:
+            self.defer_emotion_analysis(command)
         
-        # Duygu analizi özeti
-        if any(word in command for word in ["duygu özet", "duygu analizi", "nasıl hissediyorum"]):
-            summary = self.get_emotional_summary()
+        return self.command_registry.dispatch(command)
+    
+    def build_command_registry(self) -> CommandRegistry:
+        """Komut tablosunu kur
+
+        Kayıt sırası önceliktir ve eski if zincirinin sırasını birebir izler;
+        ifade içermeyen kayıtlar (mod kilitleri, geri dönüş) gerekli durum
+        etkin olduğunda, soru yanıtları ise yalnızca o soru beklenirken
+        her komutta adaydır.
+        """
+        registry = CommandRegistry(self, self.dialog)
+        add = registry.add
+        
+        # YENİ: Spotify / YouTube / Haberler - EN BAŞTA
+        add("spotify_open", ["spotify aç", "spotify'ı aç", "spotify'ı başlat"],
+            lambda command: self.open_spotify_direct())
+        add("youtube_open", ["youtube aç", "youtube'u aç", "youtube'u başlat"],
+            lambda command: self.open_youtube_direct())
+        add("news_open", ["haberleri aç", "haber oku", "haberler"],
+            lambda command: self.open_news())
+        
+        # Güvenlik modu: yalnızca güvenlik komutları çalışır
+        add("security_off", ["güvenlik kapat", "güvenlik modu kapat"],
+            lambda command: self.security_mode_off(), requires=("security_mode",))
+        add("security_lock", [],
+            lambda command: self.speak("Güvenlik modu aktif. Sadece güvenlik komutları çalışıyor."),
+            requires=("security_mode",))
+        
+        # Akıllı cevaplar (sözlük sırası öncelik sırasıdır)
+        for key, response in self.smart_responses.items():
+            add(f"smart:{key}", [key],
+                lambda command, response=response: self.answer_smart(command, response))
+        
+        # Uyku modu: yalnızca uyandırma sözcükleri
+        add("wake_up", ["uyan", "merhaba", "jarvis"], lambda command: self.wake_up(),
+            requires=("sleep_mode",))
+        add("sleep_reply", [], self.answer_sleep_reply, requires=("sleep_mode",),
+            dialog=DialogState.SLEEP_REPLY)
+        add("sleep_ignore", [], lambda command: True, requires=("sleep_mode",))
+        
+        add("search_answer", [], self.answer_search, dialog=DialogState.SEARCH)
+        
+        add("deep_think_mode", ["derin düşünme", "akıllı mod", "düşünme modu"], self.toggle_deep_think)
+        add("question_mode", ["soru modu", "soru sorma"], self.toggle_question_mode)
+        add("ask_me", ["bana soru sor", "soru sor", "merak ettiğin"], self.ask_me_question)
+        add("conversation_analysis", ["konuşma analizi", "ne konuştuk", "sohbet analizi"],
+            self.report_conversation_analysis)
+        
+        # YENİ: Derin yanıt - yönlendirmeyi durdurmaz
+        add("deep_response", [], self.maybe_deep_response, requires=("deep_think_mode",),
+            condition=lambda command: len(command) > 10, passthrough=True)
+        
+        add("emotion_summary", ["duygu özet", "duygu analizi", "nasıl hissediyorum"],
+            self.report_emotion_summary)
+        add("emotion_mode", ["duygu modu", "duygu farkındalık"], self.set_emotion_mode)
+        add("google_search", ["google'da ara", "google ara", "arama yap"], self.search_from_command)
+        
+        add("pause_music", ["duraklat", "müziği durdur", "şarkıyı durdur"], lambda command: self.pause_music())
+        add("switch_tab", ["sekme değiştir", "sekmeyi kapat ve geç"], lambda command: self.close_and_switch_tab())
+        add("netflix", ["film aç", "netflix aç"], lambda command: self.open_netflix())
+        add("maps", ["haritaları aç", "harita aç"], lambda command: self.open_maps())
+        add("youtube_song", ["şarkıyı youtube dan aç", "youtube dan şarkı aç"],
+            lambda command: self.ask_youtube_song())
+        add("change_song", ["şarkı değiştir", "müzik değiştir"], lambda command: self.next_track())
+        add("next_video", ["video değiştir", "sonraki video"], lambda command: self.next_video())
+        
+        add("youtuber_answer", [], self.answer_youtuber, dialog=DialogState.YOUTUBER)
+        add("video_answer", [], self.answer_video, dialog=DialogState.VIDEO)
+        add("youtube_song_answer", [], self.answer_youtube_song, dialog=DialogState.YOUTUBE_SONG)
+        
+        add("youtuber_video", ["video aç", "youtuber videosu aç"], lambda command: self.ask_youtuber())
+        add("fullscreen", ["tam ekran", "fullscreen"], lambda command: self.youtube_fullscreen())
+        
+        add("spell_answer", [], self.answer_spell, dialog=DialogState.SPELL)
+        add("spell", ["hecele", "heceleyerek oku"], lambda command: self.ask_spell())
+        
+        add("resume_music", ["şarkı devam et", "müzik devam et"], lambda command: self.resume_music())
+        add("next_track", ["sonraki şarkı", "bir sonraki"], lambda command: self.next_track())
+        add("previous_track", ["önceki şarkı", "bir önceki"], lambda command: self.previous_track())
+        add("time", ["saat kaç", "saati söyle"], lambda command: self.get_time())
+        add("weather", ["hava durumu", "hava nasıl"], lambda command: self.get_weather())
+        add("motivation", ["beni öv", "motivasyon"], lambda command: self.motivate_user())
+        add("daily_question", ["soru sor", "günlük soru"], lambda command: self.ask_daily_question())
+        add("sleep", ["uyku modu", "uyu"], lambda command: self.enter_sleep_mode())
+        add("security_on", ["güvenlik modu", "güvenlik aç"], lambda command: self.security_mode_on())
+        
+        add("platform_answer", [], self.answer_platform, dialog=DialogState.PLATFORM)
+        add("song_answer", [], self.answer_song, dialog=DialogState.SONG)
+        
+        # Normal komutlar
+        add("music", ["müzik aç", "şarkı aç"], lambda command: self.ask_platform())
+        add("musical", ["müzikal aç"], lambda command: self.open_musical())
+        add("volume_up", ["sesi aç"], lambda command: self.volume_up())
+        add("volume_down", ["sesi kıs"], lambda command: self.volume_down())
+        add("new_tab", ["sekme aç"], lambda command: self.open_new_tab())
+        add("close_tab", ["sekme kapat"], lambda command: self.close_tab())
+        add("chrome", ["chrome aç"], lambda command: self.open_chrome())
+        add("input_mode", ["mod değiştir"], lambda command: self.toggle_input_mode())
+        add("help", ["yardım", "komutlar"], lambda command: self.show_help())
+        add("shutdown", ["kapan", "çık", "dur jarvis", "güle güle"], self.say_goodbye)
+        
+        # Hiçbir komut eşleşmezse
+        add("fallback", [], self.fallback_response)
+        
+        return registry.compile()
+    
+    # ==================== KOMUT İŞLEYİCİLERİ ====================
+    
+    def defer_emotion_analysis(self, command):
+        """Komutu duygu işçisine bırak; kuyruk doluysa en eski komut atılır"""
+        while True:
+            try:
+                self.emotion_queue.put_nowait(command)
+                return
+            except queue.Full:
+                try:
+                    dropped = self.emotion_queue.get_nowait()
+                except queue.Empty:
+                    continue
+                self.emotion_queue.task_done()
+                print(f"⚠️  Duygu kuyruğu dolu, komut analiz edilmeden atıldı: {dropped}")
+    
+    def _emotion_worker(self):
+        while True:
+            command = self.emotion_queue.get()
+            try:
+                if command is None:
+                    return
+                self.respond_to_emotion(command)
+            except Exception as e:
+                print(f"Duygu analizi hatası: {e}")
+            finally:
+                self.emotion_queue.task_done()
+    
+    def flush_emotion_analysis(self):
+        """Kuyruktaki komutların analizi bitene kadar bekle (geçmişi okumadan önce)"""
+        if self.emotion_thread.is_alive():
+            self.emotion_queue.join()
+    
+    def respond_to_emotion(self, command):
+        """Güçlü bir duygu varsa ve son 2 dakikada yanıt vermediysek duyguya özel yanıt ver
+
+        Arka plan işçisinde çalışır; yanıtlar komut yanıtlarının önüne geçmez.
+        """
+        emotional_response, emotion_analysis = self.analyze_emotion_in_text(command)
+        
+        # Eğer güçlü bir duygu tespit edildiyse ve son 2 dakikada yanıt vermediysek
+        current_time = time.time()
+        if (emotion_analysis and 
+            emotion_analysis.intensity > 0.5 and 
+            emotion_analysis.confidence > 0.6 and
+            (current_time - self.last_emotion_response_time) > 120):
             
-            if summary.get("status") == "no_data":
-                self.speak("Henüz yeterli veri yok. Benimle biraz daha konuşun.")
-            else:
-                most_common = summary.get("most_common_emotion", "bilinmiyor")
-                stability = summary.get("emotional_stability_score", 0.5)
-                
-                response = f"Son analizlerinize göre en sık {most_common} hissediyorsunuz. "
-                if stability > 0.7:
-                    response += "Duygusal dengeniz oldukça stabil."
-                elif stability > 0.4:
-                    response += "Duygusal dengeniz orta seviyede."
-                else:
-                    response += "Duygusal dalgalanmalar yaşıyorsunuz."
-                
-                self.speak(response)
+            # Duyguya özel yanıt ver (veda başladıysa analiz yalnızca geçmişe yazılır)
+            if emotional_response and not self.shutting_down:
+                self.speak_emotion_reply(emotional_response)
+                self.last_emotion_response_time = current_time
                 
-                # YENİ: Duygu analizi sonrası soru
-                if self.auto_question_mode:
-                    time.sleep(1)
-                    emotion_questions = [
-                        "Bu duygusal durum hakkında ne düşünüyorsunuz?",
-                        "Duygularınızı daha iyi anlamak için size nasıl yardımcı olabilirim?",
-                        "Bu analiz size ne hissettirdi?"
+                # Özellikle olumsuz duygular için ek destek
+                if emotion_analysis.primary_emotion in [Emotion.SADNESS, Emotion.ANGER, Emotion.FEAR]:
+                    support_responses = [
+                        "Bu duyguyu hissetmek normal, yanındayım.",
+                        "Duyguların değerli, onları dinlemek önemli.",
+                        "Her duygu geçici, bu da geçecek."
                     ]
-                    self.speak(random.choice(emotion_questions))
-                    
-            return True
+                    self.speak_emotion_reply(random.choice(support_responses))
+    
+    def speak_emotion_reply(self, text: str):
+        """Duygu yanıtını düşük öncelikle söyle; veda başlarsa iptal edilebilsin"""
+        self.emotion_replies = [future for future in self.emotion_replies if not future.done()]
+        self.emotion_replies.append(self.speak(text, SpeechOutputQueue.LOW))
+    
+    def answer_smart(self, command, response):
+        """Akıllı cevap ver ve ardından akıllı soru sor"""
+        self.speak(response)
         
-        # Duygu modunu aç/kapat
-        if any(word in command for word in ["duygu modu", "duygu farkındalık"]):
-            if "aç" in command or "aktif" in command:
-                response = self.toggle_emotion_aware_mode(True)
-            elif "kapat" in command or "pasif" in command:
-                response = self.toggle_emotion_aware_mode(False)
-            else:
-                response = self.toggle_emotion_aware_mode()
-            
-            self.speak(response)
-            return True
+        # YENİ: Akıllı soru sor
+        question = self.ask_intelligent_question(command)
+        if question:
+            self.speak(question, pause=1.0)
+    
+    def wake_up(self):
+        """Uyku modundan çık"""
+        self.sleep_mode = False
+        self.sleep_conversation_active = False
+        self.speak("Uyandım! Seni özlemiştim. Nasılsın?")
+    
+    def enter_sleep_mode(self):
+        """Uyku moduna geç"""
+        self.sleep_mode = True
+        self.start_sleep_conversation()
+    
+    def answer_search(self, command):
+        """Bekleyen Google araması için yanıtı işle"""
+        self.google_search(command)
+        
+        # YENİ: Arama sonrası soru
+        if self.auto_question_mode and random.random() < 0.3:
+            follow_up_questions = [
+                "Bu konu hakkında başka ne öğrenmek istersiniz?",
+                "Aradığınızı bulabildiniz mi?",
+                "Bu konuda size başka nasıl yardımcı olabilirim?"
+            ]
+            self.speak(random.choice(follow_up_questions), pause=2.0)
+    
+    def toggle_deep_think(self, command):
+        """YENİ KOMUT: Derin düşünme modu"""
+        if "aç" in command:
+            self.deep_think_mode = True
+            self.speak("Derin düşünme modu açık. Size daha akıllı sorular soracağım.")
+        elif "kapat" in command:
+            self.deep_think_mode = False
+            self.speak("Derin düşünme modu kapalı.")
+        else:
+            self.deep_think_mode = not self.deep_think_mode
+            status = "açık" if self.deep_think_mode else "kapalı"
+            self.speak(f"Derin düşünme modu {status}.")
+    
+    def toggle_question_mode(self, command):
+        """YENİ KOMUT: Soru modu"""
+        if "aç" in command:
+            self.auto_question_mode = True
+            self.speak("Otomatik soru sorma modu açık. Size daha çok soru soracağım.")
+        elif "kapat" in command:
+            self.auto_question_mode = False
+            self.speak("Otomatik soru sorma modu kapalı.")
+        else:
+            self.auto_question_mode = not self.auto_question_mode
+            status = "açık" if self.auto_question_mode else "kapalı"
+            self.speak(f"Otomatik soru sorma modu {status}.")
+    
+    def ask_me_question(self, command):
+        """YENİ KOMUT: Bana soru sor"""
+        question = self.ask_intelligent_question(command)
+        if question:
+            self.speak(question)
+        else:
+            self.speak(random.choice(self.intelligent_questions))
+    
+    def report_conversation_analysis(self, command):
+        """YENİ KOMUT: Konuşma analizi"""
+        self.flush_emotion_analysis()
+        analysis = self.analyze_conversation()
+        self.speak(analysis)
         
-        # Google arama komutları
-        if any(word in command for word in ["google'da ara", "google ara", "arama yap"]):
-            search_terms = ["google'da ara", "google ara", "arama yap"]
-            
-            search_query = command
-            for term in search_terms:
-                search_query = search_query.replace(term, "").strip()
-            
-            if search_query and len(search_query) > 2:
-                self.google_search(search_query)
-            else:
-                self.ask_search()
-            return True
+        # YENİ: Analiz sonrası soru
+        if self.auto_question_mode:
+            follow_up = random.choice([
+                "Bu analiz hakkında ne düşünüyorsunuz?",
+                "Size hangi konularda daha fazla yardımcı olabilirim?",
+                "Hangi konular hakkında daha çok konuşmak istersiniz?"
+            ])
+            self.speak(follow_up, pause=1.0)
+    
+    def maybe_deep_response(self, command):
+        """YENİ: Derin yanıt (%30 şans)"""
+        deep_response = self.generate_deep_response(command)
+        if deep_response and random.random() < 0.3:  # %30 şans
+            self.speak(deep_response)
+    
+    def report_emotion_summary(self, command):
+        """Duygu analizi özeti"""
+        self.flush_emotion_analysis()
+        summary = self.get_emotional_summary()
         
-        # Müzik duraklatma
-        if any(word in command for word in ["duraklat", "müziği durdur", "şarkıyı durdur"]):
-            self.pause_music()
-            return True
-            
-        # Sekme değiştirme
-        if any(word in command for word in ["sekme değiştir", "sekmeyi kapat ve geç"]):
-            self.close_and_switch_tab()
-            return True
+        if summary.get("status") == "no_data":
+            self.speak("Henüz yeterli veri yok. Benimle biraz daha konuşun.")
+        else:
+            most_common = summary.get("most_common_emotion", "bilinmiyor")
+            stability = summary.get("emotional_stability_score", 0.5)
             
-        # Netflix
-        if any(word in command for word in ["film aç", "netflix aç"]):
-            self.open_netflix()
-            return True
+            response = f"Son analizlerinize göre en sık {most_common} hissediyorsunuz. "
+            if stability > 0.7:
+                response += "Duygusal dengeniz oldukça stabil."
+            elif stability > 0.4:
+                response += "Duygusal dengeniz orta seviyede."
+            else:
+                response += "Duygusal dalgalanmalar yaşıyorsunuz."
             
-        # Haritalar
-        if any(word in command for word in ["haritaları aç", "harita aç"]):
-            self.open_maps()
-            return True
-        
-        # YouTube şarkı
-        if any(word in command for word in ["şarkıyı youtube dan aç", "youtube dan şarkı aç"]):
-            self.ask_youtube_song()
-            return True
-        
-        # Şarkı değiştir
-        if any(word in command for word in ["şarkı değiştir", "müzik değiştir"]):
-            self.next_track()
-            return True
+            self.speak(response)
             
-        # Video değiştir
-        if any(word in command for word in ["video değiştir", "sonraki video"]):
-            pyautogui.hotkey('shift', 'n')
-            self.speak("Video değiştiriliyor")
-            return True
+            # YENİ: Duygu analizi sonrası soru
+            if self.auto_question_mode:
+                emotion_questions = [
+                    "Bu duygusal durum hakkında ne düşünüyorsunuz?",
+                    "Duygularınızı daha iyi anlamak için size nasıl yardımcı olabilirim?",
+                    "Bu analiz size ne hissettirdi?"
+                ]
+                self.speak(random.choice(emotion_questions), pause=1.0)
+    
+    def set_emotion_mode(self, command):
+        """Duygu modunu aç/kapat"""
+        if "aç" in command or "aktif" in command:
+            response = self.toggle_emotion_aware_mode(True)
+        elif "kapat" in command or "pasif" in command:
+            response = self.toggle_emotion_aware_mode(False)
+        else:
+            response = self.toggle_emotion_aware_mode()
         
-        # Youtuber bekleniyorsa
-        if self.waiting_for_youtuber:
-            self.waiting_for_youtuber = False
-            self.play_youtuber_video(command)
-            return True
-            
-        # Video açma kontrolü
-        if self.waiting_for_video:
-            self.waiting_for_video = False
-            self.play_video(command)
-            return True
-            
-        # YouTube şarkı açma kontrolü
-        if self.waiting_for_song:
-            self.waiting_for_song = False
-            self.play_youtube_song(command)
-            return True
-            
-        # YouTube youtuber komutu
-        if any(word in command for word in ["video aç", "youtuber videosu aç"]):
-            self.ask_youtuber()
-            return True
+        self.speak(response)
+    
+    def search_from_command(self, command):
+        """Google arama komutları"""
+        search_terms = ["google'da ara", "google ara", "arama yap"]
         
-        # YouTube tam ekran
-        if any(word in command for word in ["tam ekran", "fullscreen"]):
-            self.youtube_fullscreen()
-            return True
-            
-        # Heceleme modu kontrolü
-        if self.waiting_for_spell:
-            self.waiting_for_spell = False
-            self.spell_text(command)
-            return True
-            
-        # Heceleme komutu
-        if any(word in command for word in ["hecele", "heceleyerek oku"]):
-            self.ask_spell()
-            return True
+        search_query = command
+        for term in search_terms:
+            search_query = search_query.replace(term, "").strip()
         
-        # Şarkı devam et
-        if any(word in command for word in ["şarkı devam et", "müzik devam et"]):
-            self.resume_music()
-            return True
-            
-        # Sonraki şarkı
-        if any(word in command for word in ["sonraki şarkı", "bir sonraki"]):
-            self.next_track()
-            return True
-            
-        # Önceki şarkı
-        if any(word in command for word in ["önceki şarkı", "bir önceki"]):
-            self.previous_track()
-            return True
+        if search_query and len(search_query) > 2:
+            self.google_search(search_query)
+        else:
+            self.ask_search()
+    
+    def answer_youtuber(self, command):
+        """Youtuber bekleniyorsa"""
+        self.play_youtuber_video(command)
+    
+    def answer_video(self, command):
+        """Video açma kontrolü"""
+        self.play_video(command)
+    
+    def answer_youtube_song(self, command):
+        """YouTube şarkı açma kontrolü"""
+        self.play_youtube_song(command)
+    
+    def answer_spell(self, command):
+        """Heceleme modu kontrolü"""
+        self.spell_text(command)
+    
+    def answer_platform(self, command):
+        """Platform bekleniyorsa"""
+        if "youtube" in command:
+            self.current_platform = "youtube"
+            self.ask_song()
+        elif "spotify" in command:
+            self.current_platform = "spotify"
+            self.ask_song()
+        else:
+            self.speak("Anlayamadım, YouTube veya Spotify seçin")
+            self.ask_platform()
+    
+    def answer_song(self, command):
+        """Şarkı bekleniyorsa"""
+        self.play_music(self.current_platform, command)
+    
+    def next_video(self):
+        """Video değiştir"""
+        pyautogui.hotkey('shift', 'n')
+        self.speak("Video değiştiriliyor")
+    
+    def open_musical(self):
+        self.speak("Müzikal açılıyor")
+        webbrowser.open("https://www.youtube.com/results?search_query=müzikal")
+    
+    def volume_up(self):
+        self.speak("Ses açılıyor")
+        for i in range(5):
+            pyautogui.press('volumeup')
+    
+    def volume_down(self):
+        self.speak("Ses kısılıyor")
+        for i in range(5):
+            pyautogui.press('volumedown')
+    
+    def open_new_tab(self):
+        self.speak("Yeni sekme açılıyor")
+        pyautogui.hotkey('ctrl', 't')
+    
+    def close_tab(self):
+        self.speak("Sekme kapatılıyor")
+        pyautogui.hotkey('ctrl', 'w')
+    
+    def open_chrome(self):
+        self.speak("Chrome açılıyor")
+        webbrowser.open("https://www.google.com")
+    
+    def toggle_input_mode(self):
+        """YENİ KOMUT: mod değiştir"""
+        self.keyboard_mode = not self.keyboard_mode
+        mode = "klavye" if self.keyboard_mode else "ses"
+        self.speak(f"{mode} moduna geçildi")
+    
+    def say_goodbye(self, command):
+        """Kapatma komutu: kapanmadan önce duygu özeti ver
+
+        Özet, kuyruktaki son komutlar da analiz edildikten sonra okunur;
+        henüz çalınmamış duygu yanıtları veda sözlerinin ardından gelmesin
+        diye iptal edilir.
+        """
+        self.shutting_down = True
+        self.flush_emotion_analysis()
+        for future in self.emotion_replies:
+            future.cancel()
         
-        # Saat
-        if any(word in command for word in ["saat kaç", "saati söyle"]):
-            self.get_time()
-            return True
-            
-        # Hava durumu
-        if any(word in command for word in ["hava durumu", "hava nasıl"]):
-            self.get_weather()
-            return True
+        if self.emotion_aware_mode and len(self.emotion_analyzer.emotion_history) > 0:
+            summary = self.get_emotional_summary()
+            if summary.get("status") != "no_data":
+                most_common = summary.get("most_common_emotion", "bilinmiyor")
+                self.speak(f"Bugün en çok {most_common} hissettiniz. ")
         
-        # Motivasyon
-        if any(word in command for word in ["beni öv", "motivasyon"]):
-            self.motivate_user()
-            return True
+        self.speak("JARVIS kapanıyor. Harika bir gün geçirmeni dilerim!")
+        return False
+    
+    def fallback_response(self, command):
+        """Hiçbir komut eşleşmediğinde"""
+        if len(command) > 3:
+            # YENİ: Derin düşünme yanıtı
+            if self.deep_think_mode and random.random() < 0.2:
+                deep_response = self.generate_deep_response(command)
+                if deep_response:
+                    self.speak(deep_response)
             
-        # Günlük soru
-        if any(word in command for word in ["soru sor", "günlük soru"]):
-            self.ask_daily_question()
-            return True
-
-        # Uyku modu
-        if any(word in command for word in ["uyku modu", "uyu"]):
-            self.sleep_mode = True
-            self.start_sleep_conversation()
-            return True
-
-        # Güvenlik modu
-        if any(word in command for word in ["güvenlik modu", "güvenlik aç"]):
-            self.security_mode_on()
-            return True
-
-        # Platform bekleniyorsa
-        if self.waiting_for_platform:
-            self.waiting_for_platform = False
-            if "youtube" in command:
-                self.current_platform = "youtube"
-                self.ask_song()
-            elif "spotify" in command:
-                self.current_platform = "spotify"
-                self.ask_song()
+            # YENİ: Akıllı soru
+            question = self.ask_intelligent_question(command)
+            if question:
+                self.speak(question)
             else:
-                self.speak("Anlayamadım, YouTube veya Spotify seçin")
-                self.ask_platform()
-            return True
-
-        # Şarkı bekleniyorsa
-        if self.waiting_for_song:
-            self.waiting_for_song = False
-            self.play_music(self.current_platform, command)
-            return True
-
-        # Normal komutlar
-        if "müzik aç" in command or "şarkı aç" in command:
-            self.ask_platform()
-            
-        elif "müzikal aç" in command:
-            self.speak("Müzikal açılıyor")
-            webbrowser.open("https://www.youtube.com/results?search_query=müzikal")
-            
-        elif "sesi aç" in command:
-            self.speak("Ses açılıyor")
-            for i in range(5):
-                pyautogui.press('volumeup')
-                
-        elif "sesi kıs" in command:
-            self.speak("Ses kısılıyor")
-            for i in range(5):
-                pyautogui.press('volumedown')
-                
-        elif "sekme aç" in command:
-            self.speak("Yeni sekme açılıyor")
-            pyautogui.hotkey('ctrl', 't')
-            
-        elif "sekme kapat" in command:
-            self.speak("Sekme kapatılıyor")
-            pyautogui.hotkey('ctrl', 'w')
-            
-        elif "chrome aç" in command:
-            self.speak("Chrome açılıyor")
-            webbrowser.open("https://www.google.com")
-            
-        # YENİ KOMUT: mod değiştir
-        elif "mod değiştir" in command:
-            self.keyboard_mode = not self.keyboard_mode
-            mode = "klavye" if self.keyboard_mode else "ses"
-            self.speak(f"{mode} moduna geçildi")
-            
-        # YENİ KOMUT: yardım
-        elif "yardım" in command or "komutlar" in command:
-            self.show_help()
-            
-        # Kapatma komutu
-        elif any(word in command for word in ["kapan", "çık", "dur jarvis", "güle güle"]):
-            # Kapanmadan önce duygu özeti ver
-            if self.emotion_aware_mode and len(self.emotion_analyzer.emotion_history) > 0:
-                summary = self.get_emotional_summary()
-                if summary.get("status") != "no_data":
-                    most_common = summary.get("most_common_emotion", "bilinmiyor")
-                    self.speak(f"Bugün en çok {most_common} hissettiniz. ")
-            
-            self.speak("JARVIS kapanıyor. Harika bir gün geçirmeni dilerim!")
-            return False
-            
-        else:
-            if len(command) > 3:
-                # YENİ: Derin düşünme yanıtı
-                if self.deep_think_mode and random.random() < 0.2:
-                    deep_response = self.generate_deep_response(command)
-                    if deep_response:
-                        self.speak(deep_response)
-                
-                # YENİ: Akıllı soru
-                question = self.ask_intelligent_question(command)
-                if question:
-                    self.speak(question)
+                # Duygu farkındalık modu açıksa, daha empatik bir yanıt
+                if self.emotion_aware_mode:
+                    self.speak("Bu komutu anlamadım, ama duygularınızı dinlemeye devam ediyorum.")
                 else:
-                    # Duygu farkındalık modu açıksa, daha empatik bir yanıt
-                    if self.emotion_aware_mode:
-                        self.speak("Bu komutu anlamadım, ama duygularınızı dinlemeye devam ediyorum.")
-                    else:
-                        self.speak("Bu komutu anlamadım.")
-            
-        return True
+                    self.speak("Bu komutu anlamadım.")
 
     # ==================== YENİ VE MEVCUT METOTLAR ====================
     
@@ -1929,70 +4475,495 @@ class Jarvis:
         
         # YENİ: Yardım sonrası soru
         if self.auto_question_mode:
-            time.sleep(1)
-            self.speak("Size hangi konuda yardımcı olmamı istersiniz?")
+            self.speak("Size hangi konuda yardımcı olmamı istersiniz?", pause=1.0)
 
-    def background_listener(self):
-        """Arka plan dinleyici"""
+    def print_status(self):
+        """Çalışma modlarını göster"""
         print("\n🔄 JARVIS arka planda çalışıyor...")
         print("🔊 Mikrofon modu: " + ("AKTİF" if not self.keyboard_mode else "PASİF"))
         print("🧠 Derin düşünme: " + ("AÇIK" if self.deep_think_mode else "KAPALI"))
         print("❓ Soru modu: " + ("AÇIK" if self.auto_question_mode else "KAPALI"))
         print("💡 Yardım için 'yardım' yazın veya söyleyin\n")
-        
-        while self.is_listening:
-            try:
-                if self.keyboard_mode:
-                    command = self.get_keyboard_input()
-                else:
-                    command = self.listen()
-                    
-                if command:
-                    if not self.execute_command(command):
-                        self.is_listening = False
-                else:
-                    time.sleep(1)
-                    self.auto_motivation_check()
-                    
-            except Exception as e:
-                print(f"Hata: {e}")
-                time.sleep(2)
-                continue
 
-    def start(self):
-        """JARVIS'i başlat"""
+    def greet(self):
+        """Hoşgeldin, mikrofon kontrolü ve açılış mesajları"""
+        # Sabit ifadeleri arka planda önbelleğe al
+        self.prewarm_tts_cache()
+        
         # Tematik hoşgeldin mesajı
         welcome_msg = self.get_welcome_message()
         self.speak(welcome_msg)
-        time.sleep(1)
+        pause = 1.0
         
         # Mikrofon kontrolü
         if not self.check_microphone():
-            self.speak("Mikrofon bulunamadı. Klavye moduna geçiliyor.")
+            self.speak("Mikrofon bulunamadı. Klavye moduna geçiliyor.", pause=pause)
+            pause = 0.0
             print("⚠️  Klavye modu aktif. Komutları yazılı olarak girebilirsiniz.")
             print("   Çıkmak için 'kapan' yazın")
         
         # Sistem bilgisi
-        self.speak("Seviye 5 duygu analizi sistemi aktif.")
-        self.speak("Spotify ve YouTube direkt açma özelliği aktif.")
-        self.speak("Akıllı soru sorma modu aktif.")
+        for message in self.startup_messages:
+            self.speak(message, pause=pause)
+            pause = 0.0
         
         # YENİ: İlk soru
         if self.auto_question_mode:
-            time.sleep(1)
-            first_questions = [
-                "Size nasıl yardımcı olabilirim?",
-                "Bugün nasılsınız?",
-                "Merak ettiğiniz bir konu var mı?",
-                "Sohbet etmek istediğiniz bir şey var mı?"
-            ]
-            self.speak(random.choice(first_questions))
-        
+            self.speak(random.choice(self.first_questions), pause=1.0)
+
+    def start(self) -> threading.Thread:
+        """JARVIS'i başlat (asyncio çalışma zamanı arka plan iş parçacığında)"""
         self.is_listening = True
-        
-        background_thread = threading.Thread(target=self.background_listener)
+        runtime = AsyncJarvisRuntime(self)
+        background_thread = threading.Thread(target=asyncio.run, args=(runtime.run(),))
         background_thread.daemon = True
         background_thread.start()
+        return background_thread
+
+# ==================== ASYNCIO ÇALIŞMA ZAMANI ====================
+
+class AsyncJarvisRuntime:
+    """JARVIS'in tek olay döngüsünde çalışan görevleri
+
+    Dinleme → komut yürütme zinciri ile zamanlayıcılar (motivasyon, uyku
+    sohbeti) asyncio kuyruklarıyla bağlı görevlerdir. Engelleyen kütüphaneler
+    yürütücülerde çalışır: komutlar ve zamanlayıcı eylemleri tek iş
+    parçacıklı yürütücüde sırayla işlenir; yakalama, eşzamanlı tanıma ve
+    sıralı teslim RecognitionPool'dadır; konuşma çıkışı SpeechOutputQueue'dadır.
+    Hatayla biten görev çalışma zamanını durdurur; her şey run() sonunda
+    tek noktada iptal edilir.
+    """
+    
+    def __init__(self, jarvis: "Jarvis", recognition_workers: int = 4, recognition_timeout: float = 8.0,
+                 motivation_interval: float = 60.0, sleep_reply_window: float = 8.0, greet: bool = True):
+        self.jarvis = jarvis
+        self.recognition_workers = recognition_workers
+        self.recognition_timeout = recognition_timeout
+        self.motivation_interval = motivation_interval
+        self.sleep_reply_window = sleep_reply_window
+        self.greet = greet
+        self.loop = None
+        self.tasks: List[asyncio.Task] = []
+        self._sleep_task = None
+        self._stopped = None
+    
+    async def run(self):
+        """Görevleri başlat ve durdurulana kadar çalış"""
+        self.loop = asyncio.get_running_loop()
+        self._stopped = asyncio.Event()
+        self.commands = asyncio.Queue()
+        self.dispatch_executor = ThreadPoolExecutor(max_workers=1)
+        
+        jarvis = self.jarvis
+        jarvis.runtime = self
+        jarvis.is_listening = True
+        jarvis.recognition_workers = self.recognition_workers
+        jarvis.recognition_timeout = self.recognition_timeout
+        try:
+            if self.greet:
+                await self.loop.run_in_executor(self.dispatch_executor, jarvis.greet)
+            jarvis.print_status()
+            
+            self.tasks = [
+                self.start_task(coroutine) for coroutine in (
+                    self.listen(),
+                    self.read_keyboard(),
+                    self.dispatch(),
+                    self.motivation_timer()
+                )
+            ]
+            await self._stopped.wait()
+        finally:
+            await self.shutdown()
+    
+    def start_task(self, coroutine) -> asyncio.Task:
+        """Görevi başlat; hatayla biterse çalışma zamanı durur (run() sonsuza dek beklemez)"""
+        task = asyncio.ensure_future(coroutine)
+        task.add_done_callback(self._task_done)
+        return task
+    
+    def _task_done(self, task: asyncio.Task):
+        if task.cancelled() or task.exception() is None:
+            return
+        print(f"❌ {task.get_coro().__name__} görevi durdu: {task.exception()}")
+        self.stop()
+    
+    def stop(self):
+        """Çalışma zamanını durdur (herhangi bir iş parçacığından çağrılabilir)"""
+        if self.loop is not None and not self.loop.is_closed():
+            self.loop.call_soon_threadsafe(self._stopped.set)
+    
+    async def shutdown(self):
+        """Tek kapanış noktası: görevleri iptal et, kaydı ve yürütücüleri kapat"""
+        tasks = self.tasks + ([self._sleep_task] if self._sleep_task is not None else [])
+        for task in tasks:
+            task.cancel()
+        await asyncio.gather(*tasks, return_exceptions=True)
+        self.tasks = []
+        self._sleep_task = None
+        
+        self.jarvis.runtime = None
+        self.jarvis.is_listening = False
+        await self.loop.run_in_executor(None, self.jarvis.close_microphone_stream)
+        self.dispatch_executor.shutdown(wait=False)
+    
+    def in_daemon_thread(self, function, *args) -> asyncio.Future:
+        """İptal edilemeyen engelleyen çağrıyı (ör. input) daemon iş parçacığında çalıştır
+
+        Yürütücü iş parçacıkları çıkışta beklendiğinden klavye okuması
+        kapanışı bekletmesin diye ayrı tutulur.
+        """
+        future = self.loop.create_future()
+        
+        def resolve(result, error):
+            if not future.done():
+                if error is not None:
+                    future.set_exception(error)
+                else:
+                    future.set_result(result)
+        
+        def target():
+            result, error = None, None
+            try:
+                result = function(*args)
+            except Exception as e:
+                error = e
+            try:
+                self.loop.call_soon_threadsafe(resolve, result, error)
+            except RuntimeError:
+                pass  # Döngü kapandı
+        
+        threading.Thread(target=target, daemon=True).start()
+        return future
+    
+    async def listen(self):
+        """Dinleme görevi: tanıma havuzunun sıralı sonuçlarını komut kuyruğuna aktar
+
+        Yakalama, uyandırma sözcüğü kapısı, eşzamanlı tanıma, sıralı teslim
+        ve süre aşımı Jarvis.listen arkasındaki RecognitionPool'dadır.
+        """
+        jarvis = self.jarvis
+        while True:
+            if jarvis.keyboard_mode:
+                await asyncio.sleep(0.25)
+                continue
+            
+            command = await self.loop.run_in_executor(None, jarvis.listen, 0.5)
+            if command is None:
+                # Ses kaynağı bitti
+                await self.commands.put(None)
+                return
+            if command:
+                await self.commands.put(command)
+    
+    async def read_keyboard(self):
+        """Klavye görevi: komut işlenene kadar yeni satır istenmez"""
+        jarvis = self.jarvis
+        while True:
+            if not jarvis.keyboard_mode:
+                await asyncio.sleep(0.25)
+                continue
+            
+            command = await self.in_daemon_thread(jarvis.get_keyboard_input)
+            if command:
+                await self.commands.put(command)
+                await self.commands.join()
+    
+    async def dispatch(self):
+        """Komut görevi: komutları tek iş parçacığında sırayla yürüt"""
+        jarvis = self.jarvis
+        while True:
+            command = await self.commands.get()
+            try:
+                if command is None:
+                    self.stop()
+                    return
+                if jarvis.barge_in:
+                    # Kullanıcı konuşurken JARVIS susar
+                    jarvis.speech.interrupt()
+                keep_running = await self.loop.run_in_executor(
+                    self.dispatch_executor, jarvis.execute_command, command
+                )
+                if not keep_running:
+                    self.stop()
+                    return
+            except Exception as e:
+                print(f"Hata: {e}")
+            finally:
+                self.commands.task_done()
+    
+    async def motivation_timer(self):
+        """Zamanlayıcı görevi: periyodik motivasyon kontrolü"""
+        while True:
+            await asyncio.sleep(self.motivation_interval)
+            await self.loop.run_in_executor(self.dispatch_executor, self.jarvis.auto_motivation_check)
+    
+    def schedule_sleep_conversation(self):
+        """Uyku sohbeti görevini başlat (komut iş parçacığından çağrılır)"""
+        self.loop.call_soon_threadsafe(self._start_sleep_conversation)
+    
+    def _start_sleep_conversation(self):
+        if self._sleep_task is None or self._sleep_task.done():
+            self._sleep_task = self.start_task(self.sleep_conversation())
+    
+    async def sleep_conversation(self):
+        """Zamanlayıcı görevi: uyku modunda aralıklarla sohbet sorusu sor
+
+        Yanıt ayrıca dinlenmez; SLEEP_REPLY sorusu olarak komut akışından gelir.
+        """
+        jarvis = self.jarvis
+        pause = 2.0
+        while jarvis.sleep_mode and jarvis.sleep_conversation_active:
+            question = random.choice(jarvis.sleep_conversation_questions)
+            # Kesilen konuşma görevi iptal etmesin: yalnızca bitmesini bekle
+            await asyncio.wait([asyncio.wrap_future(jarvis.speak(question, pause=pause))])
+            pause = 0.0
+            
+            jarvis.dialog.expect(DialogState.SLEEP_REPLY, self.sleep_reply_window)
+            await asyncio.sleep(self.sleep_reply_window + random.randint(15, 30))
+
+# ==================== ÇEVRİMDIŞI TRANSKRİPT ANALİZİ ====================
+
+_worker_analyzer = None
+
+def _init_analysis_worker():
+    """İşçi süreç için analizörü bir kez oluştur"""
+    global _worker_analyzer
+    _worker_analyzer = Level5EmotionAnalyzer()
+
+def _classify_shard(texts: List[str], hour: int) -> List[Tuple[EmotionalState, List[str]]]:
+    """İşçi süreçte bir parçanın durumsuz analizini yap"""
+    return _worker_analyzer.classify_many(texts, hour)
+
+def read_transcript_texts(lines: Iterable[str]) -> Iterator[str]:
+    """JSONL transkript satırlarından metinleri oku ({"text": ...} veya düz JSON metni)"""
+    for line_number, line in enumerate(lines, 1):
+        line = line.strip()
+        if not line:
+            continue
+        try:
+            record = json.loads(line)
+        except json.JSONDecodeError:
+            print(f"⚠️  Satır {line_number} okunamadı, atlanıyor", file=sys.stderr)
+            continue
+        text = record.get("text") if isinstance(record, dict) else record
+        if isinstance(text, str) and text.strip():
+            yield text
+
+def iter_shards(items: Iterable[Any], size: int) -> Iterator[List[Any]]:
+    """Öğeleri sabit boyutlu parçalara böl"""
+    shard = []
+    for item in items:
+        shard.append(item)
+        if len(shard) >= size:
+            yield shard
+            shard = []
+    if shard:
+        yield shard
+
+def analysis_record(text: str, analysis: EmotionalState, topics: List[str]) -> Dict[str, Any]:
+    """Analiz sonucunu JSON satırına uygun sözlüğe çevir"""
+    return {
+        "text": text,
+        "emotion": analysis.primary_emotion.value,
+        "secondary_emotions": [emotion.value for emotion in analysis.secondary_emotions],
+        "intensity": round(analysis.intensity, 4),
+        "confidence": round(analysis.confidence, 4),
+        "triggers": analysis.triggers,
+        "topics": topics
+    }
+
+def analyze_transcripts(input_path: str, output_path: Optional[str] = None,
+                        workers: Optional[int] = None, chunk_size: int = 1000) -> int:
+    """Transkript dosyasını süreç havuzunda analiz et
+
+    Durumsuz adımlar (1-5) parçalar halinde işçi süreçlere dağıtılır;
+    sıraya bağlı adımlar (geçmiş entegrasyonu, profil güncelleme) ana
+    süreçte girdi sırasıyla uygulanır, böylece sonuç işçi sayısından
+    bağımsızdır. Analiz edilen satır sayısını döndürür.
+    """
+    analyzer = Level5EmotionAnalyzer()
+    hour = datetime.datetime.now().hour  # Tüm parçalar aynı saatle değerlendirilir
+    if workers is None:
+        workers = os.cpu_count() or 1
+    elif workers < 1:
+        raise ValueError(f"İşçi sayısı en az 1 olmalı: {workers}")
+    
+    source = sys.stdin if input_path == "-" else open(input_path, encoding="utf-8")
+    target = sys.stdout if not output_path or output_path == "-" else open(output_path, "w", encoding="utf-8")
+    count = 0
+    
+    def write_shard(texts, classified):
+        nonlocal count
+        for text, (analysis, topics) in zip(texts, classified):
+            analysis = analyzer.finalize_analysis(text, analysis, topics)
+            target.write(json.dumps(analysis_record(text, analysis, topics), ensure_ascii=False) + "\n")
+            count += 1
+    
+    try:
+        shards = iter_shards(read_transcript_texts(source), chunk_size)
+        if workers == 1:
+            for texts in shards:
+                write_shard(texts, analyzer.classify_many(texts, hour))
+        else:
+            # Uçuştaki parça sayısı sınırlı: tüm dosya belleğe alınmaz
+            with ProcessPoolExecutor(max_workers=workers, initializer=_init_analysis_worker) as pool:
+                pending = deque()
+                for texts in shards:
+                    pending.append((texts, pool.submit(_classify_shard, texts, hour)))
+                    if len(pending) >= workers * 2:
+                        texts, future = pending.popleft()
+                        write_shard(texts, future.result())
+                while pending:
+                    texts, future = pending.popleft()
+                    write_shard(texts, future.result())
+    finally:
+        if source is not sys.stdin:
+            source.close()
+        if target is not sys.stdout:
+            target.close()
+    
+    return count
+
+def iter_response_records(analyzer: Level5EmotionAnalyzer,
+                          analyses: Iterable[Tuple[str, EmotionalState, List[str]]],
+                          with_responses: bool = True) -> Iterator[Dict[str, Any]]:
+    """Akış aşaması 4: analizleri yanıtlı JSON kayıtlarına çevir"""
+    for text, analysis, topics in analyses:
+        record = analysis_record(text, analysis, topics)
+        if with_responses:
+            record["response"] = analyzer.generate_emotional_response(analysis, text)
+        yield record
+
+def stream_transcripts(input_path: str = "-", output_path: Optional[str] = None,
+                       window: int = 100, with_responses: bool = True) -> int:
+    """Transkripti satır satır oku, analiz et ve JSON satırı olarak yaz
+
+    Okuma → metin analizi (önbellekli) → bağlam → sınıflandırma → yanıt
+    aşamaları zincirlenmiş üreteçlerdir; bellekte yalnızca sabit boyutlu
+    bir durum penceresi tutulur.
+    """
+    analyzer = Level5EmotionAnalyzer(history_limit=window, intensity_limit=window)
+    source = sys.stdin if input_path == "-" else open(input_path, encoding="utf-8")
+    target = sys.stdout if not output_path or output_path == "-" else open(output_path, "w", encoding="utf-8")
+    count = 0
+    
+    try:
+        analyses = analyzer.stream_analyses(read_transcript_texts(source))
+        for record in iter_response_records(analyzer, analyses, with_responses):
+            target.write(json.dumps(record, ensure_ascii=False) + "\n")
+            target.flush()
+            count += 1
+    finally:
+        if source is not sys.stdin:
+            source.close()
+        if target is not sys.stdout:
+            target.close()
+    
+    return count
+
+def run_stream_command(args) -> int:
+    """'stream' alt komutunu çalıştır"""
+    count = stream_transcripts(args.input, args.output, args.window, not args.no_responses)
+    print(f"✅ {count} satır işlendi", file=sys.stderr)
+    return 0
+
+def run_analyze_command(args) -> int:
+    """'analyze' alt komutunu çalıştır"""
+    start_time = time.time()
+    count = analyze_transcripts(args.input, args.output, args.workers, args.chunk_size)
+    elapsed = time.time() - start_time
+    rate = count / elapsed * 3600 if elapsed > 0 else 0
+    print(f"✅ {count} satır analiz edildi ({elapsed:.1f} sn, saatte ~{rate:,.0f} satır)", file=sys.stderr)
+    return 0
+
+def run_prewarm_command(args) -> int:
+    """'prewarm' alt komutunu çalıştır"""
+    def report(done, total, failed):
+        print(f"\r🔊 {done}/{total} ifade işlendi ({failed} hata)", end="", file=sys.stderr)
+    
+    jarvis = Jarvis(tts_cache=TTSCache(args.cache_dir) if args.cache_dir else None)
+    succeeded, total = jarvis.warm_tts_cache(args.workers, report)
+    print(file=sys.stderr)
+    print(f"✅ {succeeded}/{total} ifade önbellekte", file=sys.stderr)
+    return 0 if succeeded == total else 1
+
+def positive_int(value: str) -> int:
+    """En az 1 olan tam sayı argümanı"""
+    try:
+        number = int(value)
+    except ValueError:
+        raise argparse.ArgumentTypeError(f"Geçersiz sayı: {value}")
+    if number < 1:
+        raise argparse.ArgumentTypeError(f"En az 1 olmalı: {value}")
+    return number
+
+def parse_wake_interval(value: str) -> Tuple[float, float]:
+    """'1.2-1.9' biçimindeki aralığı (başlangıç, bitiş) olarak ayrıştır"""
+    try:
+        start, end = (float(part) for part in value.split("-", 1))
+    except ValueError:
+        raise argparse.ArgumentTypeError(f"Geçersiz aralık: {value} (ör. 1.2-1.9)")
+    return start, end
+
+def run_wake_eval_command(args) -> int:
+    """'wake-eval' alt komutunu çalıştır"""
+    if args.templates:
+        spotter = TemplateWakeWordSpotter.from_wav_files(args.templates, threshold=args.threshold)
+    else:
+        spotter = SphinxWakeWordSpotter(sr.Recognizer(), keywords=args.keyword, language=args.language)
+    report = evaluate_wake_word_spotter(spotter, args.audio, args.wake or [], args.tolerance)
+    print(json.dumps(report, ensure_ascii=False, indent=2))
+    return 0
+
+def run_bench_commands_command(args) -> int:
+    """'bench-commands' alt komutunu çalıştır"""
+    for row in benchmark_command_dispatch(args.sizes, args.repeat):
+        print(f"{row['commands']:>7} komut: tablo {row['indexed_us']:>8.2f} µs, "
+              f"doğrusal tarama {row['linear_us']:>10.2f} µs")
+    return 0
+
+def build_arg_parser() -> argparse.ArgumentParser:
+    """Komut satırı ayrıştırıcısını oluştur"""
+    parser = argparse.ArgumentParser(description="JARVIS 3.5 - Yapay Zeka Asistanı")
+    subparsers = parser.add_subparsers(dest="command")
+    
+    analyze_parser = subparsers.add_parser("analyze", help="Transkript dosyasını çevrimdışı analiz et")
+    analyze_parser.add_argument("--input", required=True, help="JSONL transkript dosyası ('-' = stdin)")
+    analyze_parser.add_argument("--output", default="-", help="JSONL çıktı dosyası ('-' = stdout)")
+    analyze_parser.add_argument("--workers", type=positive_int, default=None, help="İşçi süreç sayısı (varsayılan: CPU sayısı)")
+    analyze_parser.add_argument("--chunk-size", type=positive_int, default=1000, help="İşçi başına parça boyutu")
+    analyze_parser.set_defaults(handler=run_analyze_command)
+    
+    stream_parser = subparsers.add_parser("stream", help="Transkripti akış halinde, sınırlı bellekle analiz et")
+    stream_parser.add_argument("--input", default="-", help="JSONL transkript dosyası ('-' = stdin)")
+    stream_parser.add_argument("--output", default="-", help="JSONL çıktı dosyası ('-' = stdout)")
+    stream_parser.add_argument("--window", type=int, default=100, help="Tutulacak geçmiş penceresi")
+    stream_parser.add_argument("--no-responses", action="store_true", help="Yanıt metni üretme")
+    stream_parser.set_defaults(handler=run_stream_command)
+    
+    prewarm_parser = subparsers.add_parser("prewarm", help="Sabit ifadeleri ses önbelleğine önceden yaz")
+    prewarm_parser.add_argument("--workers", type=positive_int, default=4, help="Eşzamanlı sentez sayısı")
+    prewarm_parser.add_argument("--cache-dir", default=None, help="Önbellek dizini (varsayılan: ~/.cache/jarvis/tts)")
+    prewarm_parser.set_defaults(handler=run_prewarm_command)
+    
+    wake_parser = subparsers.add_parser("wake-eval", help="Uyandırma sözcüğü bulucuyu kayıtlı ses üzerinde ölç")
+    wake_parser.add_argument("--audio", required=True, help="16 bit WAV kayıt")
+    wake_parser.add_argument("--wake", type=parse_wake_interval, action="append",
+                             help="Sözcüğün söylendiği aralık, saniye (ör. 1.2-1.9); tekrarlanabilir")
+    wake_parser.add_argument("--templates", nargs="+", help="Şablon WAV dosyaları (yoksa PocketSphinx)")
+    wake_parser.add_argument("--threshold", type=float, default=0.6, help="Şablon DTW eşiği")
+    wake_parser.add_argument("--keyword", nargs="+", default=["jarvis"], help="PocketSphinx anahtar sözcükleri")
+    wake_parser.add_argument("--language", default="en-US", help="PocketSphinx dil modeli")
+    wake_parser.add_argument("--tolerance", type=float, default=0.5, help="Eşleştirme toleransı (sn)")
+    wake_parser.set_defaults(handler=run_wake_eval_command)
+    
+    bench_parser = subparsers.add_parser("bench-commands", help="Komut eşleştirme maliyetini kayıt sayısına göre ölç")
+    bench_parser.add_argument("--sizes", type=int, nargs="+", default=[10, 100, 1000, 10000], help="Tablo boyutları")
+    bench_parser.add_argument("--repeat", type=int, default=2000, help="Komut başına tekrar sayısı")
+    bench_parser.set_defaults(handler=run_bench_commands_command)
+    
+    return parser
 
 # ==================== ANA PROGRAM ====================
 
@@ -2024,6 +4995,10 @@ def install_requirements():
 
 def main():
     """Ana program"""
+    args = build_arg_parser().parse_args()
+    if args.command:
+        return args.handler(args)
+    
     # Konsol temizle
     os.system('cls' if os.name == 'nt' else 'clear')
     
@@ -2037,22 +5012,25 @@ def main():
     
     time.sleep(2)
     
+    jarvis = None
     try:
         jarvis = Jarvis()
-        jarvis.start()
-        
-        # Ana döngü
-        while jarvis.is_listening:
-            time.sleep(1)
+        # Tüm görevler tek olay döngüsünde; Ctrl+C döngüyü iptal eder
+        asyncio.run(AsyncJarvisRuntime(jarvis).run())
             
     except KeyboardInterrupt:
         print("\n\n👋 JARVIS kapatılıyor...")
-        jarvis.speak("Görüşürüz efendim!")
+        if jarvis is not None:
+            jarvis.speech.interrupt()
+            jarvis.speak("Görüşürüz efendim!", priority=SpeechOutputQueue.HIGH)
     except Exception as e:
         print(f"\n❌ Hata: {e}")
         print("🔄 Program yeniden başlatılabilir...")
     finally:
+        if jarvis is not None:
+            # Kuyrukta kalan son sözleri söyle
+            jarvis.shutdown()
         print("✅ Program sonlandırıldı.")
 
 if __name__ == "__main__":
-    main()
\ No newline at end of file
+    sys.exit(main())
\ No newline at end of file